@@ -0,0 +1,4 @@
+"""pytest setup: the tests import `pysnoopy` from this directory without opening a display."""
+import os
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
@@ -0,0 +1,69 @@
+"""Gameplay sound effects, played from the `EventBus` batch of each step."""
+from typing import Any, Sequence
+
+import arcade
+
+from .events import (
+    DEATH_OUT_OF_WORLD,
+    EVENT_DEATH,
+    EVENT_JUMP,
+    EVENT_LEVEL_START,
+    EVENT_MUSIC_RESTART,
+    EVENT_REWIND_START,
+    EVENT_WALK_START,
+    EVENT_WALK_STOP,
+    GameEvent,
+)
+from .game_state import GameState
+
+
+class GameplaySounds:
+    """Jump, fall and footstep sounds of `GameView`, plus music restarts."""
+
+    EVENTS = (
+        EVENT_JUMP,
+        EVENT_WALK_START,
+        EVENT_WALK_STOP,
+        EVENT_DEATH,
+        EVENT_LEVEL_START,
+        EVENT_REWIND_START,
+        EVENT_MUSIC_RESTART,
+    )
+
+    def __init__(self, game_state: GameState):
+        self.game_state = game_state
+        self.jump_sound = arcade.load_sound("../assets/sound/jump.wav", streaming=False)
+        self.fall_sound = arcade.load_sound("../assets/sound/fall.wav", streaming=False)
+        self.step_sound = arcade.load_sound("../assets/sound/steps.wav", streaming=False)
+        self.fall_sound_player: Any | None = None
+        self.step_sound_player: Any | None = None
+
+    def handle(self, events: Sequence[GameEvent]) -> None:
+        for event in events:
+            kind = event.kind
+            if kind == EVENT_WALK_START:
+                if not self.step_sound_player or not self.step_sound.is_playing(player=self.step_sound_player):
+                    self.step_sound_player = self.step_sound.play(loop=True)
+            elif kind == EVENT_WALK_STOP:
+                self._stop_step_sound()
+            elif kind == EVENT_JUMP:
+                arcade.play_sound(self.jump_sound)
+            elif kind == EVENT_DEATH:
+                if event.detail != DEATH_OUT_OF_WORLD:
+                    self.fall_sound_player = arcade.play_sound(self.fall_sound, loop=False)
+            elif kind in (EVENT_LEVEL_START, EVENT_REWIND_START):
+                self.stop()
+            elif kind == EVENT_MUSIC_RESTART:
+                self.game_state.restart_music()
+
+    def stop(self) -> None:
+        """Stop the level sounds (not the music)."""
+        if self.fall_sound_player and self.fall_sound.is_playing(player=self.fall_sound_player):
+            self.fall_sound.stop(player=self.fall_sound_player)
+        self._stop_step_sound()
+        self.fall_sound_player = None
+        self.step_sound_player = None
+
+    def _stop_step_sound(self) -> None:
+        if self.step_sound_player and self.step_sound.is_playing(player=self.step_sound_player):
+            self.step_sound.stop(player=self.step_sound_player)
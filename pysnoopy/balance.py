@@ -0,0 +1,256 @@
+"""Monte Carlo difficulty estimate per level and speed round.
+
+    python -m pysnoopy.balance --attempts 2000 --rounds 4
+    python -m pysnoopy.balance --levels 8 --json level8.json
+
+For every level and speed round (``--speed`` 0, 1, ... as produced by
+`GameState.advance_round`) a worker first searches one clearing route
+(`pysnoopy/bot.py`). Thousands of attempts then replay that route the way a
+player who knows the level would: every key press and release lands off its
+planned step by a human timing error (`HumanTiming`). The share of attempts
+that still reach the exit is the clear probability; listed by round, it is the
+difficulty curve of the level.
+
+Routes are searched with the current hook tuning, so tuning a value such as
+``Level8Hook._JUMP_START_GRACE_SECONDS`` and running the tool again measures
+the effect. Attempts are spread over a process pool; every attempt draws its
+timing errors from its own seed, so results do not depend on the pool size.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .globals import SIMULATION_STEP_SECONDS
+from .rng import derive_seed
+
+DEFAULT_ATTEMPTS = 1000
+DEFAULT_ROUNDS = 3
+ATTEMPTS_PER_TASK = 50
+WILSON_Z = 1.96  # 95% confidence interval
+
+
+@dataclass(frozen=True)
+class HumanTiming:
+    """Timing error of one input event, in seconds.
+
+    The error is ex-Gaussian, the usual shape of human reaction times: a
+    normal spread plus an exponential tail of late reactions. The tail mean is
+    subtracted again, since a player who knows the level anticipates cues
+    rather than reacting to them, so errors are early as often as late.
+    """
+
+    timing_sd_seconds: float = 0.035
+    late_reaction_seconds: float = 0.030
+
+    def __post_init__(self):
+        if self.timing_sd_seconds < 0 or self.late_reaction_seconds < 0:
+            raise ValueError("timing errors must not be negative")
+
+    def error_steps(self, rng: random.Random) -> int:
+        error = rng.gauss(0.0, self.timing_sd_seconds)
+        if self.late_reaction_seconds > 0:
+            error += rng.expovariate(1.0 / self.late_reaction_seconds) - self.late_reaction_seconds
+        return round(error / SIMULATION_STEP_SECONDS)
+
+
+def perturb_events(
+    events: list[tuple[int, str, bool]],
+    timing: HumanTiming,
+    rng: random.Random,
+) -> list[tuple[int, str, bool]]:
+    """Shift every event by a timing error; events of one key keep their order."""
+    last_step: dict[str, int] = {}
+    perturbed = []
+    for step, action, pressed in events:
+        shifted = max(0, step + timing.error_steps(rng), last_step.get(action, -1) + 1)
+        last_step[action] = shifted
+        perturbed.append((shifted, action, pressed))
+    perturbed.sort(key=lambda event: event[0])
+    return perturbed
+
+
+def wilson_interval(successes: int, trials: int, z: float = WILSON_Z) -> tuple[float, float]:
+    if trials == 0:
+        return 0.0, 1.0
+    rate = successes / trials
+    denominator = 1 + z * z / trials
+    center = (rate + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(rate * (1 - rate) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+@dataclass
+class RoundEstimate:
+    round: int
+    run_speed_multiplier: float
+    route_steps: int | None = None
+    attempts: int = 0
+    clears: int = 0
+
+    @property
+    def clear_rate(self) -> float | None:
+        return self.clears / self.attempts if self.attempts else None
+
+
+def route_task(level_number: int, speed_rounds: int, node_budget: int | None = None):
+    """Speed multiplier of the round, a clearing route and the step it reaches the exit at (pool worker)."""
+    from .bot import ROUTE_NODE_BUDGET, find_route, play_attempt, shared_level
+
+    if node_budget is None:
+        node_budget = ROUTE_NODE_BUDGET
+    view, start_record = shared_level(level_number, speed_rounds)
+    route = find_route(view, start_record, node_budget=node_budget)
+    if route is None:
+        return view.game_state.run_speed_multiplier, None, None
+    return view.game_state.run_speed_multiplier, route, play_attempt(view, start_record, route).steps
+
+
+def _attempts_task(
+    level_number: int,
+    speed_rounds: int,
+    route: list[tuple[int, str, bool]],
+    route_steps: int,
+    timing: HumanTiming,
+    seed: int,
+    first_attempt: int,
+    count: int,
+) -> int:
+    from .bot import ATTEMPT_CLEARED, play_attempt, shared_level
+
+    view, start_record = shared_level(level_number, speed_rounds)
+    max_steps = 2 * route_steps + 600
+    clears = 0
+    for attempt in range(first_attempt, first_attempt + count):
+        rng = random.Random(derive_seed(seed, f"balance:{level_number}:{speed_rounds}:{attempt}"))
+        result = play_attempt(view, start_record, perturb_events(route, timing, rng), max_steps)
+        clears += result.outcome == ATTEMPT_CLEARED
+    return clears
+
+
+def estimate(
+    level_numbers: list[int],
+    rounds: int,
+    attempts: int,
+    timing: HumanTiming,
+    seed: int = 0,
+    workers: int | None = None,
+    node_budget: int | None = None,
+) -> dict[int, list[RoundEstimate]]:
+    """Clear estimates for every level in ``level_numbers`` and speed rounds ``0 .. rounds - 1``."""
+    jobs = [(level_number, speed_rounds) for level_number in level_numbers for speed_rounds in range(rounds)]
+    results: dict[int, list[RoundEstimate]] = {level_number: [] for level_number in level_numbers}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        route_futures = {job: pool.submit(route_task, *job, node_budget) for job in jobs}
+        attempt_futures: list[tuple[RoundEstimate, int, Future]] = []
+        for (level_number, speed_rounds), route_future in route_futures.items():
+            run_speed_multiplier, route, route_steps = route_future.result()
+            round_estimate = RoundEstimate(speed_rounds, run_speed_multiplier, route_steps)
+            results[level_number].append(round_estimate)
+            if route is None:
+                continue
+            for first_attempt in range(0, attempts, ATTEMPTS_PER_TASK):
+                count = min(ATTEMPTS_PER_TASK, attempts - first_attempt)
+                task = (level_number, speed_rounds, route, route_steps, timing, seed, first_attempt, count)
+                future = pool.submit(_attempts_task, *task)
+                attempt_futures.append((round_estimate, count, future))
+        for round_estimate, count, future in attempt_futures:
+            round_estimate.clears += future.result()
+            round_estimate.attempts += count
+    return results
+
+
+def _format_report(level_names: dict[int, str], results: dict[int, list[RoundEstimate]]) -> str:
+    lines = []
+    for level_number, estimates in results.items():
+        lines.append(f"{level_names[level_number]}")
+        lines.append(f"  {'round':>5}  {'speed':>6}  {'clear':>7}  {'95% interval':>15}  {'attempts':>8}  {'route':>6}")
+        for estimate in estimates:
+            speed = f"x{estimate.run_speed_multiplier:<5.2f}"
+            if estimate.route_steps is None:
+                lines.append(f"  {estimate.round:>5}  {speed}  no route found within the search budget")
+                continue
+            low, high = wilson_interval(estimate.clears, estimate.attempts)
+            lines.append(
+                f"  {estimate.round:>5}  {speed}  {estimate.clear_rate:>7.1%}  "
+                f"{low:>6.1%} - {high:<6.1%}  {estimate.attempts:>8}  {estimate.route_steps:>6}"
+            )
+    return "\n".join(lines)
+
+
+def _report_json(level_names: dict[int, str], results: dict[int, list[RoundEstimate]], timing: HumanTiming):
+    levels = []
+    for level_number, estimates in results.items():
+        rounds = []
+        for estimate in estimates:
+            low, high = wilson_interval(estimate.clears, estimate.attempts)
+            rounds.append({**asdict(estimate), "clear_rate": estimate.clear_rate, "interval": [low, high]})
+        levels.append({"level": level_number, "name": level_names[level_number], "rounds": rounds})
+    return {"timing": asdict(timing), "levels": levels}
+
+
+def _parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Estimate pySNOOPY clear probability per level and speed round")
+    parser.add_argument("--levels", type=str, default=None, help="Comma-separated level numbers (default: all).")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Estimate speed rounds 0 .. N-1.")
+    parser.add_argument("--attempts", type=int, default=DEFAULT_ATTEMPTS, help="Attempts per level and round.")
+    parser.add_argument("--timing-sd-ms", type=float, default=HumanTiming.timing_sd_seconds * 1000,
+                        help="Standard deviation of the timing error of every key press and release.")
+    parser.add_argument("--late-reaction-ms", type=float, default=HumanTiming.late_reaction_seconds * 1000,
+                        help="Mean of the tail of late reactions.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the timing errors.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--search-budget", type=int, default=None, help="Route search nodes per level and round.")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the report as JSON.")
+    args = parser.parse_args(argv)
+    if args.rounds < 1 or args.attempts < 1:
+        parser.error("--rounds and --attempts must be at least 1")
+    try:
+        args.timing = HumanTiming(args.timing_sd_ms / 1000, args.late_reaction_ms / 1000)
+    except ValueError as error:
+        parser.error(str(error))
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+    from .levels import get_default_levels
+
+    level_names = {number: spec.name for number, spec in enumerate(get_default_levels(), start=1)}
+    if args.levels is None:
+        level_numbers = list(level_names)
+    else:
+        try:
+            level_numbers = [int(part) for part in args.levels.split(",")]
+        except ValueError:
+            print(f"--levels expects comma-separated level numbers, got {args.levels!r}", file=sys.stderr)
+            return 2
+        unknown = [number for number in level_numbers if number not in level_names]
+        if unknown:
+            print(f"unknown level number(s): {unknown}", file=sys.stderr)
+            return 2
+    results = estimate(
+        level_numbers,
+        args.rounds,
+        args.attempts,
+        args.timing,
+        seed=args.seed,
+        workers=args.workers,
+        node_budget=args.search_budget,
+    )
+    print(_format_report(level_names, results))
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as file_handle:
+            json.dump(_report_json(level_names, results, args.timing), file_handle, indent=2)
+            file_handle.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
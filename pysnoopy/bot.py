@@ -0,0 +1,229 @@
+"""Headless attempts at one level, for tools that play the game themselves.
+
+`open_level` builds an `AttemptView` for a level and speed round
+(`shared_level` keeps one per process). An attempt restores the level start
+record, feeds step-aligned input events (the same ``(step, action, pressed)``
+events a replay stores) through `GameView.pending_inputs` and stops at the
+first death or at the exit, so no level is ever reloaded between attempts.
+
+`find_route` searches for one input sequence that clears the level:
+best-first on horizontal progress, choosing the held keys every
+`ROUTE_DECISION_STEPS` steps and branching from captured state records.
+
+The caller must set ``ARCADE_HEADLESS`` before arcade is first imported.
+"""
+import heapq
+import itertools
+import os
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import arcade
+
+from .game_state import GameState
+from .globals import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH, SIMULATION_STEP_SECONDS
+from .replay import ACTION_JUMP, ACTION_LEFT, ACTION_RIGHT
+from .snapshots import new_state_record
+from .views import GameView
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+ROUTE_DECISION_STEPS = 4
+ROUTE_MAX_STEPS = 3600
+ROUTE_NODE_BUDGET = 20000
+# Held keys the route search chooses from, in the order they are tried: (left, right, jump).
+ROUTE_CHOICES = (
+    (False, True, False),
+    (False, True, True),
+    (False, False, False),
+    (False, False, True),
+    (True, False, False),
+)
+HELD_KEY_ACTIONS = (ACTION_LEFT, ACTION_RIGHT, ACTION_JUMP)
+NO_KEYS_HELD = (False, False, False)
+# States closer than this (px) on the same route-search time bucket count as visited.
+_ROUTE_CELL_PX = 4.0
+_ROUTE_TIME_BUCKET_STEPS = 4 * ROUTE_DECISION_STEPS
+
+ATTEMPT_CLEARED = "cleared"
+ATTEMPT_DIED = "died"
+ATTEMPT_TIMED_OUT = "timed_out"
+
+_window: arcade.Window | None = None
+_shared_levels: dict[tuple[int, int], tuple["AttemptView", array]] = {}
+
+
+class AttemptView(GameView):
+    """`GameView` that ends the attempt instead of restarting or loading the next level."""
+
+    def __init__(self, start_level: int = 1, game_state: GameState | None = None):
+        super().__init__(start_level=start_level, game_state=game_state)
+        self.outcome: str | None = None
+
+    def _subscribe_event_handlers(self) -> None:
+        """Attempts are silent and print nothing; tools subscribe to `events` themselves."""
+        pass
+
+    def _enter_death_state(self, cause: str):
+        self.outcome = ATTEMPT_DIED
+
+    def _restart_level(self) -> None:
+        self.outcome = ATTEMPT_DIED
+
+    def _advance_level(self):
+        self.outcome = ATTEMPT_CLEARED
+
+
+@dataclass(slots=True)
+class AttemptResult:
+    outcome: str
+    steps: int
+    center_x: float
+    center_y: float
+
+
+def open_level(level_number: int, speed_rounds: int = 0, seed: int = 0) -> tuple[AttemptView, array]:
+    """Set up ``level_number`` after ``speed_rounds`` round advances; return the view and its start record."""
+    global _window
+    if _window is None:
+        # Assets are loaded relative to the package directory, as by pysnoopy.main.
+        os.chdir(PACKAGE_DIR)
+        _window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    game_state = GameState(start_level=level_number, starting_speed_rounds=speed_rounds, seed=seed)
+    view = AttemptView(start_level=level_number, game_state=game_state)
+    _window.show_view(view)
+    view.setup()
+    start_record = new_state_record()
+    view.capture_simulation_state(start_record)
+    return view, start_record
+
+
+def shared_level(level_number: int, speed_rounds: int = 0) -> tuple[AttemptView, array]:
+    """`open_level` once per level and round in this process; pool workers reuse the view."""
+    key = (level_number, speed_rounds)
+    if key not in _shared_levels:
+        _shared_levels[key] = open_level(level_number, speed_rounds)
+    return _shared_levels[key]
+
+
+def _step(view: AttemptView, events: list[tuple[str, bool]]) -> None:
+    view.pending_inputs.extend(events)
+    view.simulation_step(SIMULATION_STEP_SECONDS)
+
+
+def start_attempt(view: AttemptView, start_record: array) -> None:
+    """Put the level back to ``start_record`` with no keys held; steps count from 0 again."""
+    view.restore_simulation_state(start_record)
+    view.pending_inputs.clear()
+    view.outcome = None
+    view.simulation_step_index = 0
+
+
+def run_attempt(
+    view: AttemptView,
+    next_events: Callable[[int], list[tuple[str, bool]]],
+    max_steps: int = ROUTE_MAX_STEPS,
+    observer: Callable[[AttemptView, int], bool] | None = None,
+) -> AttemptResult:
+    """Step a started attempt, asking ``next_events(step)`` for the input of every step.
+
+    ``observer(view, step)`` runs after every step; returning True ends the attempt.
+    """
+    step = 0
+    while step < max_steps and view.outcome is None:
+        _step(view, next_events(step))
+        step += 1
+        if observer is not None and observer(view, step - 1):
+            break
+    player = view.player_sprite
+    return AttemptResult(view.outcome or ATTEMPT_TIMED_OUT, step, player.center_x, player.center_y)
+
+
+def play_attempt(
+    view: AttemptView,
+    start_record: array,
+    events: list[tuple[int, str, bool]],
+    max_steps: int = ROUTE_MAX_STEPS,
+    observer: Callable[[AttemptView, int], bool] | None = None,
+) -> AttemptResult:
+    """Play ``events`` (sorted by step) from the level start until the player dies or clears."""
+    event_index = 0
+
+    def next_events(step: int) -> list[tuple[str, bool]]:
+        nonlocal event_index
+        step_events = []
+        while event_index < len(events) and events[event_index][0] <= step:
+            _, action, pressed = events[event_index]
+            step_events.append((action, pressed))
+            event_index += 1
+        return step_events
+
+    start_attempt(view, start_record)
+    return run_attempt(view, next_events, max_steps, observer)
+
+
+def held_key_events(held: tuple[bool, ...], choice: tuple[bool, ...]) -> list[tuple[str, bool]]:
+    """Press and release events that turn the ``held`` keys into ``choice`` (both ordered as `HELD_KEY_ACTIONS`)."""
+    return [(action, pressed) for action, was, pressed in zip(HELD_KEY_ACTIONS, held, choice) if was != pressed]
+
+
+def _route_events(choices: tuple[tuple[bool, ...], ...]) -> list[tuple[int, str, bool]]:
+    events = []
+    held = NO_KEYS_HELD
+    for index, choice in enumerate(choices):
+        step = index * ROUTE_DECISION_STEPS
+        events.extend((step, action, pressed) for action, pressed in held_key_events(held, choice))
+        held = choice
+    return events
+
+
+def find_route(
+    view: AttemptView,
+    start_record: array,
+    node_budget: int = ROUTE_NODE_BUDGET,
+    max_steps: int = ROUTE_MAX_STEPS,
+) -> list[tuple[int, str, bool]] | None:
+    """Input events of one clear of the level, or None when the search budget runs out.
+
+    Every node tries each of `ROUTE_CHOICES` for `ROUTE_DECISION_STEPS`
+    steps. The node that got furthest right is expanded first; positions
+    already reached at about the same time are not expanded again.
+    """
+    order = itertools.count()
+    frontier: list[tuple[int, int, int, array, tuple[tuple[bool, ...], ...]]] = [(0, 0, next(order), start_record, ())]
+    visited: set[tuple[int, ...]] = set()
+    nodes = 0
+    while frontier and nodes < node_budget:
+        _, step, _, record, choices = heapq.heappop(frontier)
+        held = choices[-1] if choices else NO_KEYS_HELD
+        for choice in ROUTE_CHOICES:
+            nodes += 1
+            view.restore_simulation_state(record)
+            view.pending_inputs.clear()
+            view.outcome = None
+            _step(view, held_key_events(held, choice))
+            for _ in range(ROUTE_DECISION_STEPS - 1):
+                if view.outcome is not None:
+                    break
+                _step(view, [])
+            if view.outcome == ATTEMPT_CLEARED:
+                return _route_events(choices + (choice,))
+            next_step = step + ROUTE_DECISION_STEPS
+            if view.outcome is not None or next_step >= max_steps:
+                continue
+            player = view.player_sprite
+            cell = (
+                round(player.center_x / _ROUTE_CELL_PX),
+                round(player.center_y / _ROUTE_CELL_PX),
+                round(player.change_y),
+                next_step // _ROUTE_TIME_BUCKET_STEPS,
+            )
+            if cell in visited:
+                continue
+            visited.add(cell)
+            child_record = new_state_record()
+            view.capture_simulation_state(child_record)
+            progress = -round(player.center_x / (2 * _ROUTE_CELL_PX))
+            heapq.heappush(frontier, (progress, next_step, next(order), child_record, choices + (choice,)))
+    return None
@@ -0,0 +1,131 @@
+"""Speed-aware physics sub-stepping and in-between-step hazard checks.
+
+Round wraps scale every per-frame velocity by the run speed multiplier (and
+gravity by its square), so at high rounds the player and hazards cover many
+pixels per frame and can pass through thin obstacles or hit boxes between two
+frames. Instead of lowering the frame rate for everyone, the physics step is
+split into ``physics_substeps(multiplier)`` sub-steps only when the multiplier
+exceeds 1; at normal speed the simulation is unchanged.
+"""
+import math
+from typing import Callable, Sequence
+
+import arcade
+from arcade.geometry import are_polygons_intersecting
+
+from .globals import MAX_PHYSICS_SUBSTEPS
+from .physics import GridPhysicsEngine
+
+
+def physics_substeps(speed_multiplier: float) -> int:
+    """Sub-steps per frame that keep per-step motion at or below the base speed."""
+    # Tolerate float noise so a multiplier of exactly 1.0 never splits the step.
+    return max(1, min(MAX_PHYSICS_SUBSTEPS, math.ceil(speed_multiplier - 1e-9)))
+
+
+def update_physics_substeps(
+    physics_engine: GridPhysicsEngine,
+    substeps: int,
+    path: list[tuple[float, float]],
+    stop_after: Callable[[], bool] | None = None,
+) -> bool:
+    """Run one frame of ``physics_engine`` as ``substeps`` smaller steps.
+
+    Gravity is applied once for the whole frame, as a single step would, and
+    the resulting player and moving platform velocities are divided by
+    ``substeps`` with gravity off for the sub-steps. That keeps both the
+    per-frame displacement and the per-frame velocity change of a single step,
+    so jump arcs are the same at every sub-step count. The player center after each
+    sub-step is appended to ``path``. When ``stop_after`` returns True after an
+    intermediate sub-step (for example an obstacle touch), the remaining
+    sub-steps are skipped and True is returned; the state after the last
+    sub-step is left to the regular end-of-frame checks.
+    """
+    player_sprite = physics_engine.player_sprite
+    platforms = physics_engine.platforms
+    gravity_constant = physics_engine.gravity_constant
+    scale = 1.0 / substeps
+
+    player_sprite.change_y -= gravity_constant
+    _scale_velocities(player_sprite, platforms, scale)
+    physics_engine.gravity_constant = 0.0
+    stopped = False
+    try:
+        for step_index in range(substeps):
+            physics_engine.update()
+            path.append((player_sprite.center_x, player_sprite.center_y))
+            if stop_after is not None and step_index < substeps - 1 and stop_after():
+                stopped = True
+                break
+    finally:
+        physics_engine.gravity_constant = gravity_constant
+        _scale_velocities(player_sprite, platforms, float(substeps))
+    return stopped
+
+
+def collides_between_substeps(
+    player_sprite: arcade.Sprite,
+    player_path: Sequence[tuple[float, float]],
+    hazard: arcade.Sprite,
+) -> bool:
+    """Check ``hazard`` against the player at every intermediate sub-step.
+
+    ``player_path`` holds the player centers after each sub-step; the last entry
+    is the current position, which the regular end-of-frame check covers. The
+    hazard is moved back along its own velocity rather than interpolated between
+    positions, so hazards that wrapped around the level never sweep across it.
+    """
+    substeps = len(player_path)
+    if substeps < 2 or not _swept_bounds_overlap(player_sprite, player_path, hazard):
+        return False
+
+    player_points = player_sprite.hit_box.get_adjusted_points()
+    hazard_points = hazard.hit_box.get_adjusted_points()
+    for step_index in range(1, substeps):
+        path_x, path_y = player_path[step_index - 1]
+        rewind = (substeps - step_index) / substeps
+        # Offset of the player relative to the hazard at this sub-step.
+        offset_x = path_x - player_sprite.center_x + (hazard.change_x * rewind)
+        offset_y = path_y - player_sprite.center_y + (hazard.change_y * rewind)
+        shifted_points = [(x + offset_x, y + offset_y) for x, y in player_points]
+        if are_polygons_intersecting(shifted_points, hazard_points):
+            return True
+    return False
+
+
+def _swept_bounds_overlap(
+    player_sprite: arcade.Sprite,
+    player_path: Sequence[tuple[float, float]],
+    hazard: arcade.Sprite,
+) -> bool:
+    """Cheap rejection: do the AABBs swept over the whole frame overlap at all?"""
+    path_xs = [point[0] for point in player_path]
+    path_ys = [point[1] for point in player_path]
+    player_left = player_sprite.left + min(path_xs) - player_sprite.center_x
+    player_right = player_sprite.right + max(path_xs) - player_sprite.center_x
+    player_bottom = player_sprite.bottom + min(path_ys) - player_sprite.center_y
+    player_top = player_sprite.top + max(path_ys) - player_sprite.center_y
+
+    hazard_left = hazard.left - max(0.0, hazard.change_x)
+    hazard_right = hazard.right - min(0.0, hazard.change_x)
+    hazard_bottom = hazard.bottom - max(0.0, hazard.change_y)
+    hazard_top = hazard.top - min(0.0, hazard.change_y)
+    return (
+        player_right >= hazard_left
+        and player_left <= hazard_right
+        and player_top >= hazard_bottom
+        and player_bottom <= hazard_top
+    )
+
+
+def _scale_velocities(
+    player_sprite: arcade.Sprite,
+    platforms: Sequence[arcade.SpriteList],
+    scale: float,
+) -> None:
+    player_sprite.change_x *= scale
+    player_sprite.change_y *= scale
+    for platform_list in platforms:
+        for platform in platform_list:
+            platform.change_x *= scale
+            platform.change_y *= scale
@@ -0,0 +1,121 @@
+"""Gameplay event bus: jumps, landings, deaths, level and round changes.
+
+`GameView` emits an event at the point in a simulation step where something
+happens; `EventBus.flush` hands the events of the step to each subscriber as
+one batch, in the order they happened, when the step ends. Sounds
+(`pysnoopy/audio.py`), console telemetry and replay markers are subscribers.
+The simulation never reads events back, so subscribing cannot change a replay.
+
+Emitting an event kind nobody subscribed to costs one set lookup.
+"""
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+EVENT_JUMP = "jump"
+EVENT_LAND = "land"
+EVENT_WALK_START = "walk_start"
+EVENT_WALK_STOP = "walk_stop"
+EVENT_DEATH = "death"  # detail: one of DEATH_CAUSES; x, y: player center
+EVENT_LEVEL_START = "level_start"  # detail: level name; also sent by death restarts and state loads
+EVENT_LEVEL_CLEAR = "level_clear"  # detail: level name
+EVENT_ROUND_WRAP = "round_wrap"  # detail: new run speed multiplier
+EVENT_MUSIC_RESTART = "music_restart"  # detail: music speed multiplier
+EVENT_REWIND_START = "rewind_start"
+EVENT_STATE_SAVED = "state_saved"  # detail: level name
+EVENT_STATE_LOADED = "state_loaded"  # detail: level name
+EVENT_CHECKPOINT = "checkpoint"  # detail: level name; death restarts continue from here
+GAME_EVENTS = (
+    EVENT_JUMP,
+    EVENT_LAND,
+    EVENT_WALK_START,
+    EVENT_WALK_STOP,
+    EVENT_DEATH,
+    EVENT_LEVEL_START,
+    EVENT_LEVEL_CLEAR,
+    EVENT_ROUND_WRAP,
+    EVENT_MUSIC_RESTART,
+    EVENT_REWIND_START,
+    EVENT_STATE_SAVED,
+    EVENT_STATE_LOADED,
+    EVENT_CHECKPOINT,
+)
+
+DEATH_OBSTACLE = "obstacle"  # an ``obstacles`` tile
+DEATH_MOVING_HAZARD = "moving_hazard"
+DEATH_SKULL_HAZARD = "skull_hazard"
+DEATH_LASER_HAZARD = "laser_hazard"  # beam or emitter
+DEATH_LANDING_SUPPORT = "landing_support"  # less ground than `LevelHook.min_ground_overlap_tiles`
+DEATH_PLATFORM_SUPPORT = "platform_support"  # less of a scrolling platform than its ``min_support``
+DEATH_KILL_ZONE = "kill_zone"  # a ``kill`` trigger volume
+DEATH_OUT_OF_WORLD = "out_of_world"  # fell below the level; restarts without the death animation
+DEATH_CAUSES = (
+    DEATH_OBSTACLE,
+    DEATH_MOVING_HAZARD,
+    DEATH_SKULL_HAZARD,
+    DEATH_LASER_HAZARD,
+    DEATH_LANDING_SUPPORT,
+    DEATH_PLATFORM_SUPPORT,
+    DEATH_KILL_ZONE,
+    DEATH_OUT_OF_WORLD,
+)
+
+# Console lines of `print_event_log`, in the ``NAME=value`` form of the other debug output.
+_EVENT_LOG_NAMES = {
+    EVENT_STATE_SAVED: "SAVE_STATE",
+    EVENT_STATE_LOADED: "LOAD_STATE",
+}
+EVENT_LOG_EVENTS = tuple(_EVENT_LOG_NAMES)
+
+
+@dataclass(frozen=True, slots=True)
+class GameEvent:
+    step: int  # GameView.simulation_step_index of the step it happened in
+    kind: str
+    detail: str = ""
+    x: float = 0.0  # player center, for deaths
+    y: float = 0.0
+
+
+EventHandler = Callable[[Sequence[GameEvent]], None]
+
+
+class EventBus:
+    """Collects the events of one simulation step and dispatches them in a batch."""
+
+    def __init__(self):
+        self._subscribers: list[tuple[frozenset[str], EventHandler]] = []
+        self._wanted: frozenset[str] = frozenset()
+        self._pending: list[GameEvent] = []
+
+    def subscribe(self, kinds: Iterable[str], handler: EventHandler) -> None:
+        """Call ``handler`` with the events of ``kinds`` of every step that has any."""
+        kind_set = frozenset(kinds)
+        unknown = kind_set.difference(GAME_EVENTS)
+        if unknown:
+            raise ValueError(f"unknown event kinds: {sorted(unknown)}")
+        self._subscribers.append((kind_set, handler))
+        self._wanted = self._wanted | kind_set
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        self._subscribers = [entry for entry in self._subscribers if entry[1] != handler]
+        self._wanted = frozenset().union(*(kinds for kinds, _ in self._subscribers))
+
+    def emit(self, step: int, kind: str, detail: str = "", x: float = 0.0, y: float = 0.0) -> None:
+        if kind in self._wanted:
+            self._pending.append(GameEvent(step, kind, detail, x, y))
+
+    def flush(self) -> None:
+        """Dispatch the pending events; called once at the end of every simulation step."""
+        if not self._pending:
+            return
+        batch = self._pending
+        self._pending = []
+        for kinds, handler in self._subscribers:
+            events = [event for event in batch if event.kind in kinds]
+            if events:
+                handler(events)
+
+
+def print_event_log(events: Sequence[GameEvent]) -> None:
+    for event in events:
+        print(f"{_EVENT_LOG_NAMES[event.kind]}={event.detail}")
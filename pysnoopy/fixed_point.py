@@ -0,0 +1,37 @@
+"""Fixed-point simulation mode: motion in integer sub-pixel units.
+
+With ``--fixed-point`` every speed, gravity and multiplier is quantized to
+``1 / FIXED_POINT_SUBPIXELS`` px before the simulation uses it, and the player
+and hazard positions and velocities are snapped to the same grid after every
+simulation step. Values on that grid are integers scaled by a power of two, so
+the float additions done by the physics engine and the hazard timelines are
+exact: the run is integer arithmetic stored in floats, bit-exact across
+machines and Python versions, and a state record converts to integer
+sub-pixel units (`to_units`) without loss. Laser timers are time, not motion,
+and stay in seconds.
+"""
+import arcade
+
+from .globals import FIXED_POINT_SUBPIXELS
+
+
+def to_units(value: float) -> int:
+    """Nearest whole number of sub-pixel units."""
+    return round(value * FIXED_POINT_SUBPIXELS)
+
+
+def from_units(units: int) -> float:
+    return units / FIXED_POINT_SUBPIXELS
+
+
+def quantize(value: float) -> float:
+    """``value`` rounded to the sub-pixel grid."""
+    return from_units(to_units(value))
+
+
+def quantize_motion(sprite: arcade.Sprite) -> None:
+    """Snap the position and velocity of ``sprite`` to the sub-pixel grid."""
+    center_x, center_y = sprite.position
+    sprite.position = (quantize(center_x), quantize(center_y))
+    sprite.change_x = quantize(sprite.change_x)
+    sprite.change_y = quantize(sprite.change_y)
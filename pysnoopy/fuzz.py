@@ -0,0 +1,663 @@
+"""Physics fuzzer: random and adversarial input against every level and speed round.
+
+    python -m pysnoopy.fuzz --episodes 200 --rounds 3
+    python -m pysnoopy.fuzz --check fuzz-failures/level-08_round-1_unsupported_landing.replay.json
+
+Every episode plays one attempt of a level (`pysnoopy/bot.py`) with inputs
+from one of the `STRATEGIES` and checks the state after every simulation
+step for physics anomalies:
+
+- ``inside_ground``: the player hit box sinks into a ``ground`` tile.
+- ``obstacle_tunneling``: the player path of a step crossed an ``obstacles``
+  tile and the player is still alive.
+- ``stuck_on_platform``: the player holds left or right on a moving platform
+  (the Level 7 elevator, the Level 3/6 scrolling plates) but has not moved for
+  `STUCK_STEPS` steps, with no wall or level edge in the way.
+- ``unsupported_landing``: the player landed and survived with less ground
+  under the hit box than the hook's ``min_ground_overlap_tiles``.
+
+The first anomaly of each kind is shrunk to a minimal event list (delta
+debugging over the input events) and written as a replay; ``--check`` plays
+such a replay again and reports whether the anomaly still happens. Episodes
+are spread over a process pool and seeded per episode, so findings do not
+depend on the pool size.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from .balance import HumanTiming, perturb_events, route_task
+from .globals import TILE_SCALING
+from .rng import derive_seed
+
+if TYPE_CHECKING:
+    from array import array
+
+    from .bot import AttemptView
+
+DEFAULT_EPISODES = 40
+DEFAULT_ROUNDS = 3
+DEFAULT_EPISODE_STEPS = 1800
+DEFAULT_OUTPUT_DIR = Path("fuzz-failures")
+EPISODES_PER_TASK = 10
+# Overlap (px) on both axes before the player counts as inside a tile, not touching it.
+PENETRATION_TOLERANCE_PX = 2.0
+# Distance at which the game's obstacle check counts a touch (`GameView._collides_or_touches_obstacles`).
+OBSTACLE_TOUCH_MARGIN_PX = 1.0
+STUCK_STEPS = 120
+STUCK_DISTANCE_PX = 0.5
+SUPPORT_VERTICAL_TOLERANCE_PX = 8.0
+# Steps replayed past the original anomaly while shrinking, for anomalies that move later.
+SHRINK_SLACK_STEPS = 60
+
+ANOMALY_INSIDE_GROUND = "inside_ground"
+ANOMALY_OBSTACLE_TUNNELING = "obstacle_tunneling"
+ANOMALY_STUCK_ON_PLATFORM = "stuck_on_platform"
+ANOMALY_UNSUPPORTED_LANDING = "unsupported_landing"
+
+STRATEGY_RANDOM = "random"
+STRATEGY_MASH = "mash"
+STRATEGY_EDGE = "edge"
+STRATEGY_ROUTE = "route"
+STRATEGIES = (STRATEGY_RANDOM, STRATEGY_MASH, STRATEGY_EDGE, STRATEGY_ROUTE)
+# A sloppy player: route replays with far more timing error than `HumanTiming` defaults.
+SLOPPY_TIMING = HumanTiming(timing_sd_seconds=0.1, late_reaction_seconds=0.05)
+
+
+@dataclass(slots=True)
+class Anomaly:
+    kind: str
+    step: int
+    detail: str
+
+
+@dataclass
+class Failure:
+    level_number: int
+    speed_rounds: int
+    strategy: str
+    seed: int
+    anomaly: Anomaly
+    events: list[tuple[int, str, bool]]
+    original_event_count: int
+
+
+def _bounds_overlap(first: tuple[float, ...], second: tuple[float, ...]) -> tuple[float, float]:
+    """Overlap width and height of two ``(left, right, bottom, top)`` boxes (negative when apart)."""
+    return min(first[1], second[1]) - max(first[0], second[0]), min(first[3], second[3]) - max(first[2], second[2])
+
+
+def _sprite_bounds(sprite: Any, offset_x: float = 0.0, offset_y: float = 0.0) -> tuple[float, float, float, float]:
+    return sprite.left + offset_x, sprite.right + offset_x, sprite.bottom + offset_y, sprite.top + offset_y
+
+
+class AnomalyDetector:
+    """Checks the player after every step of an attempt; call `reset` after the level start is restored."""
+
+    def __init__(self):
+        self.previous_position = (0.0, 0.0)
+        self.previous_points: tuple[tuple[float, float], ...] = ()
+        self.was_grounded = True
+        self.still_steps = 0
+
+    def reset(self, view: "AttemptView") -> None:
+        self.previous_position = view.player_sprite.position
+        self.previous_points = tuple(view.player_sprite.hit_box.points)
+        self.was_grounded = view.physics_engine.can_jump()
+        self.still_steps = 0
+
+    def check(self, view: "AttemptView", step: int) -> Anomaly | None:
+        if view.outcome is not None:
+            return None
+        anomaly = (
+            self._inside_ground(view, step)
+            or self._obstacle_tunneling(view, step)
+            or self._unsupported_landing(view, step)
+            or self._stuck_on_platform(view, step)
+        )
+        self.previous_position = view.player_sprite.position
+        self.previous_points = tuple(view.player_sprite.hit_box.points)
+        return anomaly
+
+    def _inside_ground(self, view: "AttemptView", step: int) -> Anomaly | None:
+        from arcade.geometry import are_polygons_intersecting
+
+        player = view.player_sprite
+        player_bounds = _sprite_bounds(player)
+        for tile in view.scene["ground"]:
+            overlap_x, overlap_y = _bounds_overlap(player_bounds, _sprite_bounds(tile))
+            if overlap_x > PENETRATION_TOLERANCE_PX and overlap_y > PENETRATION_TOLERANCE_PX:
+                if are_polygons_intersecting(player.hit_box.get_adjusted_points(), tile.hit_box.get_adjusted_points()):
+                    return Anomaly(
+                        ANOMALY_INSIDE_GROUND,
+                        step,
+                        f"player at ({player.center_x:.2f}, {player.center_y:.2f}) overlaps ground tile at "
+                        f"({tile.center_x:.0f}, {tile.center_y:.0f}) by {overlap_x:.2f} x {overlap_y:.2f} px",
+                    )
+        return None
+
+    def _obstacle_tunneling(self, view: "AttemptView", step: int) -> Anomaly | None:
+        """Did the player pass through an obstacle during this step and stay alive?
+
+        The path from the last step through the physics sub-step positions is
+        sampled at 1 px intervals. A sample counts when the hit box of both the
+        previous and the current animation frame sinks into an obstacle that
+        touches the player at neither end of the step, and the game's own
+        obstacle check (which tolerates feet on spikes next to a supporting
+        ledge) would have killed the player there.
+        """
+        obstacles = view.tile_map.sprite_lists.get("obstacles")
+        player = view.player_sprite
+        end_position = player.position
+        waypoints = [self.previous_position, *view._player_substep_path, end_position]
+        if not obstacles or len(waypoints) < 2:
+            return None
+        touching_at_ends = _touching(_points_bounds(self.previous_points, *waypoints[0]), obstacles)
+        touching_at_ends |= _touching(_sprite_bounds(player), obstacles)
+        hit_boxes = (self.previous_points, tuple(player.hit_box.points))
+        try:
+            for sample_x, sample_y in _sample_path(waypoints):
+                penetrated = None
+                for index, tile in enumerate(obstacles):
+                    if index in touching_at_ends:
+                        continue
+                    tile_bounds = _sprite_bounds(tile)
+                    if all(
+                        min(_bounds_overlap(_points_bounds(points, sample_x, sample_y), tile_bounds))
+                        > PENETRATION_TOLERANCE_PX
+                        for points in hit_boxes
+                    ):
+                        penetrated = tile
+                        break
+                if penetrated is None:
+                    continue
+                player.position = (sample_x, sample_y)
+                if view._collides_or_touches_obstacles(obstacles):
+                    return Anomaly(
+                        ANOMALY_OBSTACLE_TUNNELING,
+                        step,
+                        f"player moved ({waypoints[0][0]:.2f}, {waypoints[0][1]:.2f}) -> ({end_position[0]:.2f}, "
+                        f"{end_position[1]:.2f}) through obstacle at ({penetrated.center_x:.0f}, "
+                        f"{penetrated.center_y:.0f})",
+                    )
+        finally:
+            player.position = end_position
+        return None
+
+    def _unsupported_landing(self, view: "AttemptView", step: int) -> Anomaly | None:
+        grounded = view.physics_engine.can_jump()
+        landed = grounded and not self.was_grounded
+        self.was_grounded = grounded
+        minimum_overlap_tiles = view.level.min_ground_overlap_tiles()
+        if not landed or not minimum_overlap_tiles:
+            return None
+        player = view.player_sprite
+        support, _ = view._ground_support_metrics(SUPPORT_VERTICAL_TOLERANCE_PX)
+        required = minimum_overlap_tiles * TILE_SCALING * view.tile_map.tile_width
+        if support >= required:
+            return None
+        return Anomaly(
+            ANOMALY_UNSUPPORTED_LANDING,
+            step,
+            f"landed at ({player.center_x:.2f}, {player.center_y:.2f}) with {support:.2f} px of ground support "
+            f"(needs {required:.2f})",
+        )
+
+    def _stuck_on_platform(self, view: "AttemptView", step: int) -> Anomaly | None:
+        player = view.player_sprite
+        direction = int(view.right_pressed) - int(view.left_pressed)
+        previous_x, previous_y = self.previous_position
+        moved = max(abs(player.center_x - previous_x), abs(player.center_y - previous_y))
+        if direction == 0 or moved > STUCK_DISTANCE_PX or not _on_moving_platform(view) or _blocked(view, direction):
+            self.still_steps = 0
+            return None
+        self.still_steps += 1
+        if self.still_steps < STUCK_STEPS:
+            return None
+        return Anomaly(
+            ANOMALY_STUCK_ON_PLATFORM,
+            step,
+            f"player held {'right' if direction > 0 else 'left'} for {self.still_steps} steps at "
+            f"({player.center_x:.2f}, {player.center_y:.2f}) on a moving platform without moving",
+        )
+
+
+def _points_bounds(points: Any, center_x: float, center_y: float) -> tuple[float, float, float, float]:
+    """Bounds of hit box ``points`` (relative to the sprite center) placed at ``center_x, center_y``."""
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return center_x + min(xs), center_x + max(xs), center_y + min(ys), center_y + max(ys)
+
+
+def _sample_path(waypoints: list[tuple[float, float]]):
+    """Points at most 1 px apart along ``waypoints``, excluding both ends."""
+    for index in range(1, len(waypoints)):
+        (start_x, start_y), (end_x, end_y) = waypoints[index - 1], waypoints[index]
+        samples = max(1, math.ceil(max(abs(end_x - start_x), abs(end_y - start_y))))
+        first = 0 if index > 1 else 1
+        for sample in range(first, samples):
+            yield start_x + (end_x - start_x) * sample / samples, start_y + (end_y - start_y) * sample / samples
+
+
+def _touching(bounds: tuple[float, float, float, float], tiles: Any) -> set[int]:
+    """Indices of ``tiles`` within the game's touch margin of ``bounds``."""
+    return {
+        index for index, tile in enumerate(tiles)
+        if min(_bounds_overlap(bounds, _sprite_bounds(tile))) >= -OBSTACLE_TOUCH_MARGIN_PX
+    }
+
+
+def _on_moving_platform(view: "AttemptView") -> bool:
+    platforms = view.moving_platforms
+    if not platforms:
+        return False
+    player_bounds = _sprite_bounds(view.player_sprite)
+    for platform in platforms:
+        overlap_x, _ = _bounds_overlap(player_bounds, _sprite_bounds(platform))
+        if overlap_x > 0 and abs(player_bounds[2] - platform.top) <= SUPPORT_VERTICAL_TOLERANCE_PX:
+            return True
+    return False
+
+
+def _blocked(view: "AttemptView", direction: int) -> bool:
+    """A ground tile or the level edge right next to the player in ``direction``."""
+    player = view.player_sprite
+    world_left, world_right = view.world_bounds[0], view.world_bounds[1]
+    if (direction < 0 and player.left <= world_left + 1.0) or (direction > 0 and player.right >= world_right - 1.0):
+        return True
+    probe = _sprite_bounds(player, 1.0 * direction, 0.0)
+    probe = (probe[0], probe[1], probe[2] + PENETRATION_TOLERANCE_PX, probe[3])
+    return any(min(_bounds_overlap(probe, _sprite_bounds(tile))) > 0 for tile in view.scene["ground"])
+
+
+# Input strategies: each picks the held keys (left, right, jump) for every step.
+
+
+class _RandomPolicy:
+    """Random key combinations held for random durations, biased towards running right."""
+
+    _CHOICES = (
+        (False, True, False),
+        (False, True, True),
+        (False, False, False),
+        (False, False, True),
+        (True, False, False),
+        (True, False, True),
+        (True, True, False),
+    )
+    _WEIGHTS = (5, 4, 1, 1, 2, 1, 1)
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.held = self._CHOICES[0]
+        self.until_step = 0
+
+    def choose(self, view: "AttemptView", step: int) -> tuple[bool, bool, bool]:
+        if step >= self.until_step:
+            self.held = self.rng.choices(self._CHOICES, self._WEIGHTS)[0]
+            self.until_step = step + max(1, int(self.rng.expovariate(1 / 12)))
+        return self.held
+
+
+class _MashPolicy:
+    """Run right while tapping jump every few steps, with short turns back."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.jump = False
+        self.left_until_step = -1
+
+    def choose(self, view: "AttemptView", step: int) -> tuple[bool, bool, bool]:
+        if self.rng.random() < 0.5:
+            self.jump = not self.jump
+        if self.rng.random() < 0.01:
+            self.left_until_step = step + self.rng.randint(2, 20)
+        left = step < self.left_until_step
+        return left, not left, self.jump
+
+
+class _EdgePolicy:
+    """Run right and jump at the last moments of ground support (ledges, plate and elevator edges)."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.threshold = rng.uniform(0.05, 0.9)
+        self.jump_until_step = -1
+        self.turn_until_step = -1
+
+    def choose(self, view: "AttemptView", step: int) -> tuple[bool, bool, bool]:
+        player = view.player_sprite
+        if view.physics_engine.can_jump() and step >= self.jump_until_step:
+            support = 0.0
+            for tile in view.scene["ground"]:
+                if abs(player.bottom - tile.top) <= SUPPORT_VERTICAL_TOLERANCE_PX:
+                    support += max(0.0, min(player.right, tile.right) - max(player.left, tile.left))
+            if support < self.threshold * player.width or _on_moving_platform(view):
+                if self.rng.random() < 0.5:
+                    self.jump_until_step = step + self.rng.randint(1, 12)
+                    self.threshold = self.rng.uniform(0.05, 0.9)
+                elif self.rng.random() < 0.1:
+                    self.turn_until_step = step + self.rng.randint(1, 6)
+        turn = step < self.turn_until_step
+        return turn, not turn, step < self.jump_until_step
+
+
+class _RoutePolicy:
+    """A clearing route with sloppy timing and extra jump taps, to reach the later parts of a level."""
+
+    def __init__(self, rng: random.Random, route: list[tuple[int, str, bool]]):
+        from .bot import HELD_KEY_ACTIONS
+
+        self.rng = rng
+        self.events = perturb_events(route, SLOPPY_TIMING, rng)
+        self.event_index = 0
+        self.held = dict.fromkeys(HELD_KEY_ACTIONS, False)
+        self.tap_until_step = -1
+
+    def choose(self, view: "AttemptView", step: int) -> tuple[bool, bool, bool]:
+        while self.event_index < len(self.events) and self.events[self.event_index][0] <= step:
+            _, action, pressed = self.events[self.event_index]
+            self.held[action] = pressed
+            self.event_index += 1
+        if self.rng.random() < 0.02:
+            self.tap_until_step = step + self.rng.randint(1, 4)
+        left, right, jump = self.held.values()
+        return left, right, jump or step < self.tap_until_step
+
+
+def _make_policy(strategy: str, rng: random.Random, route: list[tuple[int, str, bool]] | None):
+    if strategy == STRATEGY_RANDOM:
+        return _RandomPolicy(rng)
+    if strategy == STRATEGY_MASH:
+        return _MashPolicy(rng)
+    if strategy == STRATEGY_EDGE:
+        return _EdgePolicy(rng)
+    assert route is not None
+    return _RoutePolicy(rng, route)
+
+
+def _play_with_detector(
+    view: "AttemptView",
+    start_record: "array",
+    next_events: Callable[[int], list[tuple[str, bool]]],
+    max_steps: int,
+) -> Anomaly | None:
+    from .bot import run_attempt, start_attempt
+
+    start_attempt(view, start_record)
+    detector = AnomalyDetector()
+    detector.reset(view)
+    found: list[Anomaly] = []
+
+    def observe(observed_view: "AttemptView", step: int) -> bool:
+        anomaly = detector.check(observed_view, step)
+        if anomaly is not None:
+            found.append(anomaly)
+        return anomaly is not None
+
+    run_attempt(view, next_events, max_steps, observe)
+    return found[0] if found else None
+
+
+def replay_anomaly(
+    view: "AttemptView",
+    start_record: "array",
+    events: list[tuple[int, str, bool]],
+    max_steps: int,
+) -> Anomaly | None:
+    """First anomaly while playing ``events`` from the level start, if any."""
+    event_index = 0
+
+    def next_events(step: int) -> list[tuple[str, bool]]:
+        nonlocal event_index
+        step_events = []
+        while event_index < len(events) and events[event_index][0] <= step:
+            step_events.append(events[event_index][1:])
+            event_index += 1
+        return step_events
+
+    return _play_with_detector(view, start_record, next_events, max_steps)
+
+
+def shrink_events(
+    events: list[tuple[int, str, bool]],
+    reproduces: Callable[[list[tuple[int, str, bool]]], bool],
+) -> list[tuple[int, str, bool]]:
+    """Smallest event list found by delta debugging (ddmin) that still ``reproduces`` the failure."""
+    if reproduces([]):
+        return []
+    granularity = 2
+    while len(events) >= 2:
+        chunk = math.ceil(len(events) / granularity)
+        for start in range(0, len(events), chunk):
+            complement = events[:start] + events[start + chunk:]
+            if reproduces(complement):
+                events = complement
+                granularity = max(granularity - 1, 2)
+                break
+        else:
+            if granularity >= len(events):
+                break
+            granularity = min(len(events), granularity * 2)
+    return events
+
+
+def _fuzz_episode(view: "AttemptView", start_record: "array", policy: Any, max_steps: int):
+    from .bot import NO_KEYS_HELD, held_key_events
+
+    events: list[tuple[int, str, bool]] = []
+    held = NO_KEYS_HELD
+
+    def next_events(step: int) -> list[tuple[str, bool]]:
+        nonlocal held
+        choice = policy.choose(view, step)
+        step_events = held_key_events(held, choice)
+        held = choice
+        events.extend((step, action, pressed) for action, pressed in step_events)
+        return step_events
+
+    return _play_with_detector(view, start_record, next_events, max_steps), events
+
+
+def fuzz_task(
+    level_number: int,
+    speed_rounds: int,
+    strategy: str,
+    route: list[tuple[int, str, bool]] | None,
+    seed: int,
+    first_episode: int,
+    count: int,
+    max_steps: int,
+) -> tuple[int, list[Failure]]:
+    """Run ``count`` episodes (pool worker); return the episode count and one shrunk failure per anomaly kind."""
+    from .bot import shared_level
+
+    view, start_record = shared_level(level_number, speed_rounds)
+    failures: dict[str, Failure] = {}
+    for episode in range(first_episode, first_episode + count):
+        episode_seed = derive_seed(seed, f"fuzz:{level_number}:{speed_rounds}:{strategy}:{episode}")
+        rng = random.Random(episode_seed)
+        anomaly, events = _fuzz_episode(view, start_record, _make_policy(strategy, rng, route), max_steps)
+        if anomaly is None or anomaly.kind in failures:
+            continue
+        events = [event for event in events if event[0] <= anomaly.step]
+        kind = anomaly.kind
+        limit = anomaly.step + 1 + SHRINK_SLACK_STEPS
+
+        def reproduces(candidate: list[tuple[int, str, bool]]) -> bool:
+            found = replay_anomaly(view, start_record, candidate, limit)
+            return found is not None and found.kind == kind
+
+        shrunk = shrink_events(events, reproduces)
+        final = replay_anomaly(view, start_record, shrunk, limit)
+        assert final is not None
+        failures[kind] = Failure(level_number, speed_rounds, strategy, episode_seed, final, shrunk, len(events))
+    return count, list(failures.values())
+
+
+def write_failure_replay(failure: Failure, path: Path) -> None:
+    """Record the shrunk events as a regular replay (inputs and state hashes) with the anomaly attached."""
+    from .bot import shared_level
+    from .replay import ReplayRecorder
+
+    view, start_record = shared_level(failure.level_number, failure.speed_rounds)
+    recorder = ReplayRecorder(view.game_state.seed, failure.level_number, failure.speed_rounds)
+    view.game_state.replay_recorder = recorder
+    try:
+        replay_anomaly(view, start_record, failure.events, failure.anomaly.step + 1)
+    finally:
+        view.game_state.replay_recorder = None
+    replay = recorder.to_dict()
+    replay["anomaly"] = asdict(failure.anomaly)
+    replay["fuzz"] = {
+        "strategy": failure.strategy,
+        "seed": failure.seed,
+        "original_events": failure.original_event_count,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file_handle:
+        json.dump(replay, file_handle, indent=1)
+        file_handle.write("\n")
+
+
+def check_replay(path: Path) -> Anomaly | None:
+    """Play a replay headlessly with the anomaly checks; used to confirm a saved failure or its fix."""
+    from .bot import shared_level
+    from .replay import inputs_by_step, load_replay
+
+    replay = load_replay(path)
+    view, start_record = shared_level(replay["start_level"], replay["starting_speed_rounds"])
+    grouped = inputs_by_step(replay)
+    events = [(step, action, pressed) for step in sorted(grouped) for action, pressed in grouped[step]]
+    return replay_anomaly(view, start_record, events, int(replay["steps"]) + SHRINK_SLACK_STEPS)
+
+
+def fuzz(
+    level_numbers: list[int],
+    rounds: int,
+    episodes: int,
+    strategies: tuple[str, ...] = STRATEGIES,
+    seed: int = 0,
+    workers: int | None = None,
+    max_steps: int = DEFAULT_EPISODE_STEPS,
+) -> tuple[int, list[Failure]]:
+    """Fuzz every level and round; return the episodes run and the smallest failure per level, round and kind."""
+    jobs = [(level_number, speed_rounds) for level_number in level_numbers for speed_rounds in range(rounds)]
+    best: dict[tuple[int, int, str], Failure] = {}
+    episodes_run = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        routes = {}
+        if STRATEGY_ROUTE in strategies:
+            route_futures = {job: pool.submit(route_task, *job) for job in jobs}
+            routes = {job: future.result()[1] for job, future in route_futures.items()}
+        futures = []
+        for level_number, speed_rounds in jobs:
+            route = routes.get((level_number, speed_rounds))
+            for strategy in strategies:
+                if strategy == STRATEGY_ROUTE and route is None:
+                    continue
+                for first_episode in range(0, episodes, EPISODES_PER_TASK):
+                    count = min(EPISODES_PER_TASK, episodes - first_episode)
+                    task = (level_number, speed_rounds, strategy, route, seed, first_episode, count, max_steps)
+                    futures.append(pool.submit(fuzz_task, *task))
+        for future in futures:
+            count, failures = future.result()
+            episodes_run += count
+            for failure in failures:
+                key = (failure.level_number, failure.speed_rounds, failure.anomaly.kind)
+                if key not in best or len(failure.events) < len(best[key].events):
+                    best[key] = failure
+    return episodes_run, [best[key] for key in sorted(best)]
+
+
+def _parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Fuzz pySNOOPY physics for tunneling and stuck states")
+    parser.add_argument("--levels", type=str, default=None, help="Comma-separated level numbers (default: all).")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Fuzz speed rounds 0 .. N-1.")
+    parser.add_argument("--episodes", type=int, default=DEFAULT_EPISODES,
+                        help="Episodes per level, round and strategy.")
+    parser.add_argument("--strategies", type=str, default=",".join(STRATEGIES),
+                        help=f"Comma-separated input strategies ({', '.join(STRATEGIES)}).")
+    parser.add_argument("--max-steps", type=int, default=DEFAULT_EPISODE_STEPS, help="Steps per episode.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the generated inputs.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_DIR, help="Directory for failure replays.")
+    parser.add_argument("--check", type=Path, nargs="+", default=None,
+                        help="Replay saved failures instead of fuzzing; exit 1 if any anomaly still happens.")
+    args = parser.parse_args(argv)
+    # Opening a level changes into the package directory; paths are meant from the caller's.
+    args.output = args.output.resolve()
+    if args.check is not None:
+        args.check = [path.resolve() for path in args.check]
+    if args.rounds < 1 or args.episodes < 1 or args.max_steps < 1:
+        parser.error("--rounds, --episodes and --max-steps must be at least 1")
+    args.strategies = tuple(args.strategies.split(","))
+    unknown = [strategy for strategy in args.strategies if strategy not in STRATEGIES]
+    if unknown:
+        parser.error(f"unknown strategies: {unknown}")
+    return args
+
+
+def _check(paths: list[Path]) -> int:
+    status = 0
+    for path in paths:
+        anomaly = check_replay(path)
+        if anomaly is None:
+            print(f"{path}: no anomaly")
+        else:
+            print(f"{path}: step {anomaly.step} {anomaly.kind}: {anomaly.detail}")
+            status = 1
+    return status
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+    if args.check is not None:
+        return _check(args.check)
+    from .levels import get_default_levels
+
+    level_count = len(get_default_levels())
+    try:
+        level_numbers = list(range(1, level_count + 1)) if args.levels is None else [
+            int(part) for part in args.levels.split(",")
+        ]
+    except ValueError:
+        print(f"--levels expects comma-separated level numbers, got {args.levels!r}", file=sys.stderr)
+        return 2
+    if any(not 1 <= number <= level_count for number in level_numbers):
+        print(f"level numbers must be between 1 and {level_count}", file=sys.stderr)
+        return 2
+
+    episodes_run, failures = fuzz(
+        level_numbers,
+        args.rounds,
+        args.episodes,
+        args.strategies,
+        seed=args.seed,
+        workers=args.workers,
+        max_steps=args.max_steps,
+    )
+    print(f"{episodes_run} episodes, {len(failures)} anomalies")
+    for failure in failures:
+        path = args.output / (
+            f"level-{failure.level_number:02d}_round-{failure.speed_rounds}_{failure.anomaly.kind}.replay.json"
+        )
+        write_failure_replay(failure, path)
+        print(
+            f"  level {failure.level_number} round {failure.speed_rounds} step {failure.anomaly.step} "
+            f"{failure.anomaly.kind} ({len(failure.events)} of {failure.original_event_count} events, "
+            f"{failure.strategy}): {failure.anomaly.detail}\n    -> {path}"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
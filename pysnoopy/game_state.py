@@ -1,5 +1,7 @@
-from dataclasses import dataclass, field
-from typing import Any
+from array import array
+from dataclasses import astuple, dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, ClassVar
 
 import arcade
 
@@ -11,9 +13,14 @@ from .globals import (
     PLAYER_MOVEMENT_SPEED,
     RUN_SPEED_MULTIPLIER_STEP,
 )
+from .fixed_point import quantize
+from .heatmap import DeathHeatmap
+from .replay import ReplayRecorder
+from .rng import RandomService
+from .snapshots import StateValues
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GlobalRealitySettings:
     """Global base physics/logic constants for the whole game.
 
@@ -25,21 +32,39 @@ class GlobalRealitySettings:
     player_movement_speed: float = PLAYER_MOVEMENT_SPEED
     player_jump_speed: float = PLAYER_JUMP_SPEED
 
+    def quantized(self) -> "GlobalRealitySettings":
+        """Copy with every constant on the fixed-point sub-pixel grid."""
+        return replace(self, **{item.name: quantize(getattr(self, item.name)) for item in fields(self)})
 
-@dataclass
+
+@dataclass(slots=True)
 class RoundSettings:
     """Run-wide settings that persist across levels within a round."""
 
     run_speed_multiplier: float = 1.0
     music_speed_multiplier: float = MUSIC_SPEED_MULTIPLIER_START
 
+    STATE_FIELDS: ClassVar[tuple[str, ...]] = ("run_speed_multiplier", "music_speed_multiplier")
+
+    def capture_state(self, out: array) -> None:
+        out.extend((self.run_speed_multiplier, self.music_speed_multiplier))
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.run_speed_multiplier = values[offset]
+        self.music_speed_multiplier = values[offset + 1]
+        return offset + 2
 
-@dataclass
+    def quantize(self) -> None:
+        self.run_speed_multiplier = quantize(self.run_speed_multiplier)
+        self.music_speed_multiplier = quantize(self.music_speed_multiplier)
+
+
+@dataclass(slots=True)
 class LevelRuntimeSettings:
     """Per-level runtime modifiers.
 
-    These are rebuilt on every level setup (including death restart) and must
-    never be carried to another level.
+    These are rebuilt on every level setup and restored from the level start
+    snapshot on death restart; they must never be carried to another level.
     """
 
     run_speed_multiplier: float = 1.0
@@ -48,17 +73,86 @@ class LevelRuntimeSettings:
     gravity_multiplier: float = 1.0
     hazard_speed_multiplier: float = 1.0
 
+    STATE_FIELDS: ClassVar[tuple[str, ...]] = (
+        "run_speed_multiplier",
+        "move_speed_multiplier",
+        "jump_speed_multiplier",
+        "gravity_multiplier",
+        "hazard_speed_multiplier",
+    )
+
+    def capture_state(self, out: array) -> None:
+        out.extend(astuple(self))
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.run_speed_multiplier = values[offset]
+        self.move_speed_multiplier = values[offset + 1]
+        self.jump_speed_multiplier = values[offset + 2]
+        self.gravity_multiplier = values[offset + 3]
+        self.hazard_speed_multiplier = values[offset + 4]
+        return offset + 5
+
+    def quantize(self) -> None:
+        for item in fields(self):
+            setattr(self, item.name, quantize(getattr(self, item.name)))
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedSettings:
+    """Effective values of global reality -> round -> level runtime settings.
+
+    Built by `resolve_settings` when one of the layers changes; gameplay reads
+    these instead of multiplying the layers again every time.
+    """
 
-@dataclass
+    run_speed_multiplier: float
+    hazard_speed_multiplier: float
+    move_speed: float
+    jump_speed: float
+    gravity: float
+
+
+def resolve_settings(
+    reality: GlobalRealitySettings,
+    round_settings: RoundSettings,
+    level_settings: LevelRuntimeSettings,
+    *,
+    fixed_point: bool = False,
+) -> ResolvedSettings:
+    """Apply the layers in precedence order; in fixed-point mode every result is on the sub-pixel grid."""
+    fixed = quantize if fixed_point else float
+    run_speed_multiplier = fixed(round_settings.run_speed_multiplier * level_settings.run_speed_multiplier)
+    return ResolvedSettings(
+        run_speed_multiplier=run_speed_multiplier,
+        hazard_speed_multiplier=fixed(run_speed_multiplier * level_settings.hazard_speed_multiplier),
+        move_speed=fixed(
+            reality.player_movement_speed * run_speed_multiplier * level_settings.move_speed_multiplier
+        ),
+        jump_speed=fixed(reality.player_jump_speed * run_speed_multiplier * level_settings.jump_speed_multiplier),
+        gravity=fixed(reality.gravity * (run_speed_multiplier ** 2) * level_settings.gravity_multiplier),
+    )
+
+
+@dataclass(slots=True)
 class GameState:
     start_level: int = 1
     starting_speed_rounds: int = 0
+    seed: int | None = None
+    fixed_point: bool = False
     round_settings: RoundSettings = field(default_factory=RoundSettings)
     reality_settings: GlobalRealitySettings = field(default_factory=GlobalRealitySettings)
     music_sound: arcade.Sound | None = None
     music_player: Any | None = None
+    replay_recorder: ReplayRecorder | None = None
+    death_heatmap: DeathHeatmap | None = None
+    ghost_dir: Path | None = None
+    rng: RandomService = field(init=False)
 
     def __post_init__(self) -> None:
+        self.rng = RandomService(self.seed)
+        self.seed = self.rng.seed
+        if self.fixed_point:
+            self.reality_settings = self.reality_settings.quantized()
         self._apply_starting_round_speed()
 
     @property
@@ -71,6 +165,7 @@ class GameState:
 
     def reset_for_new_run(self) -> None:
         self.round_settings = RoundSettings()
+        self.rng.reset()
         self._apply_starting_round_speed()
 
     def _apply_starting_round_speed(self) -> None:
@@ -83,6 +178,8 @@ class GameState:
     def advance_round(self, run_speed_step: float, music_speed_step: float) -> None:
         self.round_settings.run_speed_multiplier *= run_speed_step
         self.round_settings.music_speed_multiplier *= music_speed_step
+        if self.fixed_point:
+            self.round_settings.quantize()
 
     def restart_music(self, speed: float | None = None):
         if self.music_sound is None:
@@ -0,0 +1,111 @@
+"""Best-clear ghosts: record each attempt, keep the fastest clear per level as a trace.
+
+While a level is played, `GhostRecorder` keeps the player position and
+texture index at the start of the current attempt and after every simulation
+step of it (frame ``n`` is the state after ``n`` steps). When the
+exit is reached faster than the stored ghost, the attempt is written as a
+trace (`pysnoopy/trace.py`) with one raw keyframe sample per step.
+`GhostPlayback` maps that trace once at level setup into a flat array; the
+view then only moves a step cursor, so drawing the ghost costs one sprite.
+
+Ghosts are kept per level and run speed, since a faster round changes every
+trajectory. Attempts that were rewound past their recording or continued
+from a loaded save state do not count as clears; the next death restart from
+the level start begins a new one.
+"""
+import os
+from array import array
+from pathlib import Path
+
+from .trace import TraceReader, TraceWriter
+
+GHOST_STATE_FIELDS = ("center_x", "center_y", "texture_state_index")
+_GHOST_STRIDE = len(GHOST_STATE_FIELDS)
+
+
+def ghost_trace_path(ghost_dir: Path, level_number: int, run_speed_multiplier: float) -> Path:
+    return ghost_dir / f"level-{level_number:02d}_speed-{run_speed_multiplier:.4f}.sntrace"
+
+
+class GhostRecorder:
+    """Player frames of the current attempt."""
+
+    __slots__ = ("frames", "valid")
+
+    def __init__(self):
+        self.frames = array("d")
+        self.valid = True
+
+    def __len__(self) -> int:
+        return len(self.frames) // _GHOST_STRIDE
+
+    def reset(self) -> None:
+        del self.frames[:]
+        self.valid = True
+
+    def truncate(self, frame_count: int) -> None:
+        """Keep the first ``frame_count`` frames (rewind); restoring past the recording invalidates the attempt."""
+        if frame_count > len(self):
+            self.valid = False
+            return
+        del self.frames[frame_count * _GHOST_STRIDE:]
+
+    def restart(self) -> None:
+        """Keep only the level start frame and count what follows as a new attempt."""
+        self.truncate(1)
+        self.valid = len(self) == 1
+
+    def record(self, center_x: float, center_y: float, texture_state_index: int) -> None:
+        self.frames.extend((center_x, center_y, float(texture_state_index)))
+
+    def save_if_best(self, path: Path, metadata: dict, best_frame_count: int | None) -> bool:
+        """Write the attempt to ``path`` when it is valid and shorter than ``best_frame_count``."""
+        frame_count = len(self)
+        if not self.valid or frame_count == 0 or (best_frame_count is not None and frame_count >= best_frame_count):
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        # Every step is a keyframe, so each entry holds the raw doubles.
+        with TraceWriter(temp_path, metadata, actions=(), keyframe_interval=1) as writer:
+            frames = memoryview(self.frames)
+            for frame_index in range(frame_count):
+                start = frame_index * _GHOST_STRIDE
+                writer.write_step((), None, frames[start:start + _GHOST_STRIDE])
+        os.replace(temp_path, path)
+        return True
+
+
+class GhostPlayback:
+    """Frames of a stored best clear, indexed by attempt step."""
+
+    __slots__ = ("frames",)
+
+    def __init__(self, frames: array):
+        self.frames = frames
+
+    def __len__(self) -> int:
+        return len(self.frames) // _GHOST_STRIDE
+
+    @classmethod
+    def load(cls, path: Path) -> "GhostPlayback | None":
+        if not path.is_file():
+            return None
+        try:
+            with TraceReader(path) as reader:
+                frames = array("d")
+                for entry in reader.iter_steps():
+                    if entry.state is None or len(entry.state) != _GHOST_STRIDE:
+                        raise ValueError(f"{path}: step {entry.step} has no ghost frame")
+                    frames.extend(entry.state)
+        except (OSError, ValueError) as error:
+            print(f"[ghost warning] ignoring {path}: {error}")
+            return None
+        return cls(frames)
+
+    def frame(self, steps: int) -> tuple[float, float, int] | None:
+        """Frame after ``steps`` steps of an attempt, or None once the ghost has finished."""
+        if steps >= len(self):
+            return None
+        start = steps * _GHOST_STRIDE
+        frames = self.frames
+        return frames[start], frames[start + 1], int(frames[start + 2])
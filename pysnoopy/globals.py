@@ -30,6 +30,15 @@ PLAYER_GROUND_OFFSET = 0
 PLAYER_GROUND_OFFSET_STEP = 0
 SHOW_HITBOXES = False
 
+# Rewind history (hold R) length in simulation steps (60 steps per second).
+REWIND_HISTORY_STEPS = 60 * 8
+
+# Sub-pixel units per pixel in the fixed-point simulation mode (--fixed-point).
+FIXED_POINT_SUBPIXELS = 256
+
+# Opacity (0-255) of the best-clear ghost drawn over later attempts.
+GHOST_ALPHA = 96
+
 # Character facing direction indices.
 RIGHT_FACING = 0
 LEFT_FACING = 1
@@ -41,6 +50,14 @@ PLAYER_JUMP_SPEED = 6.3
 DEATH_FALL_GRAVITY_MULTIPLIER = 0.65
 LEDGE_MIN_GROUND_OVERLAP_TILES = 2.0
 LEDGE_OBSTACLE_FOOT_Y_TOLERANCE = 2.0
+# Upper bound for speed-aware physics sub-steps per frame at high rounds.
+MAX_PHYSICS_SUBSTEPS = 8
+
+# Fixed simulation rate; rendering interpolates between steps.
+SIMULATION_STEP_SECONDS = 1 / 60
+MAX_SIMULATION_STEPS_PER_UPDATE = 5
+# Moves longer than this in one step (wraps, respawns) are drawn without interpolation.
+INTERPOLATION_SNAP_DISTANCE = SPRITE_PIXEL_SIZE * TILE_SCALING * 8
 
 # Round progression and music speed defaults.
 MUSIC_SPEED_MULTIPLIER_START = 1.0
@@ -0,0 +1,252 @@
+"""Death heatmaps: where and why the player dies, binned per level.
+
+    python -m pysnoopy.heatmap
+    python -m pysnoopy.heatmap ~/.pysnoopy/deaths other-machine/ --levels 3,8 --render heatmaps/
+
+While the game runs, `DeathHeatmap` subscribes to the `EVENT_DEATH` events
+of `GameView.events` and counts every death in a one-tile cell of its level,
+split by cause (`DEATH_CAUSES`). Recording is one dictionary increment per
+death, and the session writes one small JSON file of non-empty cells when the
+game closes.
+
+The command merges any number of session files (or directories of them) one
+file at a time, so memory stays bounded by the number of distinct cells, prints
+the deadliest cells per level and, with ``--render``, draws the merged counts
+over each level map as a PNG. Files that are not readable death heatmaps are
+skipped with a warning, and a missing default directory merges no sessions.
+"""
+import argparse
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Sequence
+
+from .events import DEATH_CAUSES, EVENT_DEATH, EVENT_LEVEL_START, GameEvent
+from .globals import SPRITE_PIXEL_SIZE, TILE_SCALING
+
+HEATMAP_FORMAT_VERSION = 1
+HEATMAP_BIN_PX = SPRITE_PIXEL_SIZE * TILE_SCALING  # one tile
+DEFAULT_HEATMAP_DIR = Path.home() / ".pysnoopy" / "deaths"
+DEFAULT_TOP_CELLS = 5
+_HEAT_COLOR = (230, 30, 20)
+_HEAT_MAX_ALPHA = 200
+
+# (level name, cause, column, row) -> deaths
+CellKey = tuple[str, str, int, int]
+
+
+def session_heatmap_path(heatmap_dir: Path) -> Path:
+    return heatmap_dir / f"deaths-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json"
+
+
+class DeathHeatmap:
+    """Death counts per level, cause and grid cell."""
+
+    EVENTS = (EVENT_LEVEL_START, EVENT_DEATH)
+
+    __slots__ = ("cells", "level_name")
+
+    def __init__(self):
+        self.cells: dict[CellKey, int] = {}
+        self.level_name = ""
+
+    def __len__(self) -> int:
+        return sum(self.cells.values())
+
+    def handle(self, events: Sequence[GameEvent]) -> None:
+        """`EventBus` subscriber; level starts name the level of the deaths after them."""
+        for event in events:
+            if event.kind == EVENT_LEVEL_START:
+                self.level_name = event.detail
+            else:
+                self.record(self.level_name, event.detail, event.x, event.y)
+
+    def record(self, level_name: str, cause: str, x: float, y: float, count: int = 1) -> None:
+        key = (level_name, cause, math.floor(x / HEATMAP_BIN_PX), math.floor(y / HEATMAP_BIN_PX))
+        self.cells[key] = self.cells.get(key, 0) + count
+
+    def merge_file(self, path: str | Path) -> None:
+        """Add the counts of a session file; raise ValueError (merging nothing) if it is not a heatmap."""
+        with open(path, "r", encoding="utf-8") as file_handle:
+            data = json.load(file_handle)
+        if not isinstance(data, dict) or data.get("version") != HEATMAP_FORMAT_VERSION:
+            raise ValueError(f"{path}: not a version {HEATMAP_FORMAT_VERSION} death heatmap")
+        if data.get("bin_px") != HEATMAP_BIN_PX:
+            raise ValueError(f"{path}: cells of {data.get('bin_px')} px, expected {HEATMAP_BIN_PX}")
+        try:
+            counts = [
+                ((str(level_name), str(cause), int(column), int(row)), int(count))
+                for level_name, cause, column, row, count in data["cells"]
+            ]
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"{path}: malformed cells ({error})") from None
+        for key, count in counts:
+            self.cells[key] = self.cells.get(key, 0) + count
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": HEATMAP_FORMAT_VERSION,
+            "bin_px": HEATMAP_BIN_PX,
+            "cells": [[*key, count] for key, count in sorted(self.cells.items())],
+        }
+
+    def write(self, path: str | Path) -> None:
+        """Write atomically, so a reader merging the directory never sees half a file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as file_handle:
+            json.dump(self.to_dict(), file_handle, separators=(",", ":"))
+            file_handle.write("\n")
+        os.replace(temp_path, path)
+
+    def level_cells(self, level_name: str, causes: Iterable[str] | None = None) -> dict[tuple[int, int], int]:
+        """Deaths per cell of one level, summed over ``causes`` (all when None)."""
+        wanted = None if causes is None else set(causes)
+        merged: dict[tuple[int, int], int] = {}
+        for (name, cause, column, row), count in self.cells.items():
+            if name == level_name and (wanted is None or cause in wanted):
+                merged[(column, row)] = merged.get((column, row), 0) + count
+        return merged
+
+    def cause_totals(self, level_name: str) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for (name, cause, _, _), count in self.cells.items():
+            if name == level_name:
+                totals[cause] = totals.get(cause, 0) + count
+        return totals
+
+
+def iter_heatmap_files(paths: Iterable[Path]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            yield from sorted(path.glob("*.json"))
+        else:
+            yield path
+
+
+def render_level_heatmap(map_path: str, cells: dict[tuple[int, int], int], out_path: Path) -> None:
+    """Draw ``cells`` over the tile layers of ``map_path`` and save a PNG (needs an arcade window)."""
+    import arcade
+    from PIL import Image, ImageDraw
+
+    from .rendering import render_offscreen_image
+
+    tile_map = arcade.load_tilemap(map_path, TILE_SCALING)
+    scene = arcade.Scene.from_tilemap(tile_map)
+    width = tile_map.width * tile_map.tile_width * TILE_SCALING
+    height = tile_map.height * tile_map.tile_height * TILE_SCALING
+    level_image = render_offscreen_image((0.0, float(width), 0.0, float(height)), scene.draw).convert("RGBA")
+    background = Image.new("RGBA", level_image.size, (245, 245, 245, 255))
+    background.alpha_composite(level_image)
+
+    overlay = Image.new("RGBA", background.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    most_deaths = max(cells.values(), default=0)
+    for (column, row), count in cells.items():
+        left = column * HEATMAP_BIN_PX
+        top = height - (row + 1) * HEATMAP_BIN_PX
+        alpha = round(_HEAT_MAX_ALPHA * math.sqrt(count / most_deaths))
+        draw.rectangle(
+            (left, top, left + HEATMAP_BIN_PX - 1, top + HEATMAP_BIN_PX - 1),
+            fill=(*_HEAT_COLOR, max(alpha, 40)),
+        )
+    background.alpha_composite(overlay)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    background.convert("RGB").save(out_path)
+
+
+def _print_level(heatmap: DeathHeatmap, level_name: str, causes: Sequence[str] | None, top_cells: int) -> None:
+    totals = heatmap.cause_totals(level_name)
+    print(f"{level_name}: {sum(totals.values())} deaths")
+    for cause, count in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {cause:<18} {count:>7}")
+    cells = heatmap.level_cells(level_name, causes)
+    for (column, row), count in sorted(cells.items(), key=lambda item: -item[1])[:top_cells]:
+        print(f"  tile column {column:>3} row {row:>3} (from bottom): {count} deaths")
+
+
+def _parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Merge and render pySNOOPY death heatmaps")
+    parser.add_argument(
+        "paths",
+        type=Path,
+        nargs="*",
+        help=f"Session files or directories of them (default: {DEFAULT_HEATMAP_DIR}, if it exists).",
+    )
+    parser.add_argument("--levels", type=str, default=None, help="Comma-separated level numbers (default: all).")
+    parser.add_argument(
+        "--causes",
+        type=str,
+        default=None,
+        help=f"Comma-separated causes for the top cells and images (default: all of {', '.join(DEATH_CAUSES)}).",
+    )
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_CELLS, help="Deadliest cells listed per level.")
+    parser.add_argument("--render", type=Path, default=None, help="Write one PNG per level into this directory.")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the merged heatmap to this file.")
+    args = parser.parse_args(argv)
+    if not args.paths:
+        args.paths = [DEFAULT_HEATMAP_DIR] if DEFAULT_HEATMAP_DIR.is_dir() else []
+    if args.levels is not None:
+        try:
+            args.levels = {int(number) for number in args.levels.split(",")}
+        except ValueError:
+            parser.error(f"--levels expects comma-separated level numbers, got {args.levels!r}")
+    if args.causes is not None:
+        args.causes = [cause.strip() for cause in args.causes.split(",") if cause.strip()]
+        unknown = sorted(set(args.causes).difference(DEATH_CAUSES))
+        if unknown:
+            parser.error(f"unknown causes: {', '.join(unknown)}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+    from .levels import get_default_levels
+
+    heatmap = DeathHeatmap()
+    file_count = 0
+    for path in iter_heatmap_files(args.paths):
+        try:
+            heatmap.merge_file(path)
+        except (OSError, ValueError) as error:
+            print(f"[heatmap warning] skipping {path}: {error}")
+            continue
+        file_count += 1
+    print(f"{file_count} sessions, {len(heatmap)} deaths")
+
+    specs = list(enumerate(get_default_levels(), start=1))
+    if args.levels is not None:
+        specs = [(number, spec) for number, spec in specs if number in args.levels]
+    if args.json is not None:
+        heatmap.write(args.json)
+    if args.render is not None:
+        _open_render_window()
+    for number, spec in specs:
+        _print_level(heatmap, spec.name, args.causes, args.top)
+        if args.render is not None:
+            out_path = args.render / f"level-{number:02d}-deaths.png"
+            cells = heatmap.level_cells(spec.name, args.causes)
+            render_level_heatmap(_package_path(spec.map_path), cells, out_path)
+            print(f"  {out_path}")
+    return 0
+
+
+def _package_path(map_path: str) -> str:
+    # Level paths are relative to the package directory, as when the game runs.
+    return str((Path(__file__).resolve().parent / map_path).resolve())
+
+
+def _open_render_window() -> None:
+    import arcade
+
+    from .globals import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
+
+    arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, visible=False)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,6 +1,8 @@
 import json
 from dataclasses import dataclass, field
 
+from .platforms import path_platform_spec, scrolling_platform_spec
+from .triggers import trigger_volume
 
 REQUIRED_TILE_LAYERS = ("ground", "obstacles", "foreground")
 EXPECTED_MAP_WIDTH = 32
@@ -28,6 +30,9 @@ def validate_level_file(
     moving_hazard_object_name: str = "moving_hazard",
     skull_hazard_object_name: str = "skull_hazard",
     laser_hazard_object_name: str = "laser_hazard",
+    scrolling_platform_object_name: str = "scrolling_platform",
+    path_platform_object_name: str = "path_platform",
+    trigger_object_name: str = "trigger",
     required_object_names: tuple[str, ...] = (),
 ) -> LevelValidationResult:
     result = LevelValidationResult()
@@ -143,11 +148,23 @@ def validate_level_file(
         skull_hazard_object_name,
         laser_hazard_object_name,
     )
+    object_spec_parsers = {
+        scrolling_platform_object_name: scrolling_platform_spec,
+        path_platform_object_name: path_platform_spec,
+        trigger_object_name: trigger_volume,
+    }
     for layer in object_layers:
         for obj in layer.get("objects", []):
             if not isinstance(obj, dict):
                 continue
             object_name = obj.get("name")
+            parse_object_spec = object_spec_parsers.get(object_name)
+            if parse_object_spec is not None:
+                try:
+                    parse_object_spec(obj, map_height=0.0)
+                except ValueError as error:
+                    result.errors.append(f"{level_name}: object '{object_name}' {error}")
+                continue
             if object_name not in hazard_object_names:
                 continue
 
@@ -1,21 +1,66 @@
+from array import array
 from dataclasses import dataclass
 from typing import Callable
 
 import arcade
 
+from .events import DEATH_LANDING_SUPPORT
 from .game_state import LevelRuntimeSettings
 from .globals import SPRITE_PIXEL_SIZE, TILE_SCALING
+from .physics import GridPhysicsEngine
+from .rendering import render_text_texture
+from .snapshots import StateValues, optional_from_state, optional_to_state
+from .triggers import TRIGGER_ACTIVATION, TRIGGER_BOOST, TriggerVolumes, hit_box_bounds
 
 # Level-specific controls and tuning constants belong in this module (hooks),
 # not in pysnoopy/globals.py.
 
+DEFAULT_BACKGROUND_PATH = "../assets/images/doghouse.png"
+
+# Per-step phases a hook can take part in (`LevelHook.PHASES`). The view binds
+# the phase methods once per level setup and never calls undeclared ones.
+PHASE_PRE_PHYSICS = "pre_physics"  # update_pre_physics(): before the physics step
+PHASE_POST_PHYSICS = "post_physics"  # update(): after physics and hazards
+PHASE_DRAW = "draw"  # draw(), draw_hit_boxes(): after the scene layers
+PHASE_CAMERA = "camera"  # camera_follow_target_y(): when the camera is placed
+PHASE_SUPPORT_CHECK = "support_check"  # player_lacks_support(): while grounded
+
+PHASE_METHODS: dict[str, tuple[str, ...]] = {
+    PHASE_PRE_PHYSICS: ("update_pre_physics",),
+    PHASE_POST_PHYSICS: ("update",),
+    PHASE_DRAW: ("draw", "draw_hit_boxes"),
+    PHASE_CAMERA: ("camera_follow_target_y",),
+    PHASE_SUPPORT_CHECK: ("player_lacks_support",),
+}
+
 
 class LevelHook:
+    PHASES: frozenset[str] = frozenset()  # phases whose methods the view calls
+    SUPPORT_DEATH_CAUSE = DEATH_LANDING_SUPPORT  # reported when `player_lacks_support` kills
+
+    def __init_subclass__(cls, **kwargs):
+        """Reject unknown phases and phase methods overridden without declaring the phase."""
+        super().__init_subclass__(**kwargs)
+        unknown = cls.PHASES - PHASE_METHODS.keys()
+        if unknown:
+            raise TypeError(f"{cls.__name__}.PHASES has unknown phases: {sorted(unknown)}")
+        for phase, method_names in PHASE_METHODS.items():
+            if phase in cls.PHASES:
+                continue
+            for method_name in method_names:
+                if getattr(cls, method_name) is not getattr(LevelHook, method_name):
+                    raise TypeError(f"{cls.__name__}.{method_name} needs {phase!r} in PHASES")
+
     def __init__(self):
-        self.physics_engine: arcade.PhysicsEnginePlatformer | None = None
+        self.physics_engine: GridPhysicsEngine | None = None
         self.speed_multiplier = 1.0
         self.level_bounds: tuple[float, float, float, float] | None = None
         self.moving_platforms: arcade.SpriteList | None = None
+        self.triggers: TriggerVolumes | None = None  # the level's trigger volumes, set by `setup`
+
+    def update_pre_physics(self):
+        """Runs before the physics step; while the player dies, after the hazards."""
+        pass
 
     def update(self):
         pass
@@ -29,6 +74,32 @@ class LevelHook:
     def camera_follow_target_y(self) -> float | None:
         return None
 
+    def player_lacks_support(
+        self,
+        player_sprite: arcade.Sprite,
+        ground_support_width: Callable[[], float],
+    ) -> bool:
+        """Whether the grounded player stands on too little to survive.
+
+        `ground_support_width` measures the player's overlap with ``ground``
+        tiles in pixels; the default rule compares it with
+        `min_ground_overlap_tiles`.
+        """
+        minimum_overlap_tiles = self.min_ground_overlap_tiles()
+        if minimum_overlap_tiles is None or minimum_overlap_tiles <= 0.0:
+            return False
+        return ground_support_width() < minimum_overlap_tiles * TILE_SCALING * SPRITE_PIXEL_SIZE
+
+    STATE_FIELDS: tuple[str, ...] = ()  # names of the values appended by capture_state
+
+    def capture_state(self, out: array) -> None:
+        """Append mutable hook state (platform phases, elevator...) for level restarts."""
+        pass
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        """Restore state written by `capture_state` in place; return the next offset."""
+        return offset
+
     def init_platforms(self, world_bounds: tuple[float, float, float, float]) -> None:
         pass
 
@@ -42,11 +113,13 @@ class LevelHook:
 
     def setup(
         self,
-        physics_engine: arcade.PhysicsEnginePlatformer,
+        physics_engine: GridPhysicsEngine,
         level_bounds: tuple[float, float, float, float] | None = None,
+        triggers: TriggerVolumes | None = None,
     ):
         self.physics_engine = physics_engine
         self.level_bounds = level_bounds
+        self.triggers = triggers
 
     def set_speed_multiplier(self, multiplier: float):
         """Set effective run multiplier after global + round + level settings."""
@@ -87,7 +160,7 @@ class LevelHook:
         return []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LaserSchedule:
     active_duration: float
     inactive_duration: float
@@ -95,7 +168,7 @@ class LaserSchedule:
     color: tuple[int, int, int, int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LevelSpec:
     name: str
     map_path: str
@@ -104,8 +177,14 @@ class LevelSpec:
     moving_hazard_object_name: str = "moving_hazard"
     skull_hazard_object_name: str = "skull_hazard"
     laser_hazard_object_name: str = "laser_hazard"
+    scrolling_platform_object_name: str = "scrolling_platform"
+    path_platform_object_name: str = "path_platform"
+    trigger_object_name: str = "trigger"
     required_object_names: tuple[str, ...] = ()
     hook_factory: Callable[[], LevelHook] | None = None
+    background_path: str = DEFAULT_BACKGROUND_PATH
+    tall_background: bool = False  # scale to the viewport width and scroll with the world
+    hide_obstacles: bool = False
 
     def create_hook(self) -> LevelHook:
         if self.hook_factory is None:
@@ -113,144 +192,13 @@ class LevelSpec:
         return self.hook_factory()
 
 
-class Level3Hook(LevelHook):
-    """Moving wood plank that loops left-to-right over the water pit.
-
-    A single logical position is tracked and wrapped within the water span.
-    Two sprites are sized and positioned to show only the portion that falls
-    inside [water_left_x, water_right_x], so neither sprite ever touches the
-    grass or pillars — visually or physically.
-    """
-
-    _TILE_PX: int = SPRITE_PIXEL_SIZE * TILE_SCALING  # scaled tile size in px
-    _WATER_LEFT_X: float = 8 * _TILE_PX  # first water column left edge
-    _WATER_RIGHT_X: float = 24 * _TILE_PX  # last water column left edge
-    _PLATE_WIDTH_TILES: int = 7  # plate width in tiles
-    _PLATE_SPEED: float = 1.6  # px/frame base speed
-    _PLATE_CENTER_Y: float = (20 - 15 - 0.5) * _TILE_PX + 1.0  # nudge up 1px to reduce false edge deaths
-    _OFF_SCREEN: float = -10000.0  # hide sprite outside world
-
-    def _water_width(self) -> float:
-        return self._WATER_RIGHT_X - self._WATER_LEFT_X
-
-    def _plate_width(self) -> float:
-        return self._PLATE_WIDTH_TILES * self._TILE_PX
-
-    def _start_logical_left(self) -> float:
-        """Logical left so only 1 tile column is visible at the water's left edge."""
-        return self._WATER_LEFT_X - self._plate_width() + self._TILE_PX
-
-    def init_platforms(self, world_bounds: tuple[float, float, float, float]) -> None:
-        self._logical_left: float = self._start_logical_left()
-        self.moving_platforms = arcade.SpriteList()
-        for _ in range(2):
-            plate = arcade.SpriteSolidColor(
-                width=int(self._plate_width()),
-                height=self._TILE_PX,
-                color=(139, 90, 43, 255),
-            )
-            plate.center_y = self._PLATE_CENTER_Y
-            plate.change_x = 0.0  # we position manually; engine must not move them
-            self.moving_platforms.append(plate)
-        self._apply_positions()
-
-    def _apply_positions(self) -> None:
-        """Clip each logical plate segment to the water window and resize to fit."""
-        if self.moving_platforms is None:
-            return
-        water_width = self._water_width()
-        plate_width = self._plate_width()
-        # Primary starts at _logical_left; echo is one water_width behind.
-        logical_lefts = (self._logical_left, self._logical_left - water_width)
-        for sprite, log_left in zip(self.moving_platforms, logical_lefts):
-            vis_left = max(log_left, self._WATER_LEFT_X)
-            vis_right = min(log_left + plate_width, self._WATER_RIGHT_X)
-            if vis_right <= vis_left:
-                # Not visible in the water window — park off-screen.
-                sprite.width = 1
-                sprite.center_x = self._OFF_SCREEN
-            else:
-                sprite.width = vis_right - vis_left
-                sprite.center_x = (vis_left + vis_right) / 2.0
-
-    def update(self) -> None:
-        if self.moving_platforms is None:
-            return
-        self._logical_left += self._PLATE_SPEED * self.speed_multiplier
-        # Wrap when primary has fully exited right. At this exact moment sprite 2
-        # (echo) is showing the plate at water_left — identical to where sprite 1
-        # will be after reset — so there is no visual discontinuity.
-        if self._logical_left >= self._WATER_RIGHT_X:
-            self._logical_left = self._WATER_LEFT_X
-        self._apply_positions()
-
-
-class Level6Hook(LevelHook):
-    """Moving red plate that loops right-to-left over the lava pit.
+class Level7Hook(LevelHook):
+    """Narrow elevator that rises after the player centers onto it.
 
-    Uses the same clipped two-sprite approach as Level 3, but mirrored so the
-    plate appears from the right side and moves in the opposite direction.
+    The elevator shaft is an ``activation`` trigger volume of the map.
     """
 
-    _TILE_PX: int = SPRITE_PIXEL_SIZE * TILE_SCALING
-    _LAVA_LEFT_X: float = 8 * _TILE_PX
-    _LAVA_RIGHT_X: float = 24 * _TILE_PX
-    _PLATE_WIDTH_TILES: int = 7
-    _PLATE_SPEED: float = 1.6
-    _PLATE_CENTER_Y: float = (20 - 15 - 0.5) * _TILE_PX
-    _OFF_SCREEN: float = -10000.0
-
-    def _lava_width(self) -> float:
-        return self._LAVA_RIGHT_X - self._LAVA_LEFT_X
-
-    def _plate_width(self) -> float:
-        return self._PLATE_WIDTH_TILES * self._TILE_PX
-
-    def _start_logical_left(self) -> float:
-        return self._LAVA_RIGHT_X - self._plate_width()
-
-    def init_platforms(self, world_bounds: tuple[float, float, float, float]) -> None:
-        self._logical_left: float = self._start_logical_left()
-        self.moving_platforms = arcade.SpriteList()
-        for _ in range(2):
-            plate = arcade.SpriteSolidColor(
-                width=int(self._plate_width()),
-                height=self._TILE_PX,
-                color=(215, 35, 35, 255),
-            )
-            plate.center_y = self._PLATE_CENTER_Y
-            plate.change_x = 0.0
-            self.moving_platforms.append(plate)
-        self._apply_positions()
-
-    def _apply_positions(self) -> None:
-        if self.moving_platforms is None:
-            return
-        lava_width = self._lava_width()
-        plate_width = self._plate_width()
-        logical_lefts = (self._logical_left, self._logical_left + lava_width)
-        for sprite, log_left in zip(self.moving_platforms, logical_lefts):
-            vis_left = max(log_left, self._LAVA_LEFT_X)
-            vis_right = min(log_left + plate_width, self._LAVA_RIGHT_X)
-            if vis_right <= vis_left:
-                sprite.width = 1
-                sprite.center_x = self._OFF_SCREEN
-            else:
-                sprite.width = vis_right - vis_left
-                sprite.center_x = (vis_left + vis_right) / 2.0
-
-    def update(self) -> None:
-        if self.moving_platforms is None:
-            return
-        self._logical_left -= self._PLATE_SPEED * self.speed_multiplier
-        if self._logical_left + self._plate_width() <= self._LAVA_LEFT_X:
-            self._logical_left = self._LAVA_RIGHT_X - self._plate_width()
-        self._apply_positions()
-
-
-class Level7Hook(LevelHook):
-    """Narrow elevator that rises after the player centers onto it."""
-
+    PHASES = frozenset({PHASE_PRE_PHYSICS, PHASE_CAMERA})
     _TILE_PX: int = SPRITE_PIXEL_SIZE * TILE_SCALING
     _ELEVATOR_WIDTH_TILES: int = 5
     _ELEVATOR_SPEED: float = 1.2
@@ -280,18 +228,11 @@ class Level7Hook(LevelHook):
         return max(self._CENTER_TOLERANCE_PX, abs(player_sprite.change_x))
 
     def _is_player_on_elevator_top(self, player_sprite: arcade.Sprite, elevator: arcade.Sprite) -> bool:
-        hit_box_points = player_sprite.hit_box.points
-        player_left = player_sprite.center_x + min(point[0] for point in hit_box_points)
-        player_right = player_sprite.center_x + max(point[0] for point in hit_box_points)
-        player_bottom = player_sprite.center_y + min(point[1] for point in hit_box_points)
-
-        overlap_left = max(player_left, elevator.left)
-        overlap_right = min(player_right, elevator.right)
-        if overlap_right <= overlap_left:
+        player_bounds = hit_box_bounds(player_sprite)
+        if self.triggers is None or self.triggers.overlapping(player_bounds, TRIGGER_ACTIVATION) is None:
             return False
-
-        is_on_top = abs(player_bottom - elevator.top) <= 8.0 and player_sprite.change_y <= 1.0
-        return is_on_top
+        _, _, player_bottom, _ = player_bounds
+        return abs(player_bottom - elevator.top) <= 8.0 and player_sprite.change_y <= 1.0
 
     def _is_player_centered_for_activation(
         self,
@@ -301,7 +242,7 @@ class Level7Hook(LevelHook):
         center_offset = abs(player_sprite.center_x - elevator.center_x)
         return center_offset <= self._center_tolerance_px(player_sprite)
 
-    def update(self) -> None:
+    def update_pre_physics(self) -> None:
         if self.moving_platforms is None or self.physics_engine is None:
             return
 
@@ -331,64 +272,57 @@ class Level7Hook(LevelHook):
     def camera_follow_target_y(self) -> float | None:
         return self._camera_target_y
 
+    STATE_FIELDS: tuple[str, ...] = (
+        "elevator_center_y",
+        "elevator_change_y",
+        "player_on_elevator",
+        "elevator_engaged",
+        "camera_target_y",
+    )
+
+    def capture_state(self, out: array) -> None:
+        assert self.moving_platforms is not None
+        elevator = self.moving_platforms[0]
+        out.extend((
+            elevator.center_y,
+            elevator.change_y,
+            float(self._player_on_elevator),
+            float(self._elevator_engaged),
+            optional_to_state(self._camera_target_y),
+        ))
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        assert self.moving_platforms is not None
+        elevator = self.moving_platforms[0]
+        elevator.center_y = values[offset]
+        elevator.change_y = values[offset + 1]
+        self._player_on_elevator = values[offset + 2] != 0.0
+        self._elevator_engaged = values[offset + 3] != 0.0
+        self._camera_target_y = optional_from_state(values[offset + 4])
+        return offset + 5
+
 
 class Level8Hook(LevelHook):
+    """Pit between two conveyor strips, the ``boost`` trigger volumes of the map."""
+
+    PHASES = frozenset({PHASE_POST_PHYSICS, PHASE_DRAW, PHASE_SUPPORT_CHECK})
     _TILE_PX: int = SPRITE_PIXEL_SIZE * TILE_SCALING  # World-space size of one tile in pixels.
     _GAP_START_COL: int = 12  # Left tile column where the pit begins.
     _GAP_END_COL: int = 20  # Right tile column where the pit ends.
-    _STRIP_WIDTH_TILES: int = 6  # Conveyor strip length (tiles) on both sides of the pit.
-    _GROUND_TOP_ROW_FROM_TOP: int = 14  # Ground row index (from top) where strips are drawn/active.
     _STRIP_GLIDE_SPEED: float = 1.8  # Passive rightward glide added while standing on strip.
     _STRIP_FORWARD_BONUS: float = 1.4  # Extra rightward speed when player also holds right on strip.
     _JUMP_CARRY_MAX_RIGHT_SPEED: float = 4.6  # Max rightward horizontal speed carried into jump.
     _TAKEOFF_OVERHANG_TILES: float = 0.3  # How far past edge Snoopy can be and still start jump.
     _MIN_GROUND_OVERLAP_TILES: float = 0.5  # Ground overlap needed to survive/land safely.
     _JUMP_START_GRACE_SECONDS: float = 0.18  # Small late-jump window after leaving ground.
+    _MARK_SCROLL_SPEED: float = 0.6  # Visual drift of conveyor marks (px/frame) before run speed scaling.
+    _STRIP_BASE_COLOR: tuple[int, int, int, int] = (128, 84, 44, 230)
+    _STRIP_MARK_COLOR: tuple[int, int, int, int] = (214, 181, 130, 235)
+    _STRIP_HEIGHT_SCALE: float = 2.0 / 3.0
 
     def _scaled_motion_speed(self, base_speed: float) -> float:
         return base_speed * self.speed_multiplier
 
-    def _player_hit_box_bounds(self, player_sprite: arcade.Sprite) -> tuple[float, float, float, float]:
-        hit_box_points = player_sprite.hit_box.points
-        min_x = min(point[0] for point in hit_box_points)
-        max_x = max(point[0] for point in hit_box_points)
-        min_y = min(point[1] for point in hit_box_points)
-        max_y = max(point[1] for point in hit_box_points)
-        return (
-            player_sprite.center_x + min_x,
-            player_sprite.center_x + max_x,
-            player_sprite.center_y + min_y,
-            player_sprite.center_y + max_y,
-        )
-
-    def _overlaps_zone(self, bounds: tuple[float, float, float, float], zone: tuple[float, float, float, float]) -> bool:
-        left, right, bottom, top = bounds
-        zone_left, zone_right, zone_bottom, zone_top = zone
-        return right > zone_left and left < zone_right and top > zone_bottom and bottom < zone_top
-
-    def _boost_zones(self) -> tuple[tuple[float, float, float, float], tuple[float, float, float, float]]:
-        level_height_tiles = 20
-        if self.level_bounds is not None:
-            _, _, _, world_top = self.level_bounds
-            level_height_tiles = max(1, int(round(world_top / self._TILE_PX)))
-
-        strip_bottom = float((level_height_tiles - (self._GROUND_TOP_ROW_FROM_TOP + 1)) * self._TILE_PX)
-        strip_top = strip_bottom + float(self._TILE_PX)
-
-        left_strip = (
-            float((self._GAP_START_COL - self._STRIP_WIDTH_TILES) * self._TILE_PX),
-            float(self._GAP_START_COL * self._TILE_PX),
-            strip_bottom,
-            strip_top,
-        )
-        right_strip = (
-            float((self._GAP_END_COL + 1) * self._TILE_PX),
-            float((self._GAP_END_COL + 1 + self._STRIP_WIDTH_TILES) * self._TILE_PX),
-            strip_bottom,
-            strip_top,
-        )
-        return left_strip, right_strip
-
     def resolve_horizontal_change_x(
         self,
         base_change_x: float,
@@ -398,14 +332,12 @@ class Level8Hook(LevelHook):
         if not is_grounded:
             return base_change_x
 
-        player_bounds = self._player_hit_box_bounds(player_sprite)
-        for zone in self._boost_zones():
-            if self._overlaps_zone(player_bounds, zone):
-                boosted_change_x = base_change_x + self._scaled_motion_speed(self._STRIP_GLIDE_SPEED)
-                if base_change_x > 0:
-                    boosted_change_x += self._scaled_motion_speed(self._STRIP_FORWARD_BONUS)
-                return boosted_change_x
-        return base_change_x
+        if self.triggers is None or self.triggers.overlapping(hit_box_bounds(player_sprite), TRIGGER_BOOST) is None:
+            return base_change_x
+        boosted_change_x = base_change_x + self._scaled_motion_speed(self._STRIP_GLIDE_SPEED)
+        if base_change_x > 0:
+            boosted_change_x += self._scaled_motion_speed(self._STRIP_FORWARD_BONUS)
+        return boosted_change_x
 
     def resolve_jump_committed_change_x(
         self,
@@ -424,7 +356,7 @@ class Level8Hook(LevelHook):
         return self._MIN_GROUND_OVERLAP_TILES
 
     def can_start_jump(self, player_sprite: arcade.Sprite) -> bool:
-        player_left, player_right, _, _ = self._player_hit_box_bounds(player_sprite)
+        player_left, player_right, _, _ = hit_box_bounds(player_sprite)
         gap_start_x = float(self._GAP_START_COL * self._TILE_PX)
         gap_end_x = float((self._GAP_END_COL + 1) * self._TILE_PX)
 
@@ -439,42 +371,94 @@ class Level8Hook(LevelHook):
     def jump_start_grace_seconds(self) -> float:
         return self._JUMP_START_GRACE_SECONDS
 
-    def draw(self):
-        strip_base_color = (128, 84, 44, 230)
-        strip_mark_color = (214, 181, 130, 235)
-        strip_height_scale = 2.0 / 3.0
-
-        for zone in self._boost_zones():
-            left, right, bottom, top = zone
-            conveyor_top = bottom + ((top - bottom) * strip_height_scale)
-            font_size = int(self._TILE_PX * 0.35)
-            edge_padding = self._TILE_PX * 0.2
+    def setup(
+        self,
+        physics_engine: GridPhysicsEngine,
+        level_bounds: tuple[float, float, float, float] | None = None,
+        triggers: TriggerVolumes | None = None,
+    ):
+        super().setup(physics_engine, level_bounds, triggers)
+        self._build_conveyor_sprites()
+
+    def _build_conveyor_sprites(self) -> None:
+        """Build the conveyor strips and their marks once; `update` only scrolls marks."""
+        self._conveyor_strips = arcade.SpriteList()
+        self._conveyor_marks = arcade.SpriteList()
+        self._mark_lanes: list[tuple[float, float, float]] = []  # (marks_left, marks_right, step)
+        self._mark_base_x: list[float] = []
+        self._mark_scroll_offset = 0.0
+
+        font_size = int(self._TILE_PX * 0.35)
+        edge_padding = self._TILE_PX * 0.2
+        mark_texture, (mark_offset_x, mark_offset_y) = render_text_texture(
+            ">",
+            self._STRIP_MARK_COLOR,
+            font_size,
+            bold=True,
+        )
+        self._mark_offset_x = mark_offset_x
+
+        boost_zones = [] if self.triggers is None else self.triggers.of_kind(TRIGGER_BOOST)
+        for zone in boost_zones:
+            left, right, bottom, top = zone.left, zone.right, zone.bottom, zone.top
+            conveyor_top = bottom + ((top - bottom) * self._STRIP_HEIGHT_SCALE)
+            strip = arcade.SpriteSolidColor(
+                width=int(round(right - left)),
+                height=int(round(conveyor_top - bottom)),
+                color=self._STRIP_BASE_COLOR,
+            )
+            strip.center_x = (left + right) / 2
+            strip.center_y = (bottom + conveyor_top) / 2
+            self._conveyor_strips.append(strip)
+
             marks_left = left + edge_padding
             marks_right = right - edge_padding
             marks_width = max(0.0, marks_right - marks_left)
-            marks_count = max(3, int(marks_width / (font_size * 1.8)))
-            arcade.draw_lrbt_rectangle_filled(
-                left,
-                right,
-                bottom,
-                conveyor_top,
-                strip_base_color,
-            )
             if marks_width <= 0:
                 continue
+            marks_count = max(3, int(marks_width / (font_size * 1.8)))
             step = marks_width / marks_count
-            for mark_index in range(marks_count):
-                mark_x = marks_left + ((mark_index + 0.5) * step)
-                arcade.draw_text(
-                    ">",
-                    mark_x,
-                    bottom + ((conveyor_top - bottom) * 0.22),
-                    strip_mark_color,
-                    font_size=font_size,
-                    bold=True,
-                    anchor_x="center",
-                    anchor_y="baseline",
-                )
+            baseline_y = bottom + ((conveyor_top - bottom) * 0.22)
+            # One extra mark enters from the left edge while the last one leaves on the right.
+            for mark_index in range(marks_count + 1):
+                mark = arcade.Sprite(mark_texture)
+                mark.center_y = baseline_y + mark_offset_y
+                self._conveyor_marks.append(mark)
+                self._mark_lanes.append((marks_left, marks_right, step))
+                self._mark_base_x.append(marks_left + ((mark_index - 0.5) * step))
+        self._apply_mark_scroll()
+
+    def _apply_mark_scroll(self) -> None:
+        for mark, (marks_left, marks_right, step), base_x in zip(
+            self._conveyor_marks,
+            self._mark_lanes,
+            self._mark_base_x,
+        ):
+            mark_x = base_x + (self._mark_scroll_offset % step)
+            mark.center_x = mark_x + self._mark_offset_x
+            mark.visible = marks_left <= mark_x <= marks_right
+
+    STATE_FIELDS: tuple[str, ...] = ("mark_scroll_offset",)
+
+    def capture_state(self, out: array) -> None:
+        out.append(self._mark_scroll_offset)
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self._mark_scroll_offset = values[offset]
+        self._apply_mark_scroll()
+        return offset + 1
+
+    def update(self):
+        if self.physics_engine is None:
+            return
+        self._mark_scroll_offset += self._scaled_motion_speed(self._MARK_SCROLL_SPEED)
+        self._apply_mark_scroll()
+
+    def draw(self):
+        if self.physics_engine is None:
+            return
+        self._conveyor_strips.draw()
+        self._conveyor_marks.draw()
 
 
 class Level9Hook(LevelHook):
@@ -511,7 +495,11 @@ def get_default_levels() -> list[LevelSpec]:
             map_path="../assets/level2.json",
             required_object_names=("moving_hazard",),
         ),
-        LevelSpec(name="Level 3", map_path="../assets/level3.json", hook_factory=Level3Hook),
+        LevelSpec(
+            name="Level 3",
+            map_path="../assets/level3.json",
+            required_object_names=("scrolling_platform",),
+        ),
         LevelSpec(
             name="Level 4",
             map_path="../assets/level4.json",
@@ -522,9 +510,26 @@ def get_default_levels() -> list[LevelSpec]:
             map_path="../assets/level5.json",
             required_object_names=("skull_hazard",),
         ),
-        LevelSpec(name="Level 6", map_path="../assets/level6.json", hook_factory=Level6Hook),
-        LevelSpec(name="Level 7", map_path="../assets/level7.json", hook_factory=Level7Hook),
-        LevelSpec(name="Level 8", map_path="../assets/level8.json", hook_factory=Level8Hook),
+        LevelSpec(
+            name="Level 6",
+            map_path="../assets/level6.json",
+            required_object_names=("scrolling_platform",),
+        ),
+        LevelSpec(
+            name="Level 7",
+            map_path="../assets/level7.json",
+            required_object_names=("trigger",),
+            hook_factory=Level7Hook,
+            background_path="../assets/images/doghouse_long.png",
+            tall_background=True,
+            hide_obstacles=True,
+        ),
+        LevelSpec(
+            name="Level 8",
+            map_path="../assets/level8.json",
+            required_object_names=("trigger",),
+            hook_factory=Level8Hook,
+        ),
         LevelSpec(
             name="Level 9",
             map_path="../assets/level9.json",
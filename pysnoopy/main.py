@@ -14,13 +14,22 @@ if __package__ in (None, ""):
         sys.path.insert(0, str(project_root))
     from pysnoopy.globals import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
     from pysnoopy.game_state import GameState
+    from pysnoopy.heatmap import DEFAULT_HEATMAP_DIR, DeathHeatmap, session_heatmap_path
+    from pysnoopy.pacing import FramePacingSettings, PacedWindow, load_pacing_config
+    from pysnoopy.replay import ReplayRecorder
     from pysnoopy.views import GameView, TitleView
 else:
     from .globals import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH
     from .game_state import GameState
+    from .heatmap import DEFAULT_HEATMAP_DIR, DeathHeatmap, session_heatmap_path
+    from .pacing import FramePacingSettings, PacedWindow, load_pacing_config
+    from .replay import ReplayRecorder
     from .views import GameView, TitleView
 
 
+DEFAULT_GHOST_DIR = Path.home() / ".pysnoopy" / "ghosts"
+
+
 def _parse_args(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(description="Run pySNOOPY")
     parser.add_argument(
@@ -35,25 +44,127 @@ def _parse_args(argv: list[str] | None = None):
         default=0,
         help="Apply the end-of-loop speed boost N times before starting.",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for all gameplay and visual randomness (random when omitted).",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        help="Record a replay (seed, inputs and per-step state hashes). A .json path is written on exit; "
+        "any other path is streamed as a binary trace with sampled state.",
+    )
+    parser.add_argument(
+        "--fixed-point",
+        action="store_true",
+        help="Quantize speeds, gravity and motion to 1/256 px for bit-exact runs across machines.",
+    )
+    parser.add_argument(
+        "--ghost-dir",
+        type=Path,
+        default=DEFAULT_GHOST_DIR,
+        help=f"Where best-clear ghosts are stored (default: {DEFAULT_GHOST_DIR}).",
+    )
+    parser.add_argument(
+        "--no-ghosts",
+        action="store_true",
+        help="Do not record or show best-clear ghosts.",
+    )
+    parser.add_argument(
+        "--heatmap-dir",
+        type=Path,
+        default=DEFAULT_HEATMAP_DIR,
+        help=f"Where the death heatmap of each session is written (default: {DEFAULT_HEATMAP_DIR}).",
+    )
+    parser.add_argument(
+        "--no-heatmaps",
+        action="store_true",
+        help="Do not record where and why the player dies.",
+    )
+    parser.add_argument(
+        "--update-rate",
+        type=float,
+        default=None,
+        help="Window update rate in Hz (input polling; the simulation always steps at 60 Hz).",
+    )
+    parser.add_argument(
+        "--draw-rate",
+        type=float,
+        default=None,
+        help="Target draw rate in Hz; must not exceed the update rate.",
+    )
+    parser.add_argument(
+        "--vsync",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Synchronize buffer flips with the display refresh.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        default=None,
+        help="Uncapped update/draw rates, vsync off, no draw skipping; prints FPS every few seconds.",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=None,
+        help="JSON file with pacing options (update_rate, draw_rate, vsync, benchmark, "
+        "skip_draws_over_budget); command line flags take precedence.",
+    )
     args = parser.parse_args(argv)
     if args.start_level is not None and args.start_level < 1:
         parser.error("--start-level must be >= 1")
     if args.speed < 0:
         parser.error("--speed must be >= 0")
+    # main changes into the package directory; relative output paths are meant from here.
+    if args.record is not None:
+        args.record = args.record.resolve()
+    args.ghost_dir = args.ghost_dir.resolve()
+    args.heatmap_dir = args.heatmap_dir.resolve()
+    try:
+        args.pacing = _pacing_settings(args)
+    except (OSError, ValueError, TypeError) as error:
+        parser.error(str(error))
     return args
 
 
+def _pacing_settings(args: argparse.Namespace) -> FramePacingSettings:
+    options = {} if args.config is None else load_pacing_config(args.config)
+    for name in ("update_rate", "draw_rate", "vsync", "benchmark"):
+        value = getattr(args, name)
+        if value is not None:
+            options[name] = value
+    return FramePacingSettings(**options)
+
+
 def main(argv: list[str] | None = None):
     args = _parse_args(argv)
     file_path = os.path.dirname(os.path.abspath(__file__))
     os.chdir(file_path)
     start_level = 1 if args.start_level is None else args.start_level
 
-    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    window = PacedWindow(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, args.pacing)
     game_state = GameState(
         start_level=start_level,
         starting_speed_rounds=args.speed,
+        seed=args.seed,
+        fixed_point=args.fixed_point,
+        ghost_dir=None if args.no_ghosts else args.ghost_dir,
+        death_heatmap=None if args.no_heatmaps else DeathHeatmap(),
     )
+    if args.record is not None:
+        assert game_state.seed is not None
+        game_state.replay_recorder = ReplayRecorder(
+            seed=game_state.seed,
+            start_level=start_level,
+            starting_speed_rounds=args.speed,
+            trace_path=None if args.record.suffix == ".json" else args.record,
+            fixed_point=args.fixed_point,
+        )
 
     start_view: arcade.View
     if args.start_level is not None:
@@ -69,6 +180,20 @@ def main(argv: list[str] | None = None):
 
     arcade.run()
 
+    if game_state.replay_recorder is not None:
+        game_state.replay_recorder.close()
+        if game_state.replay_recorder.trace_writer is None:
+            game_state.replay_recorder.write(args.record)
+        print(f"REPLAY={args.record}")
+    if game_state.death_heatmap is not None and len(game_state.death_heatmap) > 0:
+        heatmap_path = session_heatmap_path(args.heatmap_dir)
+        try:
+            game_state.death_heatmap.write(heatmap_path)
+        except OSError as error:
+            print(f"[heatmap warning] could not save death heatmap: {error}")
+        else:
+            print(f"DEATH_HEATMAP={heatmap_path}")
+
 
 if __name__ == "__main__":
     main()
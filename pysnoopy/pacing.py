@@ -0,0 +1,230 @@
+"""Frame pacing settings and a window that sheds draws under load.
+
+Simulation time is advanced by fixed steps inside `GameView.on_update`, so the
+window rates only decide how often input is polled and frames are presented.
+When the update work of a frame plus a draw would run over the frame budget,
+`PacedWindow` skips that draw (never an update), which lets slow machines keep
+gameplay at full speed while showing fewer frames. Only the time spent in
+updates and draws counts, never the event loop waiting for the next frame.
+
+    python -m pysnoopy.pacing --check
+
+runs `DrawSkipPolicy` on a fake clock and fails if a lightly loaded frame
+loop skips draws or an overloaded one never does.
+"""
+import argparse
+import json
+import time
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Callable
+
+import arcade
+import pyglet
+
+# Rate used for both updates and draws in benchmark mode (effectively uncapped).
+BENCHMARK_RATE_HZ = 1000.0
+BENCHMARK_REPORT_SECONDS = 5.0
+# Draw at least every N+1 frames even when every frame is over budget.
+MAX_CONSECUTIVE_SKIPPED_DRAWS = 3
+_CHECK_FRAMES = 600
+
+
+@dataclass
+class FramePacingSettings:
+    """Window timing options; rates are in Hz."""
+
+    update_rate: float = 60.0
+    draw_rate: float = 60.0
+    vsync: bool = False
+    benchmark: bool = False
+    skip_draws_over_budget: bool = True
+
+    def __post_init__(self) -> None:
+        if self.update_rate <= 0 or self.draw_rate <= 0:
+            raise ValueError("update_rate and draw_rate must be positive")
+        if self.draw_rate > self.update_rate:
+            raise ValueError("draw_rate cannot be higher than update_rate")
+
+    @property
+    def effective_update_rate(self) -> float:
+        return BENCHMARK_RATE_HZ if self.benchmark else self.update_rate
+
+    @property
+    def effective_draw_rate(self) -> float:
+        return BENCHMARK_RATE_HZ if self.benchmark else self.draw_rate
+
+    @property
+    def effective_vsync(self) -> bool:
+        return self.vsync and not self.benchmark
+
+
+def load_pacing_config(path: str | Path) -> dict[str, Any]:
+    """Read pacing options from a JSON object; unknown keys are rejected."""
+    with open(path, "r", encoding="utf-8") as file_handle:
+        raw_config = json.load(file_handle)
+    if not isinstance(raw_config, dict):
+        raise ValueError(f"{path}: config must be a JSON object")
+    known_keys = {field.name for field in fields(FramePacingSettings)}
+    unknown_keys = sorted(set(raw_config) - known_keys)
+    if unknown_keys:
+        raise ValueError(f"{path}: unknown config keys: {', '.join(unknown_keys)}")
+    return raw_config
+
+
+class DrawSkipPolicy:
+    """Decide per frame whether to draw, from the time spent in updates and draws only.
+
+    `PacedWindow` times every update dispatch and draw with ``clock`` and
+    reports them through `time_update` and `time_draw`.
+    """
+
+    __slots__ = ("enabled", "frame_budget", "clock", "update_seconds", "last_draw_seconds", "consecutive_skips")
+
+    def __init__(self, frame_budget: float, enabled: bool = True, clock: Callable[[], float] = time.perf_counter):
+        self.enabled = enabled
+        self.frame_budget = frame_budget
+        self.clock = clock
+        self.update_seconds = 0.0  # update work since the last draw or skip
+        self.last_draw_seconds = 0.0
+        self.consecutive_skips = 0
+
+    def time_update(self, update: Callable[[], None]) -> None:
+        start = self.clock()
+        update()
+        self.update_seconds += self.clock() - start
+
+    def should_skip_draw(self) -> bool:
+        """True when this frame's update work plus the last draw's duration exceeds the frame budget."""
+        if not self.enabled or self.consecutive_skips >= MAX_CONSECUTIVE_SKIPPED_DRAWS:
+            return False
+        return self.update_seconds + self.last_draw_seconds > self.frame_budget
+
+    def time_draw(self, draw: Callable[[], None]) -> bool:
+        """Run ``draw`` unless the frame is over budget; return whether it ran."""
+        skip = self.should_skip_draw()
+        if skip:
+            self.consecutive_skips += 1
+        else:
+            start = self.clock()
+            draw()
+            self.last_draw_seconds = self.clock() - start
+            self.consecutive_skips = 0
+        self.update_seconds = 0.0
+        return not skip
+
+
+class PacedWindow(arcade.Window):
+    """Arcade window that skips draws while frames run over budget."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        title: str,
+        pacing: FramePacingSettings,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        super().__init__(
+            width,
+            height,
+            title,
+            update_rate=1 / pacing.effective_update_rate,
+            draw_rate=1 / pacing.effective_draw_rate,
+            vsync=pacing.effective_vsync,
+        )
+        self.pacing = pacing
+        self._clock = clock
+        self.skip_policy = DrawSkipPolicy(
+            1 / pacing.effective_draw_rate,
+            enabled=pacing.skip_draws_over_budget and not pacing.benchmark,
+            clock=clock,
+        )
+        self.drawn_frames = 0
+        self.skipped_draws = 0
+        if pacing.benchmark:
+            self._report_start = clock()
+            self._report_drawn_frames = 0
+            pyglet.clock.schedule_interval(self._report_benchmark, BENCHMARK_REPORT_SECONDS)
+
+    def _dispatch_updates(self, delta_time: float) -> None:
+        # arcade's per-frame update dispatch; timed here so idle waits between frames never count.
+        self.skip_policy.time_update(lambda: super(PacedWindow, self)._dispatch_updates(delta_time))
+
+    def draw(self, dt: float) -> None:
+        if self.skip_policy.time_draw(lambda: super(PacedWindow, self).draw(dt)):
+            self.drawn_frames += 1
+        else:
+            self.skipped_draws += 1
+
+    def _report_benchmark(self, _delta_time: float) -> None:
+        now = self._clock()
+        elapsed = max(1e-9, now - self._report_start)
+        frames = self.drawn_frames - self._report_drawn_frames
+        print(f"BENCHMARK fps={frames / elapsed:.1f} last_draw_ms={self.skip_policy.last_draw_seconds * 1000:.2f}")
+        self._report_start = now
+        self._report_drawn_frames = self.drawn_frames
+
+
+def skipped_draws_on_fake_clock(
+    update_seconds: float,
+    draw_seconds: float,
+    frame_seconds: float = 1 / 60,
+    frames: int = _CHECK_FRAMES,
+) -> int:
+    """Draws `DrawSkipPolicy` skips in a frame loop where each frame spends the given work and then idles."""
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    def work(seconds: float) -> Callable[[], None]:
+        def run() -> None:
+            nonlocal now
+            now += seconds
+        return run
+
+    policy = DrawSkipPolicy(frame_seconds, clock=clock)
+    skipped = 0
+    for frame in range(frames):
+        now = frame * frame_seconds  # the event loop waits for the next frame
+        policy.time_update(work(update_seconds))
+        if not policy.time_draw(work(draw_seconds)):
+            skipped += 1
+    return skipped
+
+
+def check_skip_policy() -> list[str]:
+    """Problems of `DrawSkipPolicy` on a fake 60 Hz clock, empty when it behaves."""
+    problems = []
+    light = skipped_draws_on_fake_clock(update_seconds=0.002, draw_seconds=0.001)
+    if light:
+        problems.append(f"lightly loaded frames (3 ms of work) skipped {light} of {_CHECK_FRAMES} draws")
+    heavy = skipped_draws_on_fake_clock(update_seconds=0.012, draw_seconds=0.008)
+    if not heavy:
+        problems.append("overloaded frames (20 ms of work) never skipped a draw")
+    if heavy > _CHECK_FRAMES * MAX_CONSECUTIVE_SKIPPED_DRAWS // (MAX_CONSECUTIVE_SKIPPED_DRAWS + 1):
+        problems.append(f"overloaded frames skipped {heavy} draws, more than MAX_CONSECUTIVE_SKIPPED_DRAWS allows")
+    return problems
+
+
+def _parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Check the pySNOOPY draw skip policy on a fake clock")
+    parser.add_argument("--check", action="store_true", help="Run the fake-clock checks; exit 1 on a problem.")
+    args = parser.parse_args(argv)
+    if not args.check:
+        parser.error("nothing to do; pass --check")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    _parse_args(argv)
+    problems = check_skip_policy()
+    for problem in problems:
+        print(problem)
+    print("FAILED" if problems else "OK: light load never skips, overload skips within the limit")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,379 @@
+"""Tile-grid platformer physics for the player.
+
+`GridPhysicsEngine` replaces `arcade.PhysicsEnginePlatformer` for the view:
+gravity, moving platforms, `can_jump`/`jump` and the same move-and-resolve
+steps (``y`` first with 0.25 px landing resolution, then a binary search on
+``x`` with ramp-up), so recorded replays play out identically. What changes is
+the collision query. Arcade tests the player against every ``ground`` tile
+and moves the sprite for every probe; this engine buckets the static tiles
+into a grid of tile-sized cells once, probes positions without moving the
+sprite, and drops candidates by bounding box before the exact polygon test.
+
+The bounding-box test is only used along an axis on which the tile hit box has
+an edge: arcade's separating-axis test checks that axis too, so both reject
+the same tiles. Anything else goes through `are_polygons_intersecting`.
+
+Platform sprites with a true ``one_way`` attribute only hold the player from
+above: they are ignored while moving sideways or up, and land the player only
+when its hit box bottom was at or above their top before the step. The player
+does not rotate, so arcade's rotation step is not part of the move.
+"""
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+import arcade
+from arcade.geometry import are_polygons_intersecting
+
+# Arcade's circle pre-check: half the diagonal of the larger sprite sides.
+_RADIUS_FACTOR = 0.71
+_LANDING_RESOLUTION_PX = 0.25
+
+
+@dataclass(slots=True)
+class _GridTile:
+    sprite: arcade.BasicSprite
+    order: int
+    points: tuple[tuple[float, float], ...]
+    left: float
+    right: float
+    bottom: float
+    top: float
+    center_x: float
+    center_y: float
+    extent: float
+    # Whether the hit box has a vertical / horizontal edge, i.e. arcade tests that axis.
+    reject_x: bool
+    reject_y: bool
+
+
+class _PlayerProbe:
+    """Hit box of the player at any position, computed exactly as arcade's `RotatableHitBox`."""
+
+    __slots__ = ("hit_box", "points", "left", "right", "bottom", "top", "extent", "_position", "_points_at")
+
+    def __init__(self, sprite: arcade.Sprite):
+        hit_box = sprite.hit_box
+        self.hit_box = hit_box
+        scale_x, scale_y = hit_box.scale
+        points = []
+        for x, y in hit_box.points:
+            points.append((x * scale_x, y * scale_y))
+        self.points = points
+        self.left = min(x for x, _ in points)
+        self.right = max(x for x, _ in points)
+        self.bottom = min(y for _, y in points)
+        self.top = max(y for _, y in points)
+        self.extent = max(sprite.width, sprite.height)
+        self._position: tuple[float, float] | None = None
+        self._points_at: list[tuple[float, float]] = []
+
+    def points_at(self, x: float, y: float) -> list[tuple[float, float]]:
+        """Adjusted hit box points with the player at ``(x, y)``; the last position is cached."""
+        if self._position != (x, y):
+            self._position = (x, y)
+            self._points_at = [(point_x + x, point_y + y) for point_x, point_y in self.points]
+        return self._points_at
+
+
+def _axis_edges(points: tuple[tuple[float, float], ...]) -> tuple[bool, bool]:
+    vertical = horizontal = False
+    for index, (x1, y1) in enumerate(points):
+        x2, y2 = points[(index + 1) % len(points)]
+        vertical = vertical or (x1 == x2 and y1 != y2)
+        horizontal = horizontal or (y1 == y2 and x1 != x2)
+    return vertical, horizontal
+
+
+def _within_radius(x: float, y: float, extent: float, other_x: float, other_y: float, other_extent: float) -> bool:
+    """Arcade's cheap rejection before the polygon test (`_check_for_collision`)."""
+    radius_sum = (extent + other_extent) * _RADIUS_FACTOR
+    radius_sum_sq = radius_sum * radius_sum
+    diff_x = x - other_x
+    diff_x_sq = diff_x * diff_x
+    if diff_x_sq > radius_sum_sq:
+        return False
+    diff_y = y - other_y
+    diff_y_sq = diff_y * diff_y
+    return diff_y_sq <= radius_sum_sq and diff_x_sq + diff_y_sq <= radius_sum_sq
+
+
+def _sprite_hit(probe: _PlayerProbe, x: float, y: float, sprite: arcade.BasicSprite) -> bool:
+    return _within_radius(
+        x, y, probe.extent, sprite.center_x, sprite.center_y, max(sprite.width, sprite.height)
+    ) and are_polygons_intersecting(probe.points_at(x, y), sprite.hit_box.get_adjusted_points())
+
+
+def _move_platform(platform: arcade.Sprite) -> None:
+    if platform.change_x == 0 and platform.change_y == 0:
+        return
+    if platform.boundary_left is not None and platform.left <= platform.boundary_left:
+        platform.left = platform.boundary_left
+        if platform.change_x < 0:
+            platform.change_x *= -1
+    if platform.boundary_right is not None and platform.right >= platform.boundary_right:
+        platform.right = platform.boundary_right
+        if platform.change_x > 0:
+            platform.change_x *= -1
+    platform.center_x += platform.change_x
+    if platform.boundary_top is not None and platform.top >= platform.boundary_top:
+        platform.top = platform.boundary_top
+        if platform.change_y > 0:
+            platform.change_y *= -1
+    if platform.boundary_bottom is not None and platform.bottom <= platform.boundary_bottom:
+        platform.bottom = platform.boundary_bottom
+        if platform.change_y < 0:
+            platform.change_y *= -1
+    platform.center_y += platform.change_y
+
+
+class GridPhysicsEngine:
+    """Player physics against static ``walls`` on a grid and moving ``platforms``.
+
+    Walls must not move after the engine is built; moving sprites belong in
+    ``platforms``, which the engine moves by their ``change_x``/``change_y``
+    within their ``boundary_*`` values every update.
+    """
+
+    def __init__(
+        self,
+        player_sprite: arcade.Sprite,
+        gravity_constant: float = 0.5,
+        walls: arcade.SpriteList | None = None,
+        platforms: arcade.SpriteList | None = None,
+    ):
+        self.player_sprite = player_sprite
+        self.gravity_constant = gravity_constant
+        self.platforms: list[arcade.SpriteList] = [] if platforms is None else [platforms]
+        self.jumps_since_ground = 0
+        self.allowed_jumps = 1
+        self.allow_multi_jump = False
+        self._tiles: list[_GridTile] = []
+        self._tile_by_sprite: dict[int, _GridTile] = {}
+        # Tiles by grid column of their left edge, each column sorted by tile bottom.
+        self._columns: dict[int, tuple[list[float], list[_GridTile]]] = {}
+        self._cell_size = 1.0
+        self._max_tile_width = 0.0
+        self._max_tile_height = 0.0
+        self._probe: _PlayerProbe | None = None
+        if walls is not None:
+            self._build_grid(walls)
+
+    def _build_grid(self, walls: arcade.SpriteList) -> None:
+        for order, sprite in enumerate(walls):
+            points = tuple(sprite.hit_box.get_adjusted_points())
+            reject_x, reject_y = _axis_edges(points)
+            tile = _GridTile(
+                sprite,
+                order,
+                points,
+                min(x for x, _ in points),
+                max(x for x, _ in points),
+                min(y for _, y in points),
+                max(y for _, y in points),
+                sprite.center_x,
+                sprite.center_y,
+                max(sprite.width, sprite.height),
+                reject_x,
+                reject_y,
+            )
+            self._tiles.append(tile)
+            self._tile_by_sprite[id(sprite)] = tile
+        self._cell_size = max((tile.extent for tile in self._tiles), default=1.0)
+        self._max_tile_width = max((tile.right - tile.left for tile in self._tiles), default=0.0)
+        self._max_tile_height = max((tile.top - tile.bottom for tile in self._tiles), default=0.0)
+        columns: dict[int, list[_GridTile]] = {}
+        for tile in self._tiles:
+            columns.setdefault(math.floor(tile.left / self._cell_size), []).append(tile)
+        for column, tiles in columns.items():
+            tiles.sort(key=lambda tile: tile.bottom)
+            self._columns[column] = ([tile.bottom for tile in tiles], tiles)
+
+    def _player_probe(self) -> _PlayerProbe:
+        # The player gets a new hit box whenever its texture changes.
+        player = self.player_sprite
+        if self._probe is None or self._probe.hit_box is not player.hit_box:
+            self._probe = _PlayerProbe(player)
+        return self._probe
+
+    def _tile_hit(self, probe: _PlayerProbe, x: float, y: float, tile: _GridTile) -> bool:
+        if tile.reject_x and (probe.right + x <= tile.left or tile.right <= probe.left + x):
+            return False
+        if tile.reject_y and (probe.top + y <= tile.bottom or tile.top <= probe.bottom + y):
+            return False
+        if not _within_radius(x, y, probe.extent, tile.center_x, tile.center_y, tile.extent):
+            return False
+        return are_polygons_intersecting(probe.points_at(x, y), tile.points)
+
+    def _wall_hits(self, probe: _PlayerProbe, x: float, y: float) -> list[arcade.BasicSprite]:
+        # Every tile whose bounding box touches the player's: left edge and bottom within reach.
+        size = self._cell_size
+        lowest_bottom = probe.bottom + y - self._max_tile_height
+        highest_bottom = probe.top + y
+        hits = []
+        first_column = math.floor((probe.left + x - self._max_tile_width) / size)
+        for column in range(first_column, math.floor((probe.right + x) / size) + 1):
+            entry = self._columns.get(column)
+            if entry is None:
+                continue
+            bottoms, tiles = entry
+            for index in range(bisect_left(bottoms, lowest_bottom), bisect_right(bottoms, highest_bottom)):
+                if self._tile_hit(probe, x, y, tiles[index]):
+                    hits.append(tiles[index])
+        if len(hits) > 1:
+            hits.sort(key=lambda tile: tile.order)
+        return [tile.sprite for tile in hits]
+
+    def _hits_at(
+        self,
+        probe: _PlayerProbe,
+        x: float,
+        y: float,
+        landing_bottom: float | None = None,
+    ) -> list[arcade.BasicSprite]:
+        """Walls and platforms the player would touch at ``(x, y)``, in arcade's order.
+
+        One-way platforms count only when ``landing_bottom`` (the player bottom
+        they may hold) is given and at or above their top.
+        """
+        hits = self._wall_hits(probe, x, y)
+        for platform_list in self.platforms:
+            for platform in platform_list:
+                if getattr(platform, "one_way", False) and (landing_bottom is None or landing_bottom < platform.top):
+                    continue
+                if _sprite_hit(probe, x, y, platform):
+                    hits.append(platform)
+        return hits
+
+    def _hits_sprite(self, probe: _PlayerProbe, x: float, y: float, sprite: arcade.BasicSprite) -> bool:
+        tile = self._tile_by_sprite.get(id(sprite))
+        if tile is not None:
+            return self._tile_hit(probe, x, y, tile)
+        return _sprite_hit(probe, x, y, sprite)
+
+    def can_jump(self, y_distance: float = 5) -> bool:
+        """True when the player stands within ``y_distance`` above a wall or platform."""
+        player = self.player_sprite
+        probe = self._player_probe()
+        x, y = player.position
+        probe_y = y - y_distance
+        grounded = bool(self._hits_at(probe, x, probe_y, probe.bottom + y))
+        # Arcade moves the sprite down and back up; keep the same float round trip.
+        player.center_y = probe_y + y_distance
+        if grounded:
+            self.jumps_since_ground = 0
+        return grounded or (self.allow_multi_jump and self.jumps_since_ground < self.allowed_jumps)
+
+    def jump(self, velocity: float) -> None:
+        self.player_sprite.change_y = velocity
+        if self.allow_multi_jump:
+            self.jumps_since_ground += 1
+
+    def update(self) -> list[arcade.BasicSprite]:
+        """Apply gravity, move the platforms and then the player; return what the player touched."""
+        self.player_sprite.change_y -= self.gravity_constant
+        for platform_list in self.platforms:
+            for platform in platform_list:
+                _move_platform(platform)
+        return self._move_player()
+
+    def _move_player(self) -> list[arcade.BasicSprite]:
+        player = self.player_sprite
+        probe = self._player_probe()
+        x, y = player.position
+        if self._hits_at(probe, x, y):
+            x, y = self._wiggle_until_free(probe, x, y)
+        original_x, original_y = x, y
+        hit_list: list[arcade.BasicSprite] = []
+        x, y = self._move_y(probe, x, y, hit_list)
+        if player.change_x:
+            x, y = self._move_x(probe, original_x, original_y, y, hit_list)
+        player.position = x, y
+        return hit_list
+
+    def _wiggle_until_free(self, probe: _PlayerProbe, x: float, y: float) -> tuple[float, float]:
+        """Try the 8 neighbours at doubling distances until one is free (arcade's ``_wiggle_until_free``)."""
+        distance = 1
+        while True:
+            for offset_x, offset_y in ((0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)):
+                candidate_x = x + offset_x * distance if offset_x else x
+                candidate_y = y + offset_y * distance if offset_y else y
+                if not self._hits_at(probe, candidate_x, candidate_y):
+                    return candidate_x, candidate_y
+            distance *= 2
+
+    def _move_y(self, probe: _PlayerProbe, x: float, y: float, hit_list: list) -> tuple[float, float]:
+        player = self.player_sprite
+        change_y = player.change_y
+        landing_bottom = probe.bottom + y if change_y < 0 else None
+        y += change_y
+        hits = self._hits_at(probe, x, y, landing_bottom)
+        hit_list.extend(hits)
+        if hits:
+            if change_y > 0:
+                while self._hits_at(probe, x, y):
+                    y -= 1
+            elif change_y < 0:
+                for sprite in hits:
+                    while self._hits_sprite(probe, x, y, sprite):
+                        y += _LANDING_RESOLUTION_PX
+                    if getattr(sprite, "change_x", 0.0) != 0:
+                        x += sprite.change_x
+            player.change_y = min(0.0, getattr(hits[0], "change_y", 0.0))
+        return x, round(y, 2)
+
+    def _move_x(
+        self,
+        probe: _PlayerProbe,
+        original_x: float,
+        original_y: float,
+        y: float,
+        hit_list: list,
+    ) -> tuple[float, float]:
+        """Binary search for the furthest free ``x`` up to ``change_x``, stepping up ramps on the way."""
+        change_x = self.player_sprite.change_x
+        almost_original_y = y
+        direction = math.copysign(1, change_x)
+        cur_x_change = abs(change_x)
+        upper_bound = cur_x_change
+        lower_bound: float = 0
+        cur_y_change: float = 0
+        while True:
+            x = original_x + cur_x_change * direction
+            collisions = self._hits_at(probe, x, y)
+            hit_list.extend(sprite for sprite in collisions if sprite not in hit_list)
+            if not collisions:
+                lower_bound = cur_x_change
+                if upper_bound - lower_bound <= 0:
+                    break
+                cur_x_change = (upper_bound + lower_bound) // 2 + (upper_bound + lower_bound) % 2
+                continue
+            blocked, y, cur_y_change = self._ramp_up(probe, x, original_y, almost_original_y, cur_x_change)
+            if not blocked:
+                break
+            upper_bound = cur_x_change - 1
+            if upper_bound - lower_bound <= 0:
+                cur_x_change = lower_bound
+                break
+            cur_x_change = (upper_bound + lower_bound) // 2
+        return original_x + cur_x_change * direction, almost_original_y + cur_y_change
+
+    def _ramp_up(
+        self,
+        probe: _PlayerProbe,
+        x: float,
+        original_y: float,
+        almost_original_y: float,
+        cur_x_change: float,
+    ) -> tuple[bool, float, float]:
+        """Whether ``x`` stays blocked after stepping up, the probed ``y`` and the climb."""
+        cur_y_change = cur_x_change
+        y = original_y + cur_y_change
+        if self._hits_at(probe, x, y):
+            return True, y, cur_y_change - cur_x_change
+        collisions: list[arcade.BasicSprite] = []
+        while not collisions and cur_y_change > 0:
+            cur_y_change -= 1
+            y = almost_original_y + cur_y_change
+            collisions = self._hits_at(probe, x, y)
+        return False, y, cur_y_change + 1
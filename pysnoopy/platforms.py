@@ -0,0 +1,463 @@
+"""Moving platforms authored in Tiled: scrolling planks and path followers.
+
+Every ``scrolling_platform`` rectangle object of a Tiled map is one platform.
+The rectangle is the window the plank is visible in (its x span) and the
+plank's height band (its y span). Custom properties, in Tiled pixels like the
+object itself:
+
+- ``plate_width`` (required): plank width.
+- ``speed``: pixels per simulation step at run speed 1 (default 1.6).
+- ``direction``: ``right`` (default) or ``left``.
+- ``start_offset``: plank left edge at level start, relative to the window
+  left (default: just outside the window on the side it enters from).
+- ``color``: Tiled color (default wood brown).
+- ``min_support``: fraction of the player hit box width that must be on the
+  plank to stand on it; less is a `DEATH_PLATFORM_SUPPORT` death.
+
+A plank is drawn with two sprites clipped to the window, so the part leaving
+one side comes back in on the other and neither sprite ever reaches past the
+window edges. `ScrollingPlatforms` moves all platforms of a level with one
+step counter: their wrap schedules (`pysnoopy/timeline.py`) are computed once
+per level setup, so a step is a few multiplications per platform and seeking
+to any step costs the same.
+
+Every ``path_platform`` polyline object is a platform whose center follows the
+line. Properties: ``plate_width`` and ``plate_height`` (default one tile),
+``speed`` (pixels per step along the path, default 1.0), ``mode``
+(``ping_pong``, back and forth, or ``loop``, back to the first point),
+``easing`` (``linear`` or ``ease_in_out``, slowing down at the ends of each
+traversal), ``phase`` (fraction of the cycle done at level start), ``color``
+and ``one_way``. The platform center at every step of one cycle is sampled
+from an arc-length table of the line when the level is set up, so a step is
+one table lookup per platform. `PathPlatforms` moves the platforms before the
+physics step and carries a player standing on one by the same offset; the
+engine sees them at rest (no ``change_x``/``change_y``), so the player lands,
+walks and is blocked as on any other platform.
+"""
+import math
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+import arcade
+
+from .globals import SPRITE_PIXEL_SIZE, TILE_SCALING
+from .snapshots import StateValues
+from .timeline import scheduled_position, wrap_schedule
+
+DIRECTION_RIGHT = "right"
+DIRECTION_LEFT = "left"
+DEFAULT_PLATFORM_SPEED = 1.6
+DEFAULT_PLATFORM_COLOR = (139, 90, 43, 255)
+PATH_PING_PONG = "ping_pong"
+PATH_LOOP = "loop"
+EASING_LINEAR = "linear"
+EASING_IN_OUT = "ease_in_out"
+DEFAULT_PATH_SPEED = 1.0
+DEFAULT_PATH_COLOR = (63, 69, 210, 255)
+_OFF_SCREEN = -10000.0  # x of a sprite with no part inside its window
+_SUPPORT_VERTICAL_TOLERANCE = 8.0
+_RIDE_VERTICAL_TOLERANCE = 2.0  # landing resolution leaves the player up to 0.25 px above a platform
+
+
+@dataclass(frozen=True, slots=True)
+class ScrollingPlatformSpec:
+    window_left: float
+    window_right: float
+    center_y: float
+    height: float
+    plate_width: float
+    speed: float  # px per step at run speed 1
+    direction: str
+    start_left: float  # plank left edge at step 0
+    color: tuple[int, int, int, int] = DEFAULT_PLATFORM_COLOR
+    min_support_ratio: float | None = None
+
+
+def scrolling_platform_spec(obj: dict[str, Any], map_height: float) -> ScrollingPlatformSpec:
+    """Build the spec of a Tiled ``scrolling_platform`` object; raise ValueError when it is malformed."""
+    if "polygon" in obj or "ellipse" in obj:
+        raise ValueError("must be a rectangle")
+    x = float(obj.get("x", 0.0)) * TILE_SCALING
+    y = float(obj.get("y", 0.0)) * TILE_SCALING
+    width = float(obj.get("width", 0.0)) * TILE_SCALING
+    height = float(obj.get("height", 0.0)) * TILE_SCALING
+    if width <= 0 or height <= 0:
+        raise ValueError("must have positive width and height")
+
+    properties = _object_properties(obj)
+    if "plate_width" not in properties:
+        raise ValueError("needs a 'plate_width' property")
+    plate_width = _number_property(properties, "plate_width", 0.0) * TILE_SCALING
+    if not 0 < plate_width <= width:
+        raise ValueError("'plate_width' must be positive and fit the object width")
+    speed = _number_property(properties, "speed", DEFAULT_PLATFORM_SPEED)
+    if speed <= 0:
+        raise ValueError("'speed' must be positive")
+    direction = properties.get("direction", DIRECTION_RIGHT)
+    if direction not in (DIRECTION_RIGHT, DIRECTION_LEFT):
+        raise ValueError(f"'direction' must be {DIRECTION_RIGHT!r} or {DIRECTION_LEFT!r}")
+    default_offset = -plate_width if direction == DIRECTION_RIGHT else width
+    start_offset = _number_property(properties, "start_offset", default_offset / TILE_SCALING) * TILE_SCALING
+    min_support_ratio: float | None = None
+    if "min_support" in properties:
+        min_support_ratio = _number_property(properties, "min_support", 0.0)
+        if not 0 <= min_support_ratio <= 1:
+            raise ValueError("'min_support' must be between 0 and 1")
+
+    return ScrollingPlatformSpec(
+        window_left=x,
+        window_right=x + width,
+        center_y=map_height - y - height / 2,
+        height=height,
+        plate_width=plate_width,
+        speed=speed,
+        direction=direction,
+        start_left=x + start_offset,
+        color=_color_property(properties),
+        min_support_ratio=min_support_ratio,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class PathPlatformSpec:
+    points: tuple[tuple[float, float], ...]  # platform centers along the path
+    width: float
+    height: float
+    speed: float  # px per step along the path at run speed 1
+    mode: str  # PATH_PING_PONG or PATH_LOOP
+    easing: str  # one of EASINGS
+    phase: float  # fraction of the cycle done at step 0
+    color: tuple[int, int, int, int] = DEFAULT_PATH_COLOR
+    one_way: bool = False
+
+
+def _ease_in_out(t: float) -> float:
+    return t * t * (3.0 - 2.0 * t)
+
+
+EASINGS: dict[str, Callable[[float], float]] = {
+    EASING_LINEAR: lambda t: t,
+    EASING_IN_OUT: _ease_in_out,
+}
+
+
+def path_platform_spec(obj: dict[str, Any], map_height: float) -> PathPlatformSpec:
+    """Build the spec of a Tiled ``path_platform`` polyline; raise ValueError when it is malformed."""
+    polyline = obj.get("polyline")
+    if not isinstance(polyline, list) or len(polyline) < 2:
+        raise ValueError("must be a polyline with at least two points")
+    x = float(obj.get("x", 0.0))
+    y = float(obj.get("y", 0.0))
+    points = []
+    for point in polyline:
+        if not isinstance(point, dict):
+            raise ValueError("has a malformed polyline point")
+        points.append((
+            (x + float(point.get("x", 0.0))) * TILE_SCALING,
+            map_height - (y + float(point.get("y", 0.0))) * TILE_SCALING,
+        ))
+    if ArcLengthTable(points).length <= 0:
+        raise ValueError("must have a polyline of positive length")
+
+    properties = _object_properties(obj)
+    width = _number_property(properties, "plate_width", 3 * SPRITE_PIXEL_SIZE) * TILE_SCALING
+    height = _number_property(properties, "plate_height", SPRITE_PIXEL_SIZE) * TILE_SCALING
+    if width < 1 or height < 1:
+        raise ValueError("'plate_width' and 'plate_height' must be at least 1")
+    speed = _number_property(properties, "speed", DEFAULT_PATH_SPEED)
+    if speed <= 0:
+        raise ValueError("'speed' must be positive")
+    mode = properties.get("mode", PATH_PING_PONG)
+    if mode not in (PATH_PING_PONG, PATH_LOOP):
+        raise ValueError(f"'mode' must be {PATH_PING_PONG!r} or {PATH_LOOP!r}")
+    easing = properties.get("easing", EASING_LINEAR)
+    if easing not in EASINGS:
+        raise ValueError(f"'easing' must be one of {', '.join(EASINGS)}")
+    phase = _number_property(properties, "phase", 0.0)
+    if not 0 <= phase < 1:
+        raise ValueError("'phase' must be at least 0 and below 1")
+
+    return PathPlatformSpec(
+        points=tuple(points),
+        width=width,
+        height=height,
+        speed=speed,
+        mode=mode,
+        easing=easing,
+        phase=phase,
+        color=_color_property(properties, DEFAULT_PATH_COLOR),
+        one_way=bool(properties.get("one_way", False)),
+    )
+
+
+def _object_properties(obj: dict[str, Any]) -> dict[str, Any]:
+    properties = obj.get("properties", [])
+    if not isinstance(properties, list):
+        return {}
+    return {item.get("name"): item.get("value") for item in properties if isinstance(item, dict)}
+
+
+def _number_property(properties: dict[str, Any], name: str, default: float) -> float:
+    value = properties.get(name, default)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name!r} must be a number") from None
+
+
+def _color_property(
+    properties: dict[str, Any],
+    default: tuple[int, int, int, int] = DEFAULT_PLATFORM_COLOR,
+) -> tuple[int, int, int, int]:
+    """Tiled writes colors as ``#AARRGGBB`` (or ``#RRGGBB`` when opaque)."""
+    value = properties.get("color")
+    if value is None:
+        return default
+    digits = str(value).lstrip("#")
+    if len(digits) not in (6, 8):
+        raise ValueError("'color' must be a Tiled color")
+    try:
+        channels = [int(digits[index:index + 2], 16) for index in range(0, len(digits), 2)]
+    except ValueError:
+        raise ValueError("'color' must be a Tiled color") from None
+    if len(channels) == 3:
+        return (channels[0], channels[1], channels[2], 255)
+    return (channels[1], channels[2], channels[3], channels[0])
+
+
+class ScrollingPlatforms:
+    """The scrolling platforms of one level, moved together once per simulation step."""
+
+    STATE_FIELDS: tuple[str, ...] = ("elapsed_steps",)
+
+    def __init__(self, specs: Sequence[ScrollingPlatformSpec], speed_multiplier: float):
+        self.specs = tuple(specs)
+        self.elapsed_steps = 0
+        # Two sprites per platform, in spec order: the plank and its echo one window width behind.
+        self.sprites = arcade.SpriteList()
+        # Per platform: start, velocity, lane low, lane high, echo offset, first wrap step, wrap period.
+        self._lanes: list[tuple[float, float, float, float, float, int, int]] = []
+        for spec in self.specs:
+            window_width = spec.window_right - spec.window_left
+            if spec.direction == DIRECTION_RIGHT:
+                # The plank wraps once it has fully left the window on the right.
+                velocity = spec.speed * speed_multiplier
+                low, high, echo_offset = spec.window_left, spec.window_right, -window_width
+            else:
+                velocity = -spec.speed * speed_multiplier
+                low = spec.window_left - spec.plate_width
+                high = spec.window_right - spec.plate_width
+                echo_offset = window_width
+            first_wrap, period = wrap_schedule(spec.start_left, velocity, low, high, wrap_on_equal=True)
+            self._lanes.append((spec.start_left, velocity, low, high, echo_offset, first_wrap, period))
+            for _ in range(2):
+                plate = arcade.SpriteSolidColor(
+                    width=int(spec.plate_width),
+                    height=int(round(spec.height)),
+                    color=spec.color,
+                )
+                plate.center_y = spec.center_y
+                plate.change_x = 0.0  # positioned here; the physics engine must not move them
+                self.sprites.append(plate)
+        self._has_support_rule = any(spec.min_support_ratio is not None for spec in self.specs)
+        self.seek(0)
+
+    def plate_left_at(self, index: int, steps: int) -> float:
+        """Left edge of platform ``index``'s plank (before clipping) after ``steps`` updates."""
+        start, velocity, low, high, _, first_wrap, period = self._lanes[index]
+        return scheduled_position(start, velocity, low, high, steps, first_wrap, period)
+
+    def seek(self, steps: int) -> None:
+        self.elapsed_steps = steps
+        sprites = self.sprites
+        for index, (spec, lane) in enumerate(zip(self.specs, self._lanes)):
+            start, velocity, low, high, echo_offset, first_wrap, period = lane
+            plate_left = scheduled_position(start, velocity, low, high, steps, first_wrap, period)
+            self._clip(sprites[2 * index], spec, plate_left)
+            self._clip(sprites[2 * index + 1], spec, plate_left + echo_offset)
+
+    @staticmethod
+    def _clip(sprite: arcade.Sprite, spec: ScrollingPlatformSpec, plate_left: float) -> None:
+        """Size and place ``sprite`` to the part of the plank inside the window."""
+        visible_left = max(plate_left, spec.window_left)
+        visible_right = min(plate_left + spec.plate_width, spec.window_right)
+        if visible_right <= visible_left:
+            sprite.width = 1
+            sprite.center_x = _OFF_SCREEN
+        else:
+            sprite.width = visible_right - visible_left
+            sprite.center_x = (visible_left + visible_right) / 2.0
+
+    def update(self) -> None:
+        self.seek(self.elapsed_steps + 1)
+
+    def capture_state(self, out: array) -> None:
+        out.append(float(self.elapsed_steps))
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.seek(int(values[offset]))
+        return offset + 1
+
+    def player_lacks_support(self, player_sprite: arcade.Sprite) -> bool:
+        """Whether the player stands on a plank with less of its hit box on it than ``min_support``.
+
+        The plank sprite holding most of the hit box decides; ground under the
+        rest of the player does not count.
+        """
+        if not self._has_support_rule:
+            return False
+        hit_box_points = player_sprite.hit_box.points
+        player_hitbox_left = player_sprite.center_x + min(point[0] for point in hit_box_points)
+        player_hitbox_right = player_sprite.center_x + max(point[0] for point in hit_box_points)
+        player_hitbox_width = max(1.0, player_hitbox_right - player_hitbox_left)
+
+        best_ratio: float | None = None
+        best_spec: ScrollingPlatformSpec | None = None
+        for index, platform in enumerate(self.sprites):
+            overlap_left = max(player_hitbox_left, platform.left)
+            overlap_right = min(player_hitbox_right, platform.right)
+            if overlap_right <= overlap_left:
+                continue
+            is_on_top = (
+                player_sprite.bottom >= platform.top - _SUPPORT_VERTICAL_TOLERANCE
+                and player_sprite.bottom <= platform.top + _SUPPORT_VERTICAL_TOLERANCE
+            )
+            if not is_on_top:
+                continue
+            support_ratio = (overlap_right - overlap_left) / player_hitbox_width
+            if best_ratio is None or support_ratio > best_ratio:
+                best_ratio = support_ratio
+                best_spec = self.specs[index // 2]
+
+        if best_ratio is None or best_spec is None or best_spec.min_support_ratio is None:
+            return False
+        return best_ratio < best_spec.min_support_ratio
+
+
+class ArcLengthTable:
+    """Cumulative segment lengths of a polyline, for the point at any distance along it."""
+
+    __slots__ = ("points", "lengths")
+
+    def __init__(self, points: Sequence[tuple[float, float]]):
+        self.points = tuple(points)
+        lengths = [0.0]
+        for (x1, y1), (x2, y2) in zip(self.points, self.points[1:]):
+            lengths.append(lengths[-1] + math.hypot(x2 - x1, y2 - y1))
+        self.lengths = lengths
+
+    @property
+    def length(self) -> float:
+        return self.lengths[-1]
+
+    def point_at(self, distance: float) -> tuple[float, float]:
+        distance = min(max(distance, 0.0), self.length)
+        index = min(bisect_right(self.lengths, distance) - 1, len(self.points) - 2)
+        segment_length = self.lengths[index + 1] - self.lengths[index]
+        fraction = (distance - self.lengths[index]) / segment_length if segment_length > 0 else 0.0
+        (x1, y1), (x2, y2) = self.points[index], self.points[index + 1]
+        return x1 + (x2 - x1) * fraction, y1 + (y2 - y1) * fraction
+
+
+def path_step_table(
+    spec: PathPlatformSpec,
+    speed_multiplier: float,
+    quantize: Callable[[float], float] | None = None,
+) -> tuple[array, array]:
+    """Platform center at every step of one cycle of ``spec``'s path."""
+    points = spec.points + (spec.points[0],) if spec.mode == PATH_LOOP else spec.points
+    table = ArcLengthTable(points)
+    traversal_steps = max(1, math.ceil(table.length / (spec.speed * speed_multiplier)))
+    cycle_steps = traversal_steps * 2 if spec.mode == PATH_PING_PONG else traversal_steps
+    ease = EASINGS[spec.easing]
+    xs = array("d")
+    ys = array("d")
+    for step in range(cycle_steps):
+        # Ping-pong runs the traversal backwards in the second half of the cycle.
+        traversal_step = step if step <= traversal_steps else cycle_steps - step
+        x, y = table.point_at(ease(traversal_step / traversal_steps) * table.length)
+        if quantize is not None:
+            x, y = quantize(x), quantize(y)
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+
+class PathPlatforms:
+    """The path platforms of one level, moved once per step before the physics step."""
+
+    STATE_FIELDS: tuple[str, ...] = ("elapsed_steps",)
+
+    def __init__(
+        self,
+        specs: Sequence[PathPlatformSpec],
+        speed_multiplier: float,
+        quantize: Callable[[float], float] | None = None,
+    ):
+        self.specs = tuple(specs)
+        self.elapsed_steps = 0
+        self.sprites = arcade.SpriteList()
+        # Per platform: center xs and ys for one cycle, and the cycle steps done at step 0.
+        self._tables: list[tuple[array, array, int]] = []
+        for spec in self.specs:
+            xs, ys = path_step_table(spec, speed_multiplier, quantize)
+            self._tables.append((xs, ys, int(spec.phase * len(xs))))
+            plate = arcade.SpriteSolidColor(
+                width=int(round(spec.width)),
+                height=int(round(spec.height)),
+                color=spec.color,
+            )
+            plate.one_way = spec.one_way
+            self.sprites.append(plate)
+        self.seek(0)
+
+    def center_at(self, index: int, steps: int) -> tuple[float, float]:
+        xs, ys, phase_steps = self._tables[index]
+        table_index = (steps + phase_steps) % len(xs)
+        return xs[table_index], ys[table_index]
+
+    def advance(self, rider: arcade.Sprite | None) -> None:
+        """Move to the next step, carrying ``rider`` along with the platform it stands on."""
+        ridden = self._ridden_platform(rider) if rider is not None else None
+        if ridden is None:
+            self.seek(self.elapsed_steps + 1)
+            return
+        assert rider is not None
+        ridden_sprite, rider_gap = ridden
+        previous_x, previous_y = ridden_sprite.position
+        self.seek(self.elapsed_steps + 1)
+        # A rider a hair below the top (the engine rounds y) is put back on it, or
+        # a one-way platform would let it fall through.
+        rider.position = (
+            rider.center_x + (ridden_sprite.center_x - previous_x),
+            rider.center_y + (ridden_sprite.center_y - previous_y) - min(rider_gap, 0.0),
+        )
+
+    def _ridden_platform(self, rider: arcade.Sprite) -> tuple[arcade.Sprite, float] | None:
+        """The platform ``rider`` stands on and the height of its hit box bottom above the top."""
+        if rider.change_y > 0:
+            return None
+        points = rider.hit_box.get_adjusted_points()
+        rider_left = min(x for x, _ in points)
+        rider_right = max(x for x, _ in points)
+        rider_bottom = min(y for _, y in points)
+        for platform in self.sprites:
+            gap = rider_bottom - platform.top
+            if rider_right > platform.left and rider_left < platform.right and abs(gap) <= _RIDE_VERTICAL_TOLERANCE:
+                return platform, gap
+        return None
+
+    def seek(self, steps: int) -> None:
+        self.elapsed_steps = steps
+        for sprite, (xs, ys, phase_steps) in zip(self.sprites, self._tables):
+            table_index = (steps + phase_steps) % len(xs)
+            sprite.position = (xs[table_index], ys[table_index])
+
+    def capture_state(self, out: array) -> None:
+        out.append(float(self.elapsed_steps))
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.seek(int(values[offset]))
+        return offset + 1
@@ -0,0 +1,239 @@
+"""Offscreen rendering helpers: baked static layers and cached text textures.
+
+Tile layers never move after a level is loaded, so drawing them sprite by
+sprite every frame is wasted work. Consecutive static layers in the scene draw
+order are rendered once into a texture at level setup and replaced by a single
+sprite; dynamic layers keep their place between the baked runs.
+
+Moving sprites are drawn between simulation steps with `SpriteInterpolator`,
+so motion stays smooth when the display refreshes faster than the fixed
+simulation rate.
+"""
+import itertools
+import math
+from typing import Callable, Iterable, Sequence
+
+import arcade
+from PIL import Image
+
+BAKED_LAYER_PREFIX = "BakedStatic"
+
+_texture_counter = itertools.count()
+
+
+def bake_static_layers(
+    scene: arcade.Scene,
+    layer_order: list[str],
+    static_layer_names: Iterable[str],
+    bounds: tuple[float, float, float, float],
+    draw_background: Callable[[], None] | None = None,
+) -> list[str]:
+    """Bake each run of static layers into one texture and return the new draw order.
+
+    The static sprite lists stay in ``scene`` (physics and collision checks
+    still use them); they are only left out of the returned draw order.
+    ``draw_background`` is rendered underneath the first run. Baked layers
+    map 1:1 to world pixels and should be drawn with ``pixelated=True``.
+    """
+    static_names = set(static_layer_names)
+    pixel_bounds = snap_to_pixel_bounds(bounds)
+
+    draw_order: list[str] = []
+    pending_run: list[str] = []
+    background = draw_background
+    baked_count = 0
+
+    def flush_run() -> None:
+        nonlocal background, baked_count
+        baked_name = f"{BAKED_LAYER_PREFIX}{baked_count}"
+        baked_count += 1
+        texture = _bake_texture([scene[name] for name in pending_run], pixel_bounds, background)
+        baked_sprite = arcade.Sprite(
+            texture,
+            center_x=(pixel_bounds[0] + pixel_bounds[1]) / 2,
+            center_y=(pixel_bounds[2] + pixel_bounds[3]) / 2,
+        )
+        scene.add_sprite(baked_name, baked_sprite)
+        draw_order.append(baked_name)
+        pending_run.clear()
+        background = None
+
+    for name in layer_order:
+        if name in static_names:
+            pending_run.append(name)
+            continue
+        if pending_run or background is not None:
+            flush_run()
+        draw_order.append(name)
+    if pending_run or background is not None:
+        flush_run()
+    return draw_order
+
+
+class SpriteInterpolator:
+    """Draw tracked sprites at positions blended between the last two simulation steps.
+
+    Call `begin_step` before each simulation step, then wrap drawing in
+    `apply(alpha)` / `restore()`. Moves longer than ``snap_distance`` in one
+    step (wraps, respawns, parked plates) are drawn at the current position.
+    Sprites passed as ``resizable`` also get their width blended, so clipped
+    platforms keep their edges in place; they must be sized through ``width``
+    so that restoring it reproduces the same scale.
+    """
+
+    def __init__(self, snap_distance: float):
+        self.snap_distance = snap_distance
+        self._sprites: list[arcade.Sprite] = []
+        self._resizable: list[bool] = []
+        self._previous: list[tuple[float, float, float]] = []
+        self._current: list[tuple[float, float, float]] = []
+        self._applied = False
+
+    def track(self, sprites: Sequence[arcade.Sprite], resizable: Sequence[arcade.Sprite] = ()) -> None:
+        """Replace the tracked sprites; their previous state starts at the current one."""
+        self._sprites = [*sprites, *resizable]
+        self._resizable = [False] * len(sprites) + [True] * len(resizable)
+        self._previous = [(sprite.center_x, sprite.center_y, sprite.width) for sprite in self._sprites]
+        self._current = list(self._previous)
+        self._applied = False
+
+    def begin_step(self) -> None:
+        for index, sprite in enumerate(self._sprites):
+            self._previous[index] = (sprite.center_x, sprite.center_y, sprite.width)
+
+    def snap(self) -> None:
+        """Forget the previous step after a teleport (restart, state load)."""
+        self.begin_step()
+
+    def apply(self, alpha: float) -> None:
+        for index, sprite in enumerate(self._sprites):
+            current = (sprite.center_x, sprite.center_y, sprite.width)
+            self._current[index] = current
+            previous_x, previous_y, previous_width = self._previous[index]
+            if (
+                abs(current[0] - previous_x) > self.snap_distance
+                or abs(current[1] - previous_y) > self.snap_distance
+            ):
+                continue
+            if self._resizable[index]:
+                sprite.width = lerp(previous_width, current[2], alpha)
+            sprite.position = (lerp(previous_x, current[0], alpha), lerp(previous_y, current[1], alpha))
+        self._applied = True
+
+    def restore(self) -> None:
+        if not self._applied:
+            return
+        for sprite, resizable, (center_x, center_y, width) in zip(self._sprites, self._resizable, self._current):
+            if resizable:
+                sprite.width = width
+            sprite.position = (center_x, center_y)
+        self._applied = False
+
+
+def lerp(start: float, end: float, alpha: float) -> float:
+    return start + ((end - start) * alpha)
+
+
+def is_baked_layer(name: str) -> bool:
+    return name.startswith(BAKED_LAYER_PREFIX)
+
+
+def render_text_texture(
+    text: str,
+    color: tuple[int, int, int, int],
+    font_size: float,
+    *,
+    bold: bool = False,
+) -> tuple[arcade.Texture, tuple[float, float]]:
+    """Render ``text`` once into a texture that blends like ``arcade.draw_text``.
+
+    Returns the texture and the offset from the text anchor (horizontal center,
+    baseline) to the texture center, so sprites can be placed like drawn text.
+    """
+    mask_text = arcade.Text(
+        text,
+        0,
+        0,
+        arcade.color.WHITE,
+        font_size,
+        bold=bold,
+        anchor_x="center",
+        anchor_y="baseline",
+    )
+    bounds = snap_to_pixel_bounds((mask_text.left, mask_text.right, mask_text.bottom, mask_text.top))
+    # Opaque white glyphs over a cleared target leave their coverage in the
+    # color channels; use it as the alpha of a straight (non-premultiplied) texture.
+    coverage = render_offscreen_image(bounds, mask_text.draw).getchannel("R")
+    image = Image.new("RGBA", coverage.size, (color[0], color[1], color[2], 0))
+    image.putalpha(coverage.point(lambda value: (value * color[3]) // 255))
+    texture = arcade.Texture(image, hash=f"text-{text}-{next(_texture_counter)}")
+    anchor_offset = ((bounds[0] + bounds[1]) / 2, (bounds[2] + bounds[3]) / 2)
+    return texture, anchor_offset
+
+
+def snap_to_pixel_bounds(bounds: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    left, right, bottom, top = bounds
+    return (
+        float(math.floor(left)),
+        float(math.ceil(right)),
+        float(math.floor(bottom)),
+        float(math.ceil(top)),
+    )
+
+
+def render_offscreen_image(
+    bounds: tuple[float, float, float, float],
+    draw: Callable[[], None],
+) -> Image.Image:
+    """Run ``draw`` into an offscreen target covering pixel-aligned ``bounds``.
+
+    The returned image is in premultiplied ``RGBa`` mode, top row first.
+    """
+    left, right, bottom, top = bounds
+    size = (max(1, int(right - left)), max(1, int(top - bottom)))
+
+    ctx = arcade.get_window().ctx
+    framebuffer = ctx.framebuffer(color_attachments=[ctx.texture(size, components=4)])
+    offscreen_camera = arcade.Camera2D(
+        position=((left + right) / 2, (bottom + top) / 2),
+        render_target=framebuffer,
+    )
+    previous_camera = ctx.current_camera
+    with framebuffer.activate():
+        framebuffer.clear()
+        offscreen_camera.use()
+        draw()
+        data = framebuffer.read(components=4)
+    previous_camera.use()
+
+    image = Image.frombytes("RGBa", size, data)
+    return image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
+
+
+def _bake_texture(
+    sprite_lists: list[arcade.SpriteList],
+    bounds: tuple[float, float, float, float],
+    draw_background: Callable[[], None] | None,
+) -> arcade.Texture:
+    ctx = arcade.get_window().ctx
+    # Blend alpha separately so translucent tiles over the cleared target keep
+    # a correct coverage value; the premultiplied result is converted below.
+    bake_blend = (ctx.SRC_ALPHA, ctx.ONE_MINUS_SRC_ALPHA, ctx.ONE, ctx.ONE_MINUS_SRC_ALPHA)
+
+    def draw_layers() -> None:
+        previous_blend = ctx.blend_func
+        ctx.blend_func = bake_blend
+        try:
+            if draw_background is not None:
+                draw_background()
+            for sprite_list in sprite_lists:
+                sprite_list.draw(blend_function=bake_blend)
+        finally:
+            ctx.blend_func = previous_blend
+
+    image = render_offscreen_image(bounds, draw_layers).convert("RGBA")
+    return arcade.Texture(
+        image,
+        hit_box_algorithm=arcade.hitbox.algo_bounding_box,
+        hash=f"{BAKED_LAYER_PREFIX}-{next(_texture_counter)}",
+    )
@@ -0,0 +1,202 @@
+"""Replay recording: run seed, step-aligned inputs and per-step state hashes.
+
+`GameView` applies gameplay input at the start of a simulation step, never in
+between, so a run is fully described by the seed, the starting options and
+the list of ``(step, action, pressed)`` events. While recording, the rolling
+hash of the simulation state record after every step is stored next to the
+inputs; when a replay stops matching after a code change, the first
+differing hash is the first step that changed. Gameplay events of the run
+(jumps, deaths, level changes; `pysnoopy/events.py`) are kept as
+``(step, kind, detail)`` markers for locating moments in long recordings.
+
+Replays are written either as one JSON document at the end of the run or,
+for long sessions, streamed step by step into a binary trace
+(`pysnoopy/trace.py`) that also keeps sampled state records. `load_replay`
+reads both.
+"""
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Sequence
+
+from .events import (
+    EVENT_CHECKPOINT,
+    EVENT_DEATH,
+    EVENT_JUMP,
+    EVENT_LAND,
+    EVENT_LEVEL_CLEAR,
+    EVENT_LEVEL_START,
+    EVENT_REWIND_START,
+    EVENT_ROUND_WRAP,
+    EVENT_STATE_LOADED,
+    EVENT_STATE_SAVED,
+    GameEvent,
+)
+from .snapshots import rolling_state_hash
+from .trace import TraceReader, TraceWriter, is_trace_file
+
+REPLAY_FORMAT_VERSION = 1
+
+ACTION_LEFT = "left"
+ACTION_RIGHT = "right"
+ACTION_JUMP = "jump"
+ACTION_REWIND = "rewind"
+ACTION_SAVE_STATE = "save_state"
+ACTION_LOAD_STATE = "load_state"
+REPLAY_ACTIONS = (
+    ACTION_LEFT,
+    ACTION_RIGHT,
+    ACTION_JUMP,
+    ACTION_REWIND,
+    ACTION_SAVE_STATE,
+    ACTION_LOAD_STATE,
+)
+# Actions whose release is an event too; save/load only act on press.
+HELD_ACTIONS = (ACTION_LEFT, ACTION_RIGHT, ACTION_JUMP, ACTION_REWIND)
+# Gameplay events stored as replay markers; walk and music events are left out as noise.
+REPLAY_MARKER_EVENTS = (
+    EVENT_JUMP,
+    EVENT_LAND,
+    EVENT_DEATH,
+    EVENT_LEVEL_START,
+    EVENT_LEVEL_CLEAR,
+    EVENT_ROUND_WRAP,
+    EVENT_REWIND_START,
+    EVENT_STATE_SAVED,
+    EVENT_STATE_LOADED,
+    EVENT_CHECKPOINT,
+)
+
+
+class ReplayRecorder:
+    """Collects inputs and state hashes of one run.
+
+    With ``trace_path`` every step is also streamed to a binary trace; call
+    `close` when the run ends. Otherwise `write` stores the run as JSON.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        start_level: int,
+        starting_speed_rounds: int,
+        hash_states: bool = True,
+        trace_path: str | Path | None = None,
+        fixed_point: bool = False,
+    ):
+        self.seed = seed
+        self.start_level = start_level
+        self.starting_speed_rounds = starting_speed_rounds
+        self.fixed_point = fixed_point
+        self.hash_states = hash_states
+        self.events: list[tuple[int, str, bool]] = []
+        self.markers: list[tuple[int, str, str]] = []
+        self.state_hashes = array("L")
+        self.steps = 0
+        self._state_hash = 0
+        self._trace_event_start = 0
+        self._trace_marker_start = 0
+        self.trace_writer: TraceWriter | None = None
+        if trace_path is not None:
+            self.trace_writer = TraceWriter(
+                trace_path,
+                self._metadata(),
+                REPLAY_ACTIONS,
+                marker_kinds=REPLAY_MARKER_EVENTS,
+            )
+
+    def record_input(self, step: int, action: str, pressed: bool) -> None:
+        self.events.append((step, action, pressed))
+
+    def record_markers(self, events: Sequence[GameEvent]) -> None:
+        """`EventBus` subscriber; markers go into the entry of the step recorded next."""
+        self.markers.extend((event.step, event.kind, event.detail) for event in events)
+
+    def record_state(self, values: array, start: int = 0, stop: int | None = None) -> None:
+        """Fold the state record ``values[start:stop]`` of the step just finished into the hash chain."""
+        self.steps += 1
+        state_hash = None
+        if self.hash_states:
+            state_hash = self._state_hash = rolling_state_hash(values, self._state_hash, start, stop)
+            self.state_hashes.append(state_hash)
+        if self.trace_writer is not None:
+            step_events = [(action, pressed) for _, action, pressed in self.events[self._trace_event_start:]]
+            self._trace_event_start = len(self.events)
+            step_markers = [(kind, detail) for _, kind, detail in self.markers[self._trace_marker_start:]]
+            self._trace_marker_start = len(self.markers)
+            self.trace_writer.write_step(step_events, state_hash, memoryview(values)[start:stop], step_markers)
+
+    def close(self) -> None:
+        if self.trace_writer is not None:
+            self.trace_writer.close()
+
+    def _metadata(self) -> dict[str, Any]:
+        return {
+            "version": REPLAY_FORMAT_VERSION,
+            "seed": self.seed,
+            "start_level": self.start_level,
+            "starting_speed_rounds": self.starting_speed_rounds,
+            "fixed_point": self.fixed_point,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self._metadata(),
+            "steps": self.steps,
+            "events": [list(event) for event in self.events],
+            "markers": [list(marker) for marker in self.markers],
+            "state_hashes": self.state_hashes.tolist(),
+        }
+
+    def write(self, path: str | Path) -> None:
+        with open(path, "w", encoding="utf-8") as file_handle:
+            json.dump(self.to_dict(), file_handle, separators=(",", ":"))
+            file_handle.write("\n")
+
+
+def load_replay(path: str | Path) -> dict[str, Any]:
+    """Load a JSON replay or a binary trace into the JSON replay layout."""
+    if is_trace_file(path):
+        with TraceReader(path) as reader:
+            replay = dict(reader.metadata)
+            replay.update(steps=reader.steps, events=[], markers=[], state_hashes=[])
+            for entry in reader.iter_steps():
+                replay["events"].extend([entry.step, action, pressed] for action, pressed in entry.events)
+                replay["markers"].extend([entry.step, kind, detail] for kind, detail in entry.markers)
+                if entry.state_hash is not None:
+                    replay["state_hashes"].append(entry.state_hash)
+    else:
+        with open(path, "r", encoding="utf-8") as file_handle:
+            replay = json.load(file_handle)
+    if not isinstance(replay, dict) or replay.get("version") != REPLAY_FORMAT_VERSION:
+        raise ValueError(f"{path}: not a version {REPLAY_FORMAT_VERSION} replay")
+    return replay
+
+
+def inputs_by_step(replay: dict[str, Any]) -> dict[int, list[tuple[str, bool]]]:
+    """Group the events of a loaded replay by the step they are applied at."""
+    grouped: dict[int, list[tuple[str, bool]]] = {}
+    for step, action, pressed in replay["events"]:
+        if action not in REPLAY_ACTIONS:
+            raise ValueError(f"unknown replay action {action!r}")
+        grouped.setdefault(int(step), []).append((action, bool(pressed)))
+    return grouped
+
+
+def first_divergence(expected: Sequence[int], actual: Sequence[int]) -> int | None:
+    """Index of the first differing entry of two hash chains, or None when one is a prefix of the other.
+
+    Each hash is chained onto the previous one, so once two chains differ they
+    keep differing and the first difference can be found by bisection.
+    """
+    low = 0
+    high = min(len(expected), len(actual))
+    if high == 0 or expected[high - 1] == actual[high - 1]:
+        return None
+    while low < high:
+        middle = (low + high) // 2
+        if expected[middle] == actual[middle]:
+            low = middle + 1
+        else:
+            high = middle
+    return low
@@ -0,0 +1,201 @@
+"""Find the first step where two replays (or two builds playing one replay) diverge.
+
+    python -m pysnoopy.replay_diff A.json B.json
+    python -m pysnoopy.replay_diff path/to/build-a path/to/build-b --replay run.json
+
+Each side is played headlessly in its own worker process, side by side. Workers
+report the chained state hash of every simulation step; since a chained hash
+stays different once it differs, the first diverging step is found by
+bisection. Both sides are then replayed up to that step once more and their
+state records are printed field by field (player, hazards, hook, settings).
+
+Build directories are checkouts that contain the ``pysnoopy`` package; each
+must include this tool, since the worker runs inside the build it measures.
+"""
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .replay import ReplayRecorder, first_divergence, inputs_by_step, load_replay
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+WORKER_FLAG = "--worker"
+
+
+def _parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Find where two pySNOOPY replays or builds diverge")
+    parser.add_argument("a", type=Path, help="Replay file, or build directory when --replay is given.")
+    parser.add_argument("b", type=Path, help="Replay file, or build directory when --replay is given.")
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        help="Replay to play in both build directories A and B.",
+    )
+    args = parser.parse_args(argv)
+    if args.replay is None:
+        for path in (args.a, args.b):
+            if not path.is_file():
+                parser.error(f"{path} is not a replay file (pass --replay to compare build directories)")
+    else:
+        if not args.replay.is_file():
+            parser.error(f"{args.replay} is not a replay file")
+        for path in (args.a, args.b):
+            if not (path / "pysnoopy" / "__init__.py").is_file():
+                parser.error(f"{path} is not a build directory containing the pysnoopy package")
+    return args
+
+
+def _parse_worker_args(argv: list[str]):
+    parser = argparse.ArgumentParser(description="pySNOOPY replay worker (internal)")
+    parser.add_argument(WORKER_FLAG, dest="replay", type=Path, required=True)
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--dump-step", type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def _run_worker(replay_path: Path, output_path: Path, dump_step: int | None) -> None:
+    """Play ``replay_path`` headlessly and write its hash chain (and one labelled state) as JSON."""
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+    import arcade
+
+    from .game_state import GameState
+    from .globals import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH, SIMULATION_STEP_SECONDS
+    from .snapshots import new_state_record
+    from .views import GameView
+
+    replay = load_replay(replay_path)
+    replay_steps = int(replay.get("steps", len(replay["state_hashes"])))
+    inputs = inputs_by_step(replay)
+    os.chdir(PACKAGE_DIR)
+
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE)
+    game_state = GameState(
+        start_level=replay["start_level"],
+        starting_speed_rounds=replay["starting_speed_rounds"],
+        seed=replay["seed"],
+        fixed_point=replay.get("fixed_point", False),
+    )
+    recorder = ReplayRecorder(replay["seed"], replay["start_level"], replay["starting_speed_rounds"])
+    game_state.replay_recorder = recorder
+    view = GameView(start_level=replay["start_level"], game_state=game_state)
+    window.show_view(view)
+    view.setup()
+
+    dump: dict[str, Any] | None = None
+    stop_step = replay_steps if dump_step is None else min(replay_steps, dump_step + 1)
+    for step in range(stop_step):
+        view.pending_inputs.extend(inputs.get(step, ()))
+        view.simulation_step(SIMULATION_STEP_SECONDS)
+    if dump_step is not None and dump_step < stop_step:
+        record = new_state_record()
+        view.capture_simulation_state(record)
+        dump = {
+            "level": view.level_spec.name,
+            "fields": view.simulation_state_fields(),
+            "values": record.tolist(),
+        }
+    with open(output_path, "w", encoding="utf-8") as file_handle:
+        json.dump({"state_hashes": recorder.state_hashes.tolist(), "dump": dump}, file_handle)
+
+
+def _run_workers(jobs: list[tuple[Path, Path]], dump_step: int | None = None) -> list[dict[str, Any]]:
+    """Run one worker per ``(build_dir, replay)`` job in parallel and return their reports."""
+    with tempfile.TemporaryDirectory(prefix="replay_diff_") as temp_dir:
+        processes = []
+        for index, (build_dir, replay_path) in enumerate(jobs):
+            output_path = Path(temp_dir) / f"side{index}.json"
+            command = [
+                sys.executable,
+                "-m",
+                "pysnoopy.replay_diff",
+                WORKER_FLAG,
+                str(replay_path.resolve()),
+                "--output",
+                str(output_path),
+            ]
+            if dump_step is not None:
+                command.extend(("--dump-step", str(dump_step)))
+            env = dict(os.environ, ARCADE_HEADLESS="1", PYTHONPATH=str(build_dir.resolve()))
+            process = subprocess.Popen(
+                command,
+                cwd=build_dir,
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            processes.append((process, output_path))
+
+        reports = []
+        for process, output_path in processes:
+            _, stderr = process.communicate()
+            if process.returncode != 0:
+                raise RuntimeError(f"replay worker failed ({process.returncode}):\n{stderr}")
+            with open(output_path, "r", encoding="utf-8") as file_handle:
+                reports.append(json.load(file_handle))
+        return reports
+
+
+def _values_equal(first: float, second: float) -> bool:
+    return first == second or (math.isnan(first) and math.isnan(second))
+
+
+def _print_field_diff(dump_a: dict[str, Any], dump_b: dict[str, Any]) -> None:
+    values_a = dict(zip(dump_a["fields"], dump_a["values"]))
+    values_b = dict(zip(dump_b["fields"], dump_b["values"]))
+    fields = list(dump_a["fields"]) + [name for name in dump_b["fields"] if name not in values_a]
+    width = max(len(name) for name in fields)
+    print(f"  {'field':<{width}}  {'A':>20}  {'B':>20}")
+    for name in fields:
+        value_a = values_a.get(name)
+        value_b = values_b.get(name)
+        if value_a is not None and value_b is not None and _values_equal(value_a, value_b):
+            continue
+        text_a = "-" if value_a is None else repr(value_a)
+        text_b = "-" if value_b is None else repr(value_b)
+        print(f"  {name:<{width}}  {text_a:>20}  {text_b:>20}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == WORKER_FLAG:
+        worker_args = _parse_worker_args(argv)
+        _run_worker(worker_args.replay, worker_args.output, worker_args.dump_step)
+        return 0
+
+    args = _parse_args(argv)
+    project_dir = PACKAGE_DIR.parent
+    if args.replay is None:
+        jobs = [(project_dir, args.a), (project_dir, args.b)]
+    else:
+        jobs = [(args.a, args.replay), (args.b, args.replay)]
+
+    report_a, report_b = _run_workers(jobs)
+    hashes_a = report_a["state_hashes"]
+    hashes_b = report_b["state_hashes"]
+    step = first_divergence(hashes_a, hashes_b)
+    if step is None:
+        if len(hashes_a) == len(hashes_b):
+            print(f"No divergence in {len(hashes_a)} steps")
+            return 0
+        print(f"Identical for {min(len(hashes_a), len(hashes_b))} steps; lengths differ "
+              f"(A: {len(hashes_a)}, B: {len(hashes_b)})")
+        return 1
+
+    report_a, report_b = _run_workers(jobs, dump_step=step)
+    dump_a = report_a["dump"]
+    dump_b = report_b["dump"]
+    print(f"First divergence at step {step} (A: {dump_a['level']}, B: {dump_b['level']})")
+    _print_field_diff(dump_a, dump_b)
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
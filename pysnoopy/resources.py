@@ -0,0 +1,200 @@
+"""Resource monitor: live sprites, textures, atlas space, sound players and heap per level transition.
+
+    python -m pysnoopy.resources
+    python -m pysnoopy.resources --cycles 40 --steps 300 --warmup 3
+
+A `ResourceSample` is a full garbage collection, then a count of the live
+arcade sprites, sprite lists and textures and of the pyglet sound players
+among the objects the collector tracks, the entries and size of the default
+texture atlas, and the Python heap (tracked objects and allocated blocks).
+That heap walk takes tens of milliseconds, so `GameView` only samples when a
+level is set up while the debug overlay (``H``) is on, when the overlay is
+turned on, or at every setup for a monitor made with ``sample_setups=True``.
+The overlay shows the latest sample; nothing is measured per frame.
+
+The command is a soak test: it plays every level in a hidden window for
+``--steps`` simulation steps with right held, drawing every step, advances
+through the real level transitions and round wraps for ``--cycles`` loops and
+fails when a count in the last loop is above its value in the loop after
+``--warmup`` loops (caches fill and the atlas settles during the first ones)
+at most levels.
+"""
+import argparse
+import gc
+import os
+import sys
+from collections import deque
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+from typing import Sequence
+
+DEFAULT_CYCLES = 12
+DEFAULT_WARMUP_CYCLES = 3
+DEFAULT_STEPS_PER_LEVEL = 120
+SAMPLE_HISTORY = 256  # samples a monitor keeps; it must not grow itself
+# Heap counts move a little with allocator and interpreter caches; object counts must not grow at all.
+HEAP_GROWTH_TOLERANCE = 0.02
+_HEAP_METRICS = ("gc_objects", "heap_blocks")
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceSample:
+    level_name: str
+    setups: int  # level setups of the view so far
+    sprites: int
+    sprite_lists: int
+    textures: int
+    sound_players: int
+    atlas_textures: int
+    atlas_images: int
+    atlas_pixels: int
+    gc_objects: int
+    heap_blocks: int
+
+    def counts(self) -> dict[str, int]:
+        """The measured values by name, without the level name and setup count."""
+        return {item.name: value for item, value in zip(fields(self)[2:], astuple(self)[2:])}
+
+    def summary(self) -> str:
+        return (
+            f"SETUPS: {self.setups}  SPRITES: {self.sprites}  LISTS: {self.sprite_lists}  "
+            f"TEXTURES: {self.textures}  ATLAS: {self.atlas_textures}/{self.atlas_pixels // 1_000_000}MPX  "
+            f"PLAYERS: {self.sound_players}  HEAP: {self.gc_objects}/{self.heap_blocks}"
+        )
+
+
+class ResourceMonitor:
+    """The last `SAMPLE_HISTORY` resource samples of one view and its level setup count."""
+
+    __slots__ = ("samples", "setups", "sample_setups")
+
+    def __init__(self, sample_setups: bool = False):
+        self.samples: deque[ResourceSample] = deque(maxlen=SAMPLE_HISTORY)
+        self.setups = 0
+        self.sample_setups = sample_setups  # sample after every level setup, not only with the overlay on
+
+    @property
+    def latest(self) -> ResourceSample | None:
+        return self.samples[-1] if self.samples else None
+
+    def sample(self, level_name: str) -> ResourceSample:
+        import arcade
+        import pyglet.media
+
+        # Live objects counted in the collector's object list, in `ResourceSample` field order.
+        counted_types = (arcade.BasicSprite, arcade.SpriteList, arcade.Texture, pyglet.media.Player)
+        gc.collect()
+        counts = [0] * len(counted_types)
+        kinds: dict[type, int] = {}  # per call, so the monitor keeps no type alive
+        objects = gc.get_objects()
+        for obj in objects:
+            # type(), not isinstance: the list holds weak proxies, and a dead proxy raises on isinstance.
+            cls = type(obj)
+            kind = kinds.get(cls)
+            if kind is None:
+                kind = kinds[cls] = next(
+                    (index for index, counted in enumerate(counted_types) if issubclass(cls, counted)), -1
+                )
+            if kind >= 0:
+                counts[kind] += 1
+        atlas = arcade.get_window().ctx.default_atlas
+        width, height = atlas.size
+        sample = ResourceSample(
+            level_name,
+            self.setups,
+            *counts,
+            atlas_textures=len(atlas.textures),
+            atlas_images=len(atlas.images),
+            atlas_pixels=width * height,
+            gc_objects=len(objects),
+            heap_blocks=sys.getallocatedblocks(),
+        )
+        self.samples.append(sample)
+        return sample
+
+
+def grown_counts(baseline: Sequence[ResourceSample], final: Sequence[ResourceSample]) -> list[str]:
+    """Names of the counts that are higher in ``final`` than in ``baseline`` at most levels.
+
+    Both are the samples of one loop through the levels, in the same order. A
+    leak raises every later sample; a sound still playing or a collection
+    that ran late raises only a few, so they do not count as growth. Heap
+    counts must grow by more than `HEAP_GROWTH_TOLERANCE`.
+    """
+    grown_levels: dict[str, int] = {}
+    for before, after in zip(baseline, final):
+        before_counts = before.counts()
+        for name, value in after.counts().items():
+            tolerance = HEAP_GROWTH_TOLERANCE if name in _HEAP_METRICS else 0.0
+            if value > before_counts[name] * (1.0 + tolerance):
+                grown_levels[name] = grown_levels.get(name, 0) + 1
+    return [name for name, count in grown_levels.items() if count * 2 > len(final)]
+
+
+def soak(cycles: int, steps_per_level: int, seed: int = 0) -> list[list[ResourceSample]]:
+    """Loop all levels ``cycles`` times in a hidden window; return the samples of every loop."""
+    import arcade
+
+    from .game_state import GameState
+    from .globals import SCREEN_HEIGHT, SCREEN_TITLE, SCREEN_WIDTH, SIMULATION_STEP_SECONDS
+    from .replay import ACTION_RIGHT
+    from .views import GameView
+
+    # Assets are loaded relative to the package directory, as by pysnoopy.main.
+    os.chdir(Path(__file__).resolve().parent)
+    window = arcade.Window(SCREEN_WIDTH, SCREEN_HEIGHT, SCREEN_TITLE, visible=False)
+    view = GameView(start_level=1, game_state=GameState(seed=seed))
+    view.resources = ResourceMonitor(sample_setups=True)
+    window.show_view(view)
+    view.setup()
+    level_count = len(view.level_specs)
+    loops: list[list[ResourceSample]] = []
+    for cycle in range(cycles):
+        for _ in range(level_count):
+            level_setups = view.resources.setups
+            view.pending_inputs.append((ACTION_RIGHT, True))
+            for _ in range(steps_per_level):
+                view.simulation_step(SIMULATION_STEP_SECONDS)
+                view.on_draw()
+                # The event loop flips after every draw; that also frees the dead GL objects.
+                window.flip()
+                if view.resources.setups != level_setups:
+                    break  # the player reached the exit
+            else:
+                view._advance_level()
+        loops.append(list(view.resources.samples)[-level_count:])
+        print(f"cycle {cycle + 1:>3}: {loops[-1][-1].summary()}", flush=True)
+    window.close()
+    return loops
+
+
+def _parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Soak-test pySNOOPY level transitions for resource leaks")
+    parser.add_argument("--cycles", type=int, default=DEFAULT_CYCLES, help="Loops through all levels.")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP_CYCLES,
+                        help="Loops before the baseline; growth is measured from the end of the next loop.")
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS_PER_LEVEL,
+                        help="Simulation steps (and draws) per level.")
+    parser.add_argument("--seed", type=int, default=0, help="Game seed.")
+    args = parser.parse_args(argv)
+    if args.steps < 1 or args.warmup < 0 or args.cycles < args.warmup + 2:
+        parser.error("--steps must be at least 1 and --cycles at least --warmup + 2")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+    loops = soak(args.cycles, args.steps, args.seed)
+    baseline, final = loops[args.warmup], loops[-1]
+    grown = grown_counts(baseline, final)
+    for name in grown:
+        before = [sample.counts()[name] for sample in baseline]
+        after = [sample.counts()[name] for sample in final]
+        print(f"{name} grew over {len(loops) - args.warmup - 1} loops: {before} -> {after}")
+    print("FAILED: unbounded growth" if grown else "OK: no growth after warm-up")
+    return 1 if grown else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,7 @@
 import arcade
-from typing import TypeAlias
+from array import array
+from dataclasses import dataclass
+from typing import Sequence, TypeAlias
 
 from .globals import (
     CHARACTER_SCALING,
@@ -11,6 +13,8 @@ from .globals import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
 )
+from .snapshots import StateValues
+from .timeline import periodic_phase, wrapped_position
 
 
 class PlayerCharacter(arcade.Sprite):
@@ -37,10 +41,13 @@ class PlayerCharacter(arcade.Sprite):
 
         self.texture = self.idle_texture_pair[0]
         self.texture_hit_boxes: dict[int, list[tuple[float, float]]] = {}
+        self._state_textures: list[arcade.Texture] = []
+        self._texture_state_index: dict[int, int] = {}
         self._build_texture_hit_box_cache()
         self.hit_box = arcade.hitbox.RotatableHitBox(
             self.texture_hit_boxes[id(self.texture)]
         )
+        self._dead_hit_box = arcade.hitbox.RotatableHitBox([(0.0, 0.0), (0.0, 0.0), (0.0, 0.0)])
 
         self.change_x = 0
         self.update_walk = 0
@@ -83,19 +90,77 @@ class PlayerCharacter(arcade.Sprite):
         for texture_pair in texture_pairs:
             for texture in texture_pair:
                 self.texture_hit_boxes[id(texture)] = self._build_scaled_hit_box(texture)
+                self._texture_state_index.setdefault(id(texture), len(self._state_textures))
+                self._state_textures.append(texture)
 
     def _sync_hit_box_with_direction(self):
+        # Place the new hit box at the sprite: an unchanged position would not move it.
         self.hit_box = arcade.hitbox.RotatableHitBox(
-            self.texture_hit_boxes[id(self.texture)]
+            self.texture_hit_boxes[id(self.texture)],
+            position=self.position,
         )
 
+    @property
+    def state_textures(self) -> list[arcade.Texture]:
+        """Every texture the player can show, in `texture_state_index` order."""
+        return self._state_textures
+
+    @property
+    def texture_state_index(self) -> int:
+        return self._texture_state_index[id(self.texture)]
+
     def die(self):
         self.dying = True
         self.jumping = False
-        self.hit_box = arcade.hitbox.RotatableHitBox([(0.0, 0.0), (0.0, 0.0), (0.0, 0.0)])
+        self.hit_box = self._dead_hit_box
         self.change_x = 0
         self.change_y = min(self.change_y, -PLAYER_JUMP_SPEED)
-        
+
+    STATE_FIELDS: tuple[str, ...] = (
+        "center_x",
+        "center_y",
+        "change_x",
+        "change_y",
+        "character_face_direction",
+        "cur_texture",
+        "update_walk",
+        "jumping",
+        "dying",
+        "texture_state_index",
+    )
+
+    def capture_state(self, out: array) -> None:
+        out.extend((
+            self.center_x,
+            self.center_y,
+            self.change_x,
+            self.change_y,
+            float(self.character_face_direction),
+            float(self.cur_texture),
+            float(self.update_walk),
+            float(self.jumping),
+            float(self.dying),
+            float(self.texture_state_index),
+        ))
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.character_face_direction = int(values[offset + 4])
+        self.cur_texture = int(values[offset + 5])
+        self.update_walk = int(values[offset + 6])
+        self.jumping = values[offset + 7] != 0.0
+        self.dying = values[offset + 8] != 0.0
+        self.texture = self._state_textures[int(values[offset + 9])]
+        if self.dying:
+            self.hit_box = self._dead_hit_box
+        else:
+            self._sync_hit_box_with_direction()
+        self.position = (values[offset], values[offset + 1])
+        # A freshly assigned hit box is not moved by an unchanged position.
+        self.hit_box.position = self.position
+        self.change_x = values[offset + 2]
+        self.change_y = values[offset + 3]
+        return offset + 10
+
     def update_animation(self, delta_time: float = 1 / 60):
         # Figure out if we need to flip face left or right
         if self.change_x < 0 and self.character_face_direction == RIGHT_FACING:
@@ -132,6 +197,21 @@ class PlayerCharacter(arcade.Sprite):
         self.update_walk += 1
 
 
+class GhostCharacter(arcade.Sprite):
+    """Translucent replay of a stored run, drawn with the live player's textures."""
+
+    def __init__(self, player: PlayerCharacter, alpha: int):
+        self._state_textures = player.state_textures
+        super().__init__(self._state_textures[player.texture_state_index], scale=player.scale)
+        self.alpha = alpha
+
+    def show_frame(self, center_x: float, center_y: float, texture_state_index: int) -> None:
+        texture = self._state_textures[texture_state_index]
+        if self.texture is not texture:
+            self.texture = texture
+        self.position = (center_x, center_y)
+
+
 def load_texture_pair(filename):
     """
     Load a texture pair, with the second being a mirror image.
@@ -237,7 +317,54 @@ class Item(arcade.Sprite):
         )
 
 
+@dataclass(frozen=True, slots=True)
+class MovingHazardSpec:
+    """A ``moving_hazard`` map object: a `TriangleHazard` and its base velocity."""
+
+    center_x: float
+    center_y: float
+    width: float
+    height: float
+    speed_x: float  # px per step at run speed 1
+    speed_y: float
+
+
+@dataclass(frozen=True, slots=True)
+class SkullHazardSpec:
+    """A ``skull_hazard`` map object; ``hit_box_points`` come from its polygon, if any."""
+
+    center_x: float
+    center_y: float
+    width: float
+    height: float
+    speed_x: float
+    speed_y: float
+    hit_box_points: tuple[tuple[float, float], ...] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LaserHazardSpec:
+    """A ``laser_hazard`` map object: the beam rectangle of a `TimedLaserBeamHazard`."""
+
+    center_x: float
+    center_y: float
+    width: float
+    height: float
+
+
 class TriangleHazard(arcade.Sprite):
+    # arcade.Sprite keeps an instance dict, so these only move the hazard's own fields to slots.
+    __slots__ = (
+        "rect_width",
+        "rect_height",
+        "rect_color",
+        "bounds",
+        "_base_change",
+        "speed_multiplier",
+        "_timeline_origin",
+        "elapsed_steps",
+    )
+
     def __init__(
         self,
         width: float = DEFAULT_ITEM_WIDTH,
@@ -276,6 +403,7 @@ class TriangleHazard(arcade.Sprite):
             self.rect_height / 2,
             SCREEN_HEIGHT - self.rect_height / 2,
         )
+        self.set_motion(0.0, 0.0)
 
     def _build_triangle_hit_box(self, width: float, height: float):
         half_width = width / 2
@@ -305,24 +433,58 @@ class TriangleHazard(arcade.Sprite):
             top - self.rect_height / 2,
         )
 
+    def set_motion(self, base_change_x: float, base_change_y: float, speed_multiplier: float = 1.0):
+        """Start the motion timeline from the current position (call after `set_bounds`)."""
+        self._base_change = (float(base_change_x), float(base_change_y))
+        self.speed_multiplier = speed_multiplier
+        self.change_x = self._base_change[0] * speed_multiplier
+        self.change_y = self._base_change[1] * speed_multiplier
+        self._timeline_origin = (self.center_x, self.center_y)
+        self.elapsed_steps = 0
+
+    def position_at(self, steps: int, speed_multiplier: float | None = None) -> tuple[float, float]:
+        """Center after ``steps`` updates; wraps horizontally, moves freely vertically."""
+        multiplier = self.speed_multiplier if speed_multiplier is None else speed_multiplier
+        origin_x, origin_y = self._timeline_origin
+        left_bound, right_bound, _, _ = self.bounds
+        return (
+            wrapped_position(origin_x, self._base_change[0] * multiplier, left_bound, right_bound, steps),
+            origin_y + (self._base_change[1] * multiplier * steps),
+        )
+
+    def seek(self, steps: int):
+        self.elapsed_steps = steps
+        self.center_x, self.center_y = self.position_at(steps)
+
+    STATE_FIELDS: tuple[str, ...] = ("elapsed_steps",)
+
+    def capture_state(self, out: array) -> None:
+        out.append(float(self.elapsed_steps))
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.seek(int(values[offset]))
+        return offset + 1
+
     def update(self):
-        self.center_x += self.change_x
-        self.center_y += self.change_y
-        left_bound, right_bound, bottom_bound, top_bound = self.bounds
-        
-        # Wrap around horizontally
-        if self.change_x < 0 and self.center_x < left_bound:
-            self.center_x = right_bound
-        elif self.change_x > 0 and self.center_x > right_bound:
-            self.center_x = left_bound
+        self.seek(self.elapsed_steps + 1)
 
 
 class SkullHazard(arcade.Sprite):
+    __slots__ = (
+        "rect_width",
+        "rect_height",
+        "bounds",
+        "_base_change",
+        "speed_multiplier",
+        "_timeline_origin",
+        "elapsed_steps",
+    )
+
     def __init__(
         self,
         width: float = DEFAULT_ITEM_WIDTH,
         height: float = DEFAULT_ITEM_HEIGHT,
-        hit_box_points: list[tuple[float, float]] | None = None,
+        hit_box_points: Sequence[tuple[float, float]] | None = None,
     ):
         super().__init__()
 
@@ -350,6 +512,7 @@ class SkullHazard(arcade.Sprite):
             self.rect_height / 2,
             SCREEN_HEIGHT - self.rect_height / 2,
         )
+        self.set_motion(0.0, 0.0)
 
     def _build_rect_hit_box(self, width: float, height: float):
         half_width = width / 2
@@ -372,23 +535,57 @@ class SkullHazard(arcade.Sprite):
             top + self.rect_height / 2,
         )
 
-    def update(self):
-        self.center_x += self.change_x
-        self.center_y += self.change_y
+    def set_motion(self, base_change_x: float, base_change_y: float, speed_multiplier: float = 1.0):
+        """Start the motion timeline from the current position (call after `set_bounds`)."""
+        self._base_change = (float(base_change_x), float(base_change_y))
+        self.speed_multiplier = speed_multiplier
+        self.change_x = self._base_change[0] * speed_multiplier
+        self.change_y = self._base_change[1] * speed_multiplier
+        self._timeline_origin = (self.center_x, self.center_y)
+        self.elapsed_steps = 0
+
+    def position_at(self, steps: int, speed_multiplier: float | None = None) -> tuple[float, float]:
+        """Center after ``steps`` updates; wraps on both axes."""
+        multiplier = self.speed_multiplier if speed_multiplier is None else speed_multiplier
+        origin_x, origin_y = self._timeline_origin
         left_bound, right_bound, bottom_bound, top_bound = self.bounds
+        return (
+            wrapped_position(origin_x, self._base_change[0] * multiplier, left_bound, right_bound, steps),
+            wrapped_position(origin_y, self._base_change[1] * multiplier, bottom_bound, top_bound, steps),
+        )
+
+    def seek(self, steps: int):
+        self.elapsed_steps = steps
+        self.center_x, self.center_y = self.position_at(steps)
+
+    STATE_FIELDS: tuple[str, ...] = ("elapsed_steps",)
 
-        if self.change_x < 0 and self.center_x < left_bound:
-            self.center_x = right_bound
-        elif self.change_x > 0 and self.center_x > right_bound:
-            self.center_x = left_bound
+    def capture_state(self, out: array) -> None:
+        out.append(float(self.elapsed_steps))
 
-        if self.change_y < 0 and self.center_y < bottom_bound:
-            self.center_y = top_bound
-        elif self.change_y > 0 and self.center_y > top_bound:
-            self.center_y = bottom_bound
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.seek(int(values[offset]))
+        return offset + 1
+
+    def update(self):
+        self.seek(self.elapsed_steps + 1)
 
 
 class TimedLaserBeamHazard(arcade.SpriteSolidColor):
+    __slots__ = (
+        "rect_width",
+        "rect_height",
+        "_active_alpha",
+        "_active_hit_box",
+        "_inactive_hit_box",
+        "active_duration",
+        "inactive_duration",
+        "_cycle_duration",
+        "_phase_offset",
+        "elapsed_seconds",
+        "is_active",
+    )
+
     _ZERO_HIT_BOX_POINTS = [
         (0.0, 0.0),
         (0.0, 0.0),
@@ -425,8 +622,9 @@ class TimedLaserBeamHazard(arcade.SpriteSolidColor):
         self.active_duration = max(0.05, float(active_duration))
         self.inactive_duration = max(0.05, float(inactive_duration))
         self._cycle_duration = self.active_duration + self.inactive_duration
-        self._elapsed_seconds = float(phase_offset) % self._cycle_duration
-        self.is_active = self._elapsed_seconds >= self.active_duration
+        self._phase_offset = float(phase_offset) % self._cycle_duration
+        self.elapsed_seconds = 0.0
+        self.is_active = not self.is_active_at(0.0)
         self._sync_state()
 
     def _build_rect_hit_box(self, width: float, height: float) -> list[tuple[float, float]]:
@@ -439,8 +637,12 @@ class TimedLaserBeamHazard(arcade.SpriteSolidColor):
             (half_width, -half_height),
         ]
 
+    def is_active_at(self, elapsed_seconds: float) -> bool:
+        """Whether the beam is on ``elapsed_seconds`` after level start."""
+        return periodic_phase(self._phase_offset, elapsed_seconds, self._cycle_duration) < self.active_duration
+
     def _sync_state(self) -> None:
-        next_is_active = self._elapsed_seconds < self.active_duration
+        next_is_active = self.is_active_at(self.elapsed_seconds)
         if next_is_active == self.is_active:
             return
         self.is_active = next_is_active
@@ -452,5 +654,17 @@ class TimedLaserBeamHazard(arcade.SpriteSolidColor):
         self.hit_box = self._inactive_hit_box
 
     def advance(self, delta_time: float) -> None:
-        self._elapsed_seconds = (self._elapsed_seconds + max(delta_time, 0.0)) % self._cycle_duration
+        self.seek(self.elapsed_seconds + max(delta_time, 0.0))
+
+    def seek(self, elapsed_seconds: float) -> None:
+        self.elapsed_seconds = elapsed_seconds
         self._sync_state()
+
+    STATE_FIELDS: tuple[str, ...] = ("elapsed_seconds",)
+
+    def capture_state(self, out: array) -> None:
+        out.append(self.elapsed_seconds)
+
+    def restore_state(self, values: StateValues, offset: int) -> int:
+        self.seek(values[offset])
+        return offset + 1
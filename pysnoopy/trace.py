@@ -0,0 +1,405 @@
+"""Compact binary trace files: per-step inputs, state hashes and sampled state.
+
+Layout (all integers little-endian)::
+
+    header    MAGIC, u16 version, u32 length, JSON metadata
+    steps     one entry per simulation step, in order
+    index     keyframe_count * (u64 step, u64 file offset of that step's entry)
+    footer    u64 index offset, u64 keyframe count, u64 step count, FOOTER_MAGIC
+
+A step entry starts with a flags byte: bit 0 state hash present, bit 1 state
+sample present, bit 2 keyframe, bit 3 markers present, bits 4-7 the input
+event count (15 means a varint count follows). Events are one byte each,
+``action_code << 1 | pressed`` with codes indexing the ``actions`` list of the
+metadata. Markers (gameplay events such as a death) follow as a varint count
+and, per marker, a varint code into the ``marker_kinds`` list of the metadata
+and a varint-length UTF-8 detail string. Then the CRC-32 state
+hash (u32), then the state sample: a varint value count followed by either the
+raw doubles (keyframe) or, per value, the XOR with the previous sample with its
+trailing zero bits stripped (``0`` for unchanged, else ``zeros + 1`` and a varint).
+Unchanged and integer-like values therefore take one or two bytes.
+
+Keyframes reset the XOR base every ``keyframe_interval`` steps and are listed
+in the trailing index, so `TraceReader` maps the file and reaches any step with
+a binary search plus at most one keyframe interval of decoding. A file whose
+writer never closed (a crash) has no index; the reader then rebuilds it by
+scanning the complete step entries.
+
+Version 1 files (no marker flag, event count in bits 3-7 with escape 31) are
+still read.
+"""
+import bisect
+import json
+import mmap
+import struct
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Sequence
+
+MAGIC = b"SNPYTRC\x00"
+FOOTER_MAGIC = b"SNPYIDX\x00"
+TRACE_FORMAT_VERSION = 2
+_READABLE_VERSIONS = (1, TRACE_FORMAT_VERSION)
+
+_HEADER_PREFIX = struct.Struct("<8sHI")
+_INDEX_ENTRY = struct.Struct("<QQ")
+_FOOTER = struct.Struct("<QQQ8s")
+_HASH = struct.Struct("<I")
+
+_FLAG_HASH = 0x01
+_FLAG_SAMPLE = 0x02
+_FLAG_KEYFRAME = 0x04
+_FLAG_MARKERS = 0x08
+_EVENT_COUNT_SHIFT = 4
+_EVENT_COUNT_ESCAPE = 15
+# (event count shift, escape) per readable format version.
+_EVENT_COUNT_LAYOUTS = {1: (3, 31), TRACE_FORMAT_VERSION: (_EVENT_COUNT_SHIFT, _EVENT_COUNT_ESCAPE)}
+
+DEFAULT_KEYFRAME_INTERVAL = 300
+DEFAULT_SAMPLE_INTERVAL = 1
+
+
+def is_trace_file(path: str | Path) -> bool:
+    with open(path, "rb") as file_handle:
+        return file_handle.read(len(MAGIC)) == MAGIC
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: Any, offset: int) -> tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _double_bits(values: Sequence[float]) -> array:
+    bits = array("Q")
+    bits.frombytes(array("d", values).tobytes())
+    return bits
+
+
+def _zero_bits(count: int) -> array:
+    return array("Q", bytes(8 * count))
+
+
+@dataclass(slots=True)
+class TraceStep:
+    step: int
+    events: list[tuple[str, bool]]
+    state_hash: int | None
+    state: array | None
+    markers: list[tuple[str, str]]  # (kind, detail)
+
+
+class TraceWriter:
+    """Streams step entries to ``path``; call `close` to write the index."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        metadata: dict[str, Any],
+        actions: Sequence[str],
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+        sample_interval: int = DEFAULT_SAMPLE_INTERVAL,
+        marker_kinds: Sequence[str] = (),
+    ):
+        if keyframe_interval < 1 or sample_interval < 1:
+            raise ValueError("keyframe_interval and sample_interval must be >= 1")
+        self.keyframe_interval = keyframe_interval
+        self.sample_interval = sample_interval
+        self._action_codes = {action: code for code, action in enumerate(actions)}
+        self._marker_codes = {kind: code for code, kind in enumerate(marker_kinds)}
+        self._file: BinaryIO | None = open(path, "wb")
+        self._buffer = bytearray()
+        self._previous_bits = array("Q")
+        self._keyframes: list[tuple[int, int]] = []
+        self.steps = 0
+
+        header = dict(metadata)
+        header.update(
+            actions=list(actions),
+            marker_kinds=list(marker_kinds),
+            keyframe_interval=keyframe_interval,
+            sample_interval=sample_interval,
+        )
+        header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        self._file.write(_HEADER_PREFIX.pack(MAGIC, TRACE_FORMAT_VERSION, len(header_bytes)))
+        self._file.write(header_bytes)
+        self._offset = _HEADER_PREFIX.size + len(header_bytes)
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def write_step(
+        self,
+        events: Sequence[tuple[str, bool]],
+        state_hash: int | None,
+        state: Sequence[float] | None,
+        markers: Sequence[tuple[str, str]] = (),
+    ) -> None:
+        """Append the entry of the next step; ``state`` is stored when a sample or keyframe is due."""
+        assert self._file is not None, "trace writer is closed"
+        step = self.steps
+        keyframe = state is not None and step % self.keyframe_interval == 0
+        sample = state is not None and (keyframe or step % self.sample_interval == 0)
+        event_count = len(events)
+
+        out = self._buffer
+        out.clear()
+        flags = min(event_count, _EVENT_COUNT_ESCAPE) << _EVENT_COUNT_SHIFT
+        if state_hash is not None:
+            flags |= _FLAG_HASH
+        if sample:
+            flags |= _FLAG_SAMPLE
+        if keyframe:
+            flags |= _FLAG_KEYFRAME
+        if markers:
+            flags |= _FLAG_MARKERS
+        out.append(flags)
+        if event_count >= _EVENT_COUNT_ESCAPE:
+            _write_varint(out, event_count)
+        for action, pressed in events:
+            out.append((self._action_codes[action] << 1) | int(pressed))
+        self._write_markers(out, markers)
+        if state_hash is not None:
+            out += _HASH.pack(state_hash)
+        if sample:
+            assert state is not None
+            self._write_sample(out, state, keyframe)
+        if keyframe:
+            self._keyframes.append((step, self._offset))
+
+        self._file.write(out)
+        self._offset += len(out)
+        self.steps += 1
+
+    def _write_markers(self, out: bytearray, markers: Sequence[tuple[str, str]]) -> None:
+        if not markers:
+            return
+        _write_varint(out, len(markers))
+        for kind, detail in markers:
+            detail_bytes = detail.encode("utf-8")
+            _write_varint(out, self._marker_codes[kind])
+            _write_varint(out, len(detail_bytes))
+            out += detail_bytes
+
+    def _write_sample(self, out: bytearray, state: Sequence[float], keyframe: bool) -> None:
+        bits = _double_bits(state)
+        _write_varint(out, len(bits))
+        if keyframe:
+            out += struct.pack(f"<{len(bits)}d", *state)
+        else:
+            previous = self._previous_bits if len(self._previous_bits) == len(bits) else _zero_bits(len(bits))
+            for value, previous_value in zip(bits, previous):
+                delta = value ^ previous_value
+                if delta == 0:
+                    out.append(0)
+                    continue
+                trailing_zeros = (delta & -delta).bit_length() - 1
+                out.append(trailing_zeros + 1)
+                _write_varint(out, delta >> trailing_zeros)
+        self._previous_bits = bits
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        index_offset = self._offset
+        for step, offset in self._keyframes:
+            self._file.write(_INDEX_ENTRY.pack(step, offset))
+        self._file.write(_FOOTER.pack(index_offset, len(self._keyframes), self.steps, FOOTER_MAGIC))
+        self._file.close()
+        self._file = None
+
+
+class TraceReader:
+    """Memory-mapped random access to a trace written by `TraceWriter`."""
+
+    def __init__(self, path: str | Path):
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path}: empty trace file") from None
+        magic, version, header_length = _HEADER_PREFIX.unpack_from(self._data, 0)
+        if magic != MAGIC or version not in _READABLE_VERSIONS:
+            self.close()
+            raise ValueError(f"{path}: not a version {TRACE_FORMAT_VERSION} trace file")
+        self.version = version
+        self._event_count_shift, self._event_count_escape = _EVENT_COUNT_LAYOUTS[version]
+        self._body_offset = _HEADER_PREFIX.size + header_length
+        self.metadata: dict[str, Any] = json.loads(self._data[_HEADER_PREFIX.size:self._body_offset])
+        self.actions: list[str] = self.metadata["actions"]
+        self.marker_kinds: list[str] = self.metadata.get("marker_kinds", [])
+        self._read_index()
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return self.steps
+
+    def _read_index(self) -> None:
+        data = self._data
+        if len(data) >= self._body_offset + _FOOTER.size:
+            index_offset, keyframe_count, steps, magic = _FOOTER.unpack_from(data, len(data) - _FOOTER.size)
+            if magic == FOOTER_MAGIC:
+                self.steps = steps
+                self._index_offset = index_offset
+                self._keyframe_steps: Sequence[int] = _IndexColumn(data, index_offset, keyframe_count, 0)
+                self._keyframe_offsets: Sequence[int] = _IndexColumn(data, index_offset, keyframe_count, 1)
+                return
+        self._scan_index()
+
+    def _scan_index(self) -> None:
+        """Rebuild the index of an unclosed trace from its complete step entries."""
+        steps: list[int] = []
+        offsets: list[int] = []
+        offset = self._body_offset
+        step = 0
+        previous: array | None = None
+        end = len(self._data)
+        while offset < end:
+            try:
+                entry, next_offset = self._decode_entry(offset, step, previous)
+            except (IndexError, struct.error):
+                break
+            if self._data[offset] & _FLAG_KEYFRAME:
+                steps.append(step)
+                offsets.append(offset)
+            previous = entry.state if entry.state is not None else previous
+            offset = next_offset
+            step += 1
+        self.steps = step
+        self._index_offset = offset
+        self._keyframe_steps = steps
+        self._keyframe_offsets = offsets
+
+    @property
+    def keyframe_steps(self) -> Sequence[int]:
+        return self._keyframe_steps
+
+    def read_step(self, step: int) -> TraceStep:
+        """Decode ``step``, starting from the nearest keyframe at or before it."""
+        for entry in self.iter_steps(step, step + 1):
+            return entry
+        raise IndexError(f"step {step} outside trace of {self.steps} steps")
+
+    def iter_steps(self, start: int = 0, stop: int | None = None) -> Iterator[TraceStep]:
+        stop = self.steps if stop is None else min(stop, self.steps)
+        if start >= stop:
+            return
+        keyframe_index = bisect.bisect_right(self._keyframe_steps, start) - 1
+        if keyframe_index >= 0:
+            step = self._keyframe_steps[keyframe_index]
+            offset = self._keyframe_offsets[keyframe_index]
+        else:
+            step = 0
+            offset = self._body_offset
+        previous: array | None = None
+        while step < stop:
+            entry, offset = self._decode_entry(offset, step, previous)
+            if entry.state is not None:
+                previous = entry.state
+            if step >= start:
+                yield entry
+            step += 1
+
+    def _decode_entry(self, offset: int, step: int, previous: array | None) -> tuple[TraceStep, int]:
+        data = self._data
+        flags = data[offset]
+        offset += 1
+        event_count = flags >> self._event_count_shift
+        if event_count == self._event_count_escape:
+            event_count, offset = _read_varint(data, offset)
+        events = [(self.actions[byte >> 1], bool(byte & 1)) for byte in data[offset:offset + event_count]]
+        if len(events) != event_count:
+            raise IndexError("truncated step entry")
+        offset += event_count
+        markers: list[tuple[str, str]] = []
+        if self.version > 1 and flags & _FLAG_MARKERS:
+            markers, offset = self._decode_markers(offset)
+        state_hash = None
+        if flags & _FLAG_HASH:
+            (state_hash,) = _HASH.unpack_from(data, offset)
+            offset += _HASH.size
+        state = None
+        if flags & _FLAG_SAMPLE:
+            state, offset = self._decode_sample(offset, bool(flags & _FLAG_KEYFRAME), previous)
+        return TraceStep(step, events, state_hash, state, markers), offset
+
+    def _decode_markers(self, offset: int) -> tuple[list[tuple[str, str]], int]:
+        data = self._data
+        count, offset = _read_varint(data, offset)
+        markers = []
+        for _ in range(count):
+            code, offset = _read_varint(data, offset)
+            length, offset = _read_varint(data, offset)
+            detail = data[offset:offset + length]
+            if len(detail) != length:
+                raise IndexError("truncated step entry")
+            markers.append((self.marker_kinds[code], detail.decode("utf-8")))
+            offset += length
+        return markers, offset
+
+    def _decode_sample(self, offset: int, keyframe: bool, previous: array | None) -> tuple[array, int]:
+        data = self._data
+        count, offset = _read_varint(data, offset)
+        if keyframe:
+            state = array("d", struct.unpack_from(f"<{count}d", data, offset))
+            return state, offset + (8 * count)
+        base = _double_bits(previous) if previous is not None and len(previous) == count else _zero_bits(count)
+        for value_index in range(count):
+            tag = data[offset]
+            offset += 1
+            if tag == 0:
+                continue
+            delta, offset = _read_varint(data, offset)
+            base[value_index] ^= delta << (tag - 1)
+        state = array("d")
+        state.frombytes(base.tobytes())
+        return state, offset
+
+
+class _IndexColumn(Sequence[int]):
+    """One column of the on-disk keyframe index, read lazily for `bisect`."""
+
+    def __init__(self, data: mmap.mmap, offset: int, count: int, column: int):
+        self._data = data
+        self._offset = offset
+        self._count = count
+        self._column = column
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return _INDEX_ENTRY.unpack_from(self._data, self._offset + (index * _INDEX_ENTRY.size))[self._column]
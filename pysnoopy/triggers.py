@@ -0,0 +1,157 @@
+"""Trigger volumes: level rectangles that react to the player entering, staying and leaving.
+
+Levels place ``trigger`` rectangle objects in Tiled with a ``kind`` property:
+
+- ``exit``: reaching it clears the level, as does leaving the screen to the right.
+- ``kill``: the player dies inside it.
+- ``checkpoint``: after entering it, death restarts continue from that step.
+- ``boost``: a conveyor strip; the level hook decides how fast it carries.
+- ``activation``: an area a level hook reacts to, such as an elevator shaft.
+
+`TriggerVolumes` indexes the volumes of one level by grid column when the level
+is set up, like the ``ground`` index of `pysnoopy/physics.py`, so a query only
+tests the volumes in the few columns the player spans. `GameView` calls
+`update` once per simulation step with the player's final hit box bounds and
+dispatches enter, stay and leave callbacks per kind; hooks that need an answer
+at another point of the step ask `overlapping`. Which volumes the player is in
+follows from the player position, so it is not part of the state record:
+restoring a record calls `refresh`.
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+import arcade
+
+from .globals import SPRITE_PIXEL_SIZE, TILE_SCALING
+
+TRIGGER_EXIT = "exit"
+TRIGGER_KILL = "kill"
+TRIGGER_CHECKPOINT = "checkpoint"
+TRIGGER_BOOST = "boost"
+TRIGGER_ACTIVATION = "activation"
+TRIGGER_KINDS = (TRIGGER_EXIT, TRIGGER_KILL, TRIGGER_CHECKPOINT, TRIGGER_BOOST, TRIGGER_ACTIVATION)
+
+_INDEX_COLUMN_PX = SPRITE_PIXEL_SIZE * TILE_SCALING  # one tile
+
+# left, right, bottom, top
+Bounds = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class TriggerVolume:
+    kind: str
+    left: float
+    right: float
+    bottom: float
+    top: float
+
+    def overlaps(self, bounds: Bounds) -> bool:
+        left, right, bottom, top = bounds
+        return right > self.left and left < self.right and top > self.bottom and bottom < self.top
+
+
+TriggerCallback = Callable[[TriggerVolume], None]
+
+
+def trigger_volume(obj: dict[str, Any], map_height: float) -> TriggerVolume:
+    """Build the volume of a Tiled ``trigger`` rectangle; raise ValueError when it is malformed."""
+    width = float(obj.get("width", 0.0)) * TILE_SCALING
+    height = float(obj.get("height", 0.0)) * TILE_SCALING
+    if width <= 0 or height <= 0 or "polygon" in obj or "polyline" in obj:
+        raise ValueError("must be a rectangle with positive width and height")
+    kind = None
+    properties = obj.get("properties", [])
+    if isinstance(properties, list):
+        kind = next(
+            (item.get("value") for item in properties if isinstance(item, dict) and item.get("name") == "kind"),
+            None,
+        )
+    if kind not in TRIGGER_KINDS:
+        raise ValueError(f"'kind' must be one of {', '.join(TRIGGER_KINDS)}")
+    left = float(obj.get("x", 0.0)) * TILE_SCALING
+    top = map_height - float(obj.get("y", 0.0)) * TILE_SCALING
+    return TriggerVolume(kind=kind, left=left, right=left + width, bottom=top - height, top=top)
+
+
+def hit_box_bounds(sprite: arcade.Sprite) -> Bounds:
+    """Bounds of the hit box points of ``sprite`` around its center, as the level hooks measure the player."""
+    xs, ys = zip(*sprite.hit_box.points)
+    center_x, center_y = sprite.position
+    return center_x + min(xs), center_x + max(xs), center_y + min(ys), center_y + max(ys)
+
+
+class TriggerVolumes:
+    """The trigger volumes of one level, with the player's occupancy and per-kind callbacks."""
+
+    def __init__(self, volumes: Sequence[TriggerVolume]):
+        self.volumes = tuple(volumes)
+        columns: dict[int, list[int]] = {}
+        for index, volume in enumerate(self.volumes):
+            for column in range(_column(volume.left), _column(volume.right) + 1):
+                columns.setdefault(column, []).append(index)
+        self._columns = {column: tuple(indices) for column, indices in columns.items()}
+        self._callbacks: dict[str, tuple[TriggerCallback | None, TriggerCallback | None, TriggerCallback | None]] = {}
+        self.inside: frozenset[int] = frozenset()  # indices of the volumes the player was in at the last update
+
+    def of_kind(self, kind: str) -> list[TriggerVolume]:
+        return [volume for volume in self.volumes if volume.kind == kind]
+
+    def on(
+        self,
+        kind: str,
+        *,
+        enter: TriggerCallback | None = None,
+        stay: TriggerCallback | None = None,
+        leave: TriggerCallback | None = None,
+    ) -> None:
+        """Call ``enter``, ``stay`` and ``leave`` from `update` for volumes of ``kind``."""
+        self._callbacks[kind] = (enter, stay, leave)
+
+    def overlapping(self, bounds: Bounds, kind: str) -> TriggerVolume | None:
+        """A volume of ``kind`` that ``bounds`` overlaps, without touching the occupancy."""
+        left, right, _, _ = bounds
+        volumes = self.volumes
+        for column in range(_column(left), _column(right) + 1):
+            for index in self._columns.get(column, ()):
+                volume = volumes[index]
+                if volume.kind == kind and volume.overlaps(bounds):
+                    return volume
+        return None
+
+    def occupied(self, kind: str) -> bool:
+        """Whether the player was in a volume of ``kind`` at the last `update` or `refresh`."""
+        return any(self.volumes[index].kind == kind for index in self.inside)
+
+    def update(self, bounds: Bounds) -> None:
+        """Move the player to ``bounds``: leave callbacks first, then enter and stay in volume order."""
+        previous = self.inside
+        current = self._overlapping_indices(bounds)
+        self.inside = frozenset(current)
+        for index in sorted(previous.difference(self.inside)):
+            self._dispatch(index, 2)
+        for index in current:
+            self._dispatch(index, 1 if index in previous else 0)
+
+    def refresh(self, bounds: Bounds) -> None:
+        """Set the occupancy for ``bounds`` without callbacks (level setup, restored records)."""
+        self.inside = frozenset(self._overlapping_indices(bounds))
+
+    def _dispatch(self, index: int, slot: int) -> None:
+        volume = self.volumes[index]
+        callbacks = self._callbacks.get(volume.kind)
+        callback = None if callbacks is None else callbacks[slot]
+        if callback is not None:
+            callback(volume)
+
+    def _overlapping_indices(self, bounds: Bounds) -> list[int]:
+        left, right, _, _ = bounds
+        candidates: set[int] = set()
+        for column in range(_column(left), _column(right) + 1):
+            candidates.update(self._columns.get(column, ()))
+        volumes = self.volumes
+        return [index for index in sorted(candidates) if volumes[index].overlaps(bounds)]
+
+
+def _column(x: float) -> int:
+    return math.floor(x / _INDEX_COLUMN_PX)
@@ -30,6 +30,9 @@ def main(argv: list[str] | None = None) -> int:
             spawn_object_name=level.spawn_object_name,
             exit_object_name=level.exit_object_name,
             moving_hazard_object_name=level.moving_hazard_object_name,
+            scrolling_platform_object_name=level.scrolling_platform_object_name,
+            path_platform_object_name=level.path_platform_object_name,
+            trigger_object_name=level.trigger_object_name,
             required_object_names=level.required_object_names,
         )
 
@@ -1,49 +1,157 @@
 import json
+from dataclasses import astuple
 
 from .globals import (
     CHARACTER_SCALING,
     DEATH_FALL_GRAVITY_MULTIPLIER,
+    GHOST_ALPHA,
     LEDGE_MIN_GROUND_OVERLAP_TILES,
+    INTERPOLATION_SNAP_DISTANCE,
     LEDGE_OBSTACLE_FOOT_Y_TOLERANCE,
+    MAX_SIMULATION_STEPS_PER_UPDATE,
     MUSIC_SPEED_MULTIPLIER_STEP,
     MOVING_HAZARD_SIZE_SCALE,
     TILE_SCALING,
     PLAYER_GROUND_OFFSET,
     PLAYER_GROUND_OFFSET_STEP,
     PLAYER_START_X,
+    REWIND_HISTORY_STEPS,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     SHOW_HITBOXES,
+    SIMULATION_STEP_SECONDS,
     RUN_SPEED_MULTIPLIER_STEP,
 )
-from .game_state import GameState, LevelRuntimeSettings
+from .audio import GameplaySounds
+from .collision import collides_between_substeps, physics_substeps, update_physics_substeps
+from .events import (
+    DEATH_KILL_ZONE,
+    DEATH_LASER_HAZARD,
+    DEATH_MOVING_HAZARD,
+    DEATH_OBSTACLE,
+    DEATH_OUT_OF_WORLD,
+    DEATH_PLATFORM_SUPPORT,
+    DEATH_SKULL_HAZARD,
+    EVENT_CHECKPOINT,
+    EVENT_DEATH,
+    EVENT_JUMP,
+    EVENT_LAND,
+    EVENT_LEVEL_CLEAR,
+    EVENT_LEVEL_START,
+    EVENT_LOG_EVENTS,
+    EVENT_MUSIC_RESTART,
+    EVENT_REWIND_START,
+    EVENT_ROUND_WRAP,
+    EVENT_STATE_LOADED,
+    EVENT_STATE_SAVED,
+    EVENT_WALK_START,
+    EVENT_WALK_STOP,
+    EventBus,
+    print_event_log,
+)
+from .fixed_point import quantize, quantize_motion
+from .game_state import GameState, LevelRuntimeSettings, ResolvedSettings, resolve_settings
+from .ghosts import GHOST_STATE_FIELDS, GhostPlayback, GhostRecorder, ghost_trace_path
+from .heatmap import DeathHeatmap
 from .level_validation import validate_level_file
-from .levels import Level3Hook, Level7Hook, LevelHook, LevelSpec, get_default_levels
-from .sprites import PlayerCharacter, SkullHazard, TimedLaserBeamHazard, TriangleHazard
+from .levels import (
+    PHASE_CAMERA,
+    PHASE_DRAW,
+    PHASE_POST_PHYSICS,
+    PHASE_PRE_PHYSICS,
+    PHASE_SUPPORT_CHECK,
+    LaserSchedule,
+    LevelHook,
+    LevelSpec,
+    get_default_levels,
+)
+from .rendering import SpriteInterpolator, bake_static_layers, is_baked_layer, lerp
+from .replay import (
+    ACTION_JUMP,
+    ACTION_LEFT,
+    ACTION_LOAD_STATE,
+    ACTION_REWIND,
+    ACTION_RIGHT,
+    ACTION_SAVE_STATE,
+    HELD_ACTIONS,
+    REPLAY_MARKER_EVENTS,
+)
+from .physics import GridPhysicsEngine
+from .platforms import (
+    PathPlatforms,
+    PathPlatformSpec,
+    ScrollingPlatforms,
+    ScrollingPlatformSpec,
+    path_platform_spec,
+    scrolling_platform_spec,
+)
+from .resources import ResourceMonitor
+from .snapshots import StateHistory, StateValues, new_state_record
+from .sprites import (
+    GhostCharacter,
+    LaserHazardSpec,
+    MovingHazardSpec,
+    PlayerCharacter,
+    SkullHazard,
+    SkullHazardSpec,
+    TimedLaserBeamHazard,
+    TriangleHazard,
+)
+from .triggers import (
+    TRIGGER_CHECKPOINT,
+    TRIGGER_EXIT,
+    TRIGGER_KILL,
+    TriggerVolume,
+    TriggerVolumes,
+    hit_box_bounds,
+    trigger_volume,
+)
 
-import random
 import types
-from typing import cast
+from array import array
+from pathlib import Path
+from typing import Any, Callable, cast
 
 import arcade
 
+GAMEPLAY_KEY_ACTIONS: dict[int, str] = {
+    arcade.key.UP: ACTION_JUMP,
+    arcade.key.W: ACTION_JUMP,
+    arcade.key.LEFT: ACTION_LEFT,
+    arcade.key.A: ACTION_LEFT,
+    arcade.key.RIGHT: ACTION_RIGHT,
+    arcade.key.D: ACTION_RIGHT,
+    arcade.key.R: ACTION_REWIND,
+    arcade.key.F5: ACTION_SAVE_STATE,
+    arcade.key.F9: ACTION_LOAD_STATE,
+}
+
 
 class GameView(arcade.View):
+    _VIEW_STATE_FIELDS = (
+        "jump_committed_change_x",
+        "jump_start_grace_remaining",
+        "camera_center_y",
+        "left_pressed",
+        "right_pressed",
+        "up_pressed",
+        "jumps_since_ground",
+        "attempt_steps",
+    )
+
     def __init__(self, start_level: int = 1, game_state: GameState | None = None):
         super().__init__()
         self.game_state = game_state if game_state is not None else GameState()
         self.background_texture = arcade.load_texture("../assets/images/doghouse.png")
 
-        self.jump_sound = arcade.load_sound("../assets/sound/jump.wav", streaming=False)
-        self.fall_sound = arcade.load_sound("../assets/sound/fall.wav", streaming=False)
-        self.step_sound = arcade.load_sound(
-            "../assets/sound/steps.wav", streaming=False
-        )
-        self.fall_sound_player = None
-        self.step_sound_player = None
+        self.events = EventBus()
+        self.sounds = GameplaySounds(self.game_state)
+        self._walking = False  # whether a walk start was the last walk event sent
 
-        self.physics_engine: arcade.PhysicsEnginePlatformer | None = None
+        self.physics_engine: GridPhysicsEngine | None = None
         self.scene: arcade.Scene | None = None
+        self.scene_layer_order: list[str] = []
+        self.scene_draw_order: list[str] = []
         self.camera: arcade.Camera2D | None = None
         self.player_ground_offset = PLAYER_GROUND_OFFSET
         self.show_hitboxes = SHOW_HITBOXES
@@ -55,6 +163,15 @@ class GameView(arcade.View):
             12,
             bold=True,
         )
+        self.resources = ResourceMonitor()
+        self.resources_text = arcade.Text(
+            "",
+            10,
+            SCREEN_HEIGHT - 44,
+            arcade.color.BLACK,
+            12,
+            bold=True,
+        )
 
         self.tile_map: arcade.TileMap | None = None
         self.left_pressed = False
@@ -63,6 +180,13 @@ class GameView(arcade.View):
         self.jump_committed_change_x = 0
         self.jump_start_grace_remaining = 0.0
         self.level_runtime_settings = LevelRuntimeSettings()
+        self.settings = resolve_settings(
+            self.game_state.reality_settings,
+            self.game_state.round_settings,
+            self.level_runtime_settings,
+            fixed_point=self.game_state.fixed_point,
+        )
+        self._settings_sources: tuple[float, ...] | None = None  # inputs of `settings`; None forces a rebuild
         self.world_bounds: tuple[float, float, float, float] = (
             0.0,
             float(SCREEN_WIDTH),
@@ -70,14 +194,46 @@ class GameView(arcade.View):
             float(SCREEN_HEIGHT),
         )
         self.camera_center_y = float(SCREEN_HEIGHT) / 2
-        self.level_exit_zone: tuple[float, float, float, float] | None = None
+        self.previous_camera_center_y = self.camera_center_y
+        self.simulation_time_accumulator = 0.0
+        self.sprite_interpolator = SpriteInterpolator(INTERPOLATION_SNAP_DISTANCE)
+        self.triggers: TriggerVolumes | None = None
+        self.checkpoint_state: array | None = None  # record death restarts continue from, once reached
 
         self.level_specs: list[LevelSpec] = get_default_levels()
         self.level_index = max(0, min(len(self.level_specs) - 1, start_level - 1))
         self.level_spec = self.level_specs[self.level_index]
         self.level: LevelHook = self.level_spec.create_hook()
+        # Phase methods of the current hook; None for phases it does not take part in.
+        self._hook_pre_physics: Callable[[], None] | None = None
+        self._hook_post_physics: Callable[[], None] | None = None
+        self._hook_draw: Callable[[], None] | None = None
+        self._hook_draw_hit_boxes: Callable[[], None] | None = None
+        self._hook_camera_target_y: Callable[[], float | None] | None = None
+        self._hook_lacks_support: Callable[[arcade.Sprite, Callable[[], float]], bool] | None = None
+        self._bind_level_phases()
         self._validated_level_paths: set[str] = set()
         self.moving_hazards: list[arcade.Sprite] = []
+        self.scrolling_platforms: ScrollingPlatforms | None = None
+        self.path_platforms: PathPlatforms | None = None
+        # Hook platforms (the Level 7 elevator), scrolling and path platform sprites; None without any.
+        self.moving_platforms: arcade.SpriteList | None = None
+        self._player_substep_path: list[tuple[float, float]] = []
+        self._stateful_hazards: list[Any] = []
+        self.level_start_state: array | None = None
+        self.rewind_history: StateHistory | None = None
+        self.rewinding = False
+        self.saved_state: tuple[int, array] | None = None
+        # Gameplay input is queued by the key handlers and applied at the start
+        # of the next simulation step, so a run is reproducible from its inputs.
+        self.pending_inputs: list[tuple[str, bool]] = []
+        self.simulation_step_index = 0
+        self._subscribe_event_handlers()
+        # Steps since the current attempt at the level started (setup or death restart).
+        self.attempt_steps = 0
+        self.ghost_recorder = GhostRecorder()
+        self.ghost_playback: GhostPlayback | None = None
+        self.ghost_sprite: GhostCharacter | None = None
 
     @property
     def player_sprite(self) -> PlayerCharacter:
@@ -85,26 +241,21 @@ class GameView(arcade.View):
         return cast(PlayerCharacter, self.physics_engine.player_sprite)
 
     def setup(self):
-        if self.fall_sound_player and self.fall_sound.is_playing(player=self.fall_sound_player):
-            self.fall_sound.stop(player=self.fall_sound_player)
-        if self.step_sound_player and self.step_sound.is_playing(player=self.step_sound_player):
-            self.step_sound.stop(player=self.step_sound_player)
-        self.fall_sound_player = None
-        self.step_sound_player = None
 
         self.left_pressed = False
         self.right_pressed = False
         self.up_pressed = False
         self.jump_committed_change_x = 0
         self.jump_start_grace_remaining = 0.0
+        self.attempt_steps = 0
         self.level_spec = self.level_specs[self.level_index]
+        self._emit_level_start()
         self.level = self.level_spec.create_hook()
-        self.level_runtime_settings = LevelRuntimeSettings()
-        self.level.configure_level_runtime_settings(self.level_runtime_settings)
-        background_path = "../assets/images/doghouse.png"
-        if self.level_spec.name == "Level 7":
-            background_path = "../assets/images/doghouse_long.png"
-        self.background_texture = arcade.load_texture(background_path)
+        self._bind_level_phases()
+        self.level_runtime_settings = self._new_level_runtime_settings()
+        self._settings_sources = None
+        settings = self._refresh_settings()
+        self.background_texture = arcade.load_texture(self.level_spec.background_path)
         player_sprite = PlayerCharacter(scale=CHARACTER_SCALING)
         player_sprite.center_x = PLAYER_START_X
 
@@ -131,6 +282,9 @@ class GameView(arcade.View):
                 moving_hazard_object_name=self.level_spec.moving_hazard_object_name,
                 skull_hazard_object_name=self.level_spec.skull_hazard_object_name,
                 laser_hazard_object_name=self.level_spec.laser_hazard_object_name,
+                scrolling_platform_object_name=self.level_spec.scrolling_platform_object_name,
+                path_platform_object_name=self.level_spec.path_platform_object_name,
+                trigger_object_name=self.level_spec.trigger_object_name,
                 required_object_names=self.level_spec.required_object_names,
             )
             if not validation_result.is_valid:
@@ -144,7 +298,8 @@ class GameView(arcade.View):
         )
 
         self.scene = arcade.Scene.from_tilemap(self.tile_map)
-        if isinstance(self.level, Level7Hook):
+        self.scene_layer_order = list(self.tile_map.sprite_lists)
+        if self.level_spec.hide_obstacles:
             obstacles = self.tile_map.sprite_lists.get("obstacles")
             if obstacles is not None:
                 for obstacle in obstacles:
@@ -159,62 +314,60 @@ class GameView(arcade.View):
         (
             spawn_point,
             spawn_should_snap_to_ground,
-            self.level_exit_zone,
+            trigger_volumes,
             moving_hazard_specs,
             skull_hazard_specs,
             laser_hazard_specs,
+            scrolling_platform_specs,
+            path_platform_specs,
         ) = self._load_level_objects_from_map()
         self.moving_hazards = []
         for hazard_spec in moving_hazard_specs:
-            hazard = TriangleHazard(width=hazard_spec[2], height=hazard_spec[3])
-            hazard.center_x = hazard_spec[0]
-            hazard.center_y = hazard_spec[1]
-            hazard.change_x = hazard_spec[4] * self._effective_hazard_speed_multiplier()
-            hazard.change_y = hazard_spec[5] * self._effective_hazard_speed_multiplier()
+            hazard = TriangleHazard(width=hazard_spec.width, height=hazard_spec.height)
+            hazard.center_x = hazard_spec.center_x
+            hazard.center_y = hazard_spec.center_y
             hazard.set_bounds(self.world_bounds)
+            self._start_hazard_motion(hazard, hazard_spec.speed_x, hazard_spec.speed_y)
             self.moving_hazards.append(hazard)
         laser_schedule_configs = self.level.laser_schedule_configs()
-        for index, hazard_spec in enumerate(laser_hazard_specs):
-            active_duration, inactive_duration, phase_offset, beam_color = (
-                self._laser_schedule_config_for_index(index, laser_schedule_configs)
-            )
+        for index, laser_spec in enumerate(laser_hazard_specs):
+            schedule = self._laser_schedule_config_for_index(index, laser_schedule_configs)
             beam_hazard = TimedLaserBeamHazard(
-                width=hazard_spec[2],
-                height=hazard_spec[3],
-                color=beam_color,
-                active_duration=active_duration,
-                inactive_duration=inactive_duration,
-                phase_offset=phase_offset,
+                width=laser_spec.width,
+                height=laser_spec.height,
+                color=schedule.color,
+                active_duration=schedule.active_duration,
+                inactive_duration=schedule.inactive_duration,
+                phase_offset=schedule.phase_offset,
             )
-            beam_hazard.center_x = hazard_spec[0]
-            beam_hazard.center_y = hazard_spec[1]
+            beam_hazard.center_x = laser_spec.center_x
+            beam_hazard.center_y = laser_spec.center_y
             self.moving_hazards.append(beam_hazard)
 
-            emitter_size = self._laser_emitter_size(hazard_spec[2])
-            emitter_half_span = (hazard_spec[3] / 2.0) + (emitter_size / 2.0)
+            emitter_size = self._laser_emitter_size(laser_spec.width)
+            emitter_half_span = (laser_spec.height / 2.0) + (emitter_size / 2.0)
             for emitter_center_y in (
-                hazard_spec[1] - emitter_half_span,
-                hazard_spec[1] + emitter_half_span,
+                laser_spec.center_y - emitter_half_span,
+                laser_spec.center_y + emitter_half_span,
             ):
                 emitter = arcade.SpriteSolidColor(
                     width=int(round(emitter_size)),
                     height=int(round(emitter_size)),
                     color=arcade.color.BLACK,
                 )
-                emitter.center_x = hazard_spec[0]
+                emitter.center_x = laser_spec.center_x
                 emitter.center_y = emitter_center_y
                 self.moving_hazards.append(emitter)
-        for hazard_spec in skull_hazard_specs:
+        for skull_spec in skull_hazard_specs:
             hazard = SkullHazard(
-                width=hazard_spec[2],
-                height=hazard_spec[3],
-                hit_box_points=hazard_spec[6],
+                width=skull_spec.width,
+                height=skull_spec.height,
+                hit_box_points=skull_spec.hit_box_points,
             )
-            hazard.center_x = hazard_spec[0]
-            hazard.center_y = hazard_spec[1]
-            hazard.change_x = hazard_spec[4] * self._effective_hazard_speed_multiplier()
-            hazard.change_y = hazard_spec[5] * self._effective_hazard_speed_multiplier()
+            hazard.center_x = skull_spec.center_x
+            hazard.center_y = skull_spec.center_y
             hazard.set_bounds(self.world_bounds)
+            self._start_hazard_motion(hazard, skull_spec.speed_x, skull_spec.speed_y)
             self.moving_hazards.append(hazard)
 
         if spawn_point is None:
@@ -224,59 +377,410 @@ class GameView(arcade.View):
             if spawn_should_snap_to_ground:
                 self._snap_player_to_ground(player_sprite)
 
-        self.level.set_speed_multiplier(self._effective_run_speed_multiplier())
         self.level.init_platforms(self.world_bounds)
+        self.scrolling_platforms = None
+        if scrolling_platform_specs:
+            self.scrolling_platforms = ScrollingPlatforms(
+                scrolling_platform_specs,
+                settings.run_speed_multiplier,
+            )
+        self.path_platforms = None
+        if path_platform_specs:
+            self.path_platforms = PathPlatforms(
+                path_platform_specs,
+                settings.run_speed_multiplier,
+                quantize=quantize if self.game_state.fixed_point else None,
+            )
+        self.moving_platforms = self._combined_moving_platforms()
+        self._setup_triggers(trigger_volumes)
 
-        if self.level.moving_platforms is not None:
-            self.scene.add_sprite_list_after("Platforms", "obstacles")
-            for platform in self.level.moving_platforms:
+        if self.moving_platforms is not None:
+            self._add_scene_layer("Platforms", after="obstacles")
+            for platform in self.moving_platforms:
                 self.scene.add_sprite("Platforms", platform)
 
-        self.scene.add_sprite_list_before("Hazards", "foreground")
+        self._add_scene_layer("Hazards", before="foreground")
         for hazard in self.moving_hazards:
             self.scene.add_sprite("Hazards", hazard)
 
-        self.scene.add_sprite_list_before("Player", "foreground")
+        self._add_scene_layer("Player", before="foreground")
         self.scene.add_sprite("Player", player_sprite)
+        self._setup_ghost(player_sprite)
 
-        self.physics_engine = arcade.PhysicsEnginePlatformer(
+        self.physics_engine = GridPhysicsEngine(
             player_sprite,
-            gravity_constant=self._current_gravity(),
+            gravity_constant=settings.gravity,
             walls=self.scene["ground"],
-            platforms=self.level.moving_platforms,
+            platforms=self.moving_platforms,
         )
-        self.level.setup(self.physics_engine, self.world_bounds)
-
-    def _current_move_speed(self):
-        return (
-            self.game_state.reality_settings.player_movement_speed
-            * self._effective_run_speed_multiplier()
-            * self.level_runtime_settings.move_speed_multiplier
+        self.level.setup(self.physics_engine, self.world_bounds, self.triggers)
+        self.scene_draw_order = bake_static_layers(
+            self.scene,
+            self.scene_layer_order,
+            self.tile_map.sprite_lists.keys(),
+            self._static_bake_bounds(),
+            self._draw_background,
         )
+        self._stateful_hazards = [hazard for hazard in self.moving_hazards if hasattr(hazard, "capture_state")]
+        self._quantize_player_motion()
+        self._refresh_triggers()
+        self.level_start_state = new_state_record()
+        self.capture_simulation_state(self.level_start_state)
+        self.rewinding = False
+        self.rewind_history = StateHistory(len(self.level_start_state), REWIND_HISTORY_STEPS)
+        self.rewind_history.push(self.capture_simulation_state)
+        self.previous_camera_center_y = self.camera_center_y
+        self.ghost_recorder.reset()
+        self._record_ghost_frame()
+        self._show_ghost_frame()
+        self._track_interpolated_sprites(player_sprite)
+        self.resources.setups += 1
+        if self.show_hitboxes or self.resources.sample_setups:
+            self._sample_resources()
+
+    def _sample_resources(self) -> None:
+        self.resources_text.text = self.resources.sample(self.level_spec.name).summary()
+
+    def _track_interpolated_sprites(self, player_sprite: PlayerCharacter) -> None:
+        sprites: list[arcade.Sprite] = [player_sprite, *self.moving_hazards]
+        if self.ghost_sprite is not None:
+            sprites.append(self.ghost_sprite)
+        self.sprite_interpolator.track(sprites, resizable=list(self.moving_platforms or []))
+
+    def _combined_moving_platforms(self) -> arcade.SpriteList | None:
+        platform_lists = [self.level.moving_platforms]
+        if self.scrolling_platforms is not None:
+            platform_lists.append(self.scrolling_platforms.sprites)
+        if self.path_platforms is not None:
+            platform_lists.append(self.path_platforms.sprites)
+        present = [sprites for sprites in platform_lists if sprites is not None]
+        if len(present) <= 1:
+            return present[0] if present else None
+        combined = arcade.SpriteList()
+        for sprites in present:
+            combined.extend(sprites)
+        return combined
+
+    def _setup_ghost(self, player_sprite: PlayerCharacter) -> None:
+        """Load the best clear of this level and speed, drawn just before the foreground."""
+        self.ghost_playback = None
+        self.ghost_sprite = None
+        ghost_dir = self.game_state.ghost_dir
+        if ghost_dir is None:
+            return
+        self.ghost_playback = GhostPlayback.load(self._ghost_trace_path(ghost_dir))
+        if self.ghost_playback is None:
+            return
+        assert self.scene is not None
+        self.ghost_sprite = GhostCharacter(player_sprite, GHOST_ALPHA)
+        self._add_scene_layer("Ghost", before="foreground")
+        self.scene.add_sprite("Ghost", self.ghost_sprite)
 
-    def _current_jump_speed(self):
-        return (
-            self.game_state.reality_settings.player_jump_speed
-            * self._effective_run_speed_multiplier()
-            * self.level_runtime_settings.jump_speed_multiplier
-        )
+    def _ghost_trace_path(self, ghost_dir: Path) -> Path:
+        return ghost_trace_path(ghost_dir, self.level_index + 1, self.game_state.run_speed_multiplier)
 
-    def _effective_run_speed_multiplier(self) -> float:
-        # Precedence rule: global reality -> round settings -> level runtime.
-        return (
-            self.game_state.round_settings.run_speed_multiplier
-            * self.level_runtime_settings.run_speed_multiplier
+    def _record_ghost_frame(self) -> None:
+        player_sprite = self.player_sprite
+        self.ghost_recorder.record(player_sprite.center_x, player_sprite.center_y, player_sprite.texture_state_index)
+
+    def _show_ghost_frame(self) -> None:
+        if self.ghost_sprite is None or self.ghost_playback is None:
+            return
+        frame = self.ghost_playback.frame(self.attempt_steps)
+        self.ghost_sprite.visible = frame is not None
+        if frame is not None:
+            self.ghost_sprite.show_frame(*frame)
+
+    def _advance_attempt(self) -> None:
+        self.attempt_steps += 1
+        self._record_ghost_frame()
+        self._show_ghost_frame()
+
+    def _save_ghost_if_best(self) -> None:
+        ghost_dir = self.game_state.ghost_dir
+        if ghost_dir is None:
+            return
+        best_frame_count = None if self.ghost_playback is None else len(self.ghost_playback)
+        metadata = {
+            "kind": "ghost",
+            "level": self.level_spec.name,
+            "run_speed_multiplier": self.game_state.run_speed_multiplier,
+            "fields": list(GHOST_STATE_FIELDS),
+        }
+        try:
+            saved = self.ghost_recorder.save_if_best(self._ghost_trace_path(ghost_dir), metadata, best_frame_count)
+        except OSError as error:
+            print(f"[ghost warning] could not save ghost: {error}")
+            return
+        if saved:
+            print(f"GHOST_BEST={self.level_spec.name} steps={self.attempt_steps}")
+
+    def capture_simulation_state(self, out: array) -> None:
+        """Append everything that changes while a level is played to ``out``.
+
+        Sprites, tilemap and physics engine are not part of the record; they
+        are reused as-is by `restore_simulation_state`.
+        """
+        assert self.physics_engine is not None
+        self.game_state.round_settings.capture_state(out)
+        out.extend((
+            self.jump_committed_change_x,
+            self.jump_start_grace_remaining,
+            self.camera_center_y,
+            float(self.left_pressed),
+            float(self.right_pressed),
+            float(self.up_pressed),
+            float(self.physics_engine.jumps_since_ground),
+            float(self.attempt_steps),
+        ))
+        self.level_runtime_settings.capture_state(out)
+        self.player_sprite.capture_state(out)
+        for hazard in self._stateful_hazards:
+            hazard.capture_state(out)
+        if self.scrolling_platforms is not None:
+            self.scrolling_platforms.capture_state(out)
+        if self.path_platforms is not None:
+            self.path_platforms.capture_state(out)
+        self.level.capture_state(out)
+
+    def simulation_state_fields(self) -> list[str]:
+        """Labels for the values of `capture_simulation_state`, in the same order."""
+        fields = [f"round.{name}" for name in self.game_state.round_settings.STATE_FIELDS]
+        fields.extend(f"view.{name}" for name in self._VIEW_STATE_FIELDS)
+        fields.extend(f"runtime.{name}" for name in self.level_runtime_settings.STATE_FIELDS)
+        fields.extend(f"player.{name}" for name in self.player_sprite.STATE_FIELDS)
+        for index, hazard in enumerate(self._stateful_hazards):
+            fields.extend(f"hazard[{index}]:{type(hazard).__name__}.{name}" for name in hazard.STATE_FIELDS)
+        if self.scrolling_platforms is not None:
+            fields.extend(f"platforms.{name}" for name in self.scrolling_platforms.STATE_FIELDS)
+        if self.path_platforms is not None:
+            fields.extend(f"path_platforms.{name}" for name in self.path_platforms.STATE_FIELDS)
+        fields.extend(f"hook:{type(self.level).__name__}.{name}" for name in self.level.STATE_FIELDS)
+        return fields
+
+    def restore_simulation_state(self, values: StateValues, offset: int = 0) -> int:
+        """Restore a record from `capture_simulation_state` in place; return the next offset."""
+        assert self.physics_engine is not None
+        offset = self.game_state.round_settings.restore_state(values, offset)
+        self.jump_committed_change_x = values[offset]
+        self.jump_start_grace_remaining = values[offset + 1]
+        self.camera_center_y = values[offset + 2]
+        self.left_pressed = values[offset + 3] != 0.0
+        self.right_pressed = values[offset + 4] != 0.0
+        self.up_pressed = values[offset + 5] != 0.0
+        self.physics_engine.jumps_since_ground = int(values[offset + 6])
+        self.attempt_steps = int(values[offset + 7])
+        offset = self.level_runtime_settings.restore_state(values, offset + 8)
+        offset = self.player_sprite.restore_state(values, offset)
+        for hazard in self._stateful_hazards:
+            offset = hazard.restore_state(values, offset)
+        if self.scrolling_platforms is not None:
+            offset = self.scrolling_platforms.restore_state(values, offset)
+        if self.path_platforms is not None:
+            offset = self.path_platforms.restore_state(values, offset)
+        offset = self.level.restore_state(values, offset)
+        self._refresh_settings()
+        self._refresh_triggers()
+        self._update_camera_position()
+        self.ghost_recorder.truncate(self.attempt_steps + 1)
+        self._show_ghost_frame()
+        return offset
+
+    def _restart_level(self) -> None:
+        """Death restart: rewind to the last checkpoint or the level start snapshot instead of reloading the level."""
+        if self.level_start_state is None:
+            self.setup()
+            return
+        self._emit_level_start()
+        if self.checkpoint_state is None:
+            self.restore_simulation_state(self.level_start_state)
+            self.ghost_recorder.restart()
+        else:
+            self.restore_simulation_state(self.checkpoint_state)
+            # Like after a level start, no key counts as held until pressed again.
+            self.left_pressed = self.right_pressed = self.up_pressed = False
+        self._snap_interpolation()
+
+    def _setup_triggers(self, volumes: list[TriggerVolume]) -> None:
+        self.checkpoint_state = None
+        self.triggers = None
+        if not volumes:
+            return
+        self.triggers = TriggerVolumes(volumes)
+        self.triggers.on(TRIGGER_KILL, enter=self._on_kill_zone, stay=self._on_kill_zone)
+        self.triggers.on(TRIGGER_CHECKPOINT, enter=self._on_checkpoint)
+
+    def _refresh_triggers(self) -> None:
+        if self.triggers is not None:
+            self.triggers.refresh(hit_box_bounds(self.player_sprite))
+
+    def _update_triggers(self) -> None:
+        """The step's one trigger query, with the player where the step leaves it."""
+        if self.triggers is not None:
+            self.triggers.update(hit_box_bounds(self.player_sprite))
+
+    def _on_kill_zone(self, volume: TriggerVolume) -> None:
+        if not self.player_sprite.dying:
+            self._enter_death_state(DEATH_KILL_ZONE)
+
+    def _on_checkpoint(self, volume: TriggerVolume) -> None:
+        if self.player_sprite.dying:
+            return
+        self.checkpoint_state = new_state_record()
+        self.capture_simulation_state(self.checkpoint_state)
+        self._emit(EVENT_CHECKPOINT, self.level_spec.name)
+
+    def _save_state(self) -> None:
+        record = new_state_record()
+        self.capture_simulation_state(record)
+        self.saved_state = (self.level_index, record)
+        self._emit(EVENT_STATE_SAVED, self.level_spec.name)
+
+    def _load_state(self) -> None:
+        if self.saved_state is None:
+            return
+        level_index, record = self.saved_state
+        round_settings = self.game_state.round_settings
+        previous_round = (round_settings.run_speed_multiplier, round_settings.music_speed_multiplier)
+        round_settings.restore_state(record, 0)
+        if level_index != self.level_index or round_settings.run_speed_multiplier != previous_round[0]:
+            # Level geometry and speed-scaled setup values come from setup; the
+            # record only carries the state that changes while playing.
+            self.level_index = level_index
+            self.setup()
+        else:
+            self._emit_level_start()
+        if round_settings.music_speed_multiplier != previous_round[1]:
+            self._emit(EVENT_MUSIC_RESTART, str(self.game_state.music_speed_multiplier))
+        self.restore_simulation_state(record)
+        # The frames recorded so far belong to another attempt than the loaded state.
+        self.ghost_recorder.valid = False
+        self._snap_interpolation()
+        self._emit(EVENT_STATE_LOADED, self.level_spec.name)
+
+    def _snap_interpolation(self) -> None:
+        self.previous_camera_center_y = self.camera_center_y
+        self.sprite_interpolator.snap()
+
+    def _start_rewind(self) -> None:
+        self.rewinding = True
+        self._walking = False
+        self._emit(EVENT_REWIND_START)
+
+    def _step_rewind(self) -> None:
+        """Step one record back in history, keeping the oldest record once reached."""
+        assert self.rewind_history is not None
+        history = self.rewind_history
+        if len(history) > 1:
+            history.pop()
+        offset = history.latest()
+        left_pressed, right_pressed, up_pressed = self.left_pressed, self.right_pressed, self.up_pressed
+        self.restore_simulation_state(history.values, offset)
+        # Keep the keys the player is holding now rather than the recorded ones.
+        self.left_pressed, self.right_pressed, self.up_pressed = left_pressed, right_pressed, up_pressed
+
+    def _add_scene_layer(self, name: str, *, after: str | None = None, before: str | None = None) -> None:
+        assert self.scene is not None
+        if after is not None:
+            self.scene.add_sprite_list_after(name, after)
+            self.scene_layer_order.insert(self.scene_layer_order.index(after) + 1, name)
+        elif before is not None:
+            self.scene.add_sprite_list_before(name, before)
+            self.scene_layer_order.insert(self.scene_layer_order.index(before), name)
+
+    def _background_rect(self) -> arcade.Rect:
+        """World-space rectangle covered by the level background texture."""
+        if not self.level_spec.tall_background:
+            return arcade.XYWH(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        texture_width = float(self.background_texture.width)
+        texture_height = float(self.background_texture.height)
+        world_left, _, world_bottom, _ = self.world_bounds
+        viewport_width = float(self.window.width) if self.window is not None else float(SCREEN_WIDTH)
+        if texture_width > 0 and texture_height > 0:
+            scale = viewport_width / texture_width
+            draw_width = viewport_width
+            draw_height = texture_height * scale
+        else:
+            draw_width = viewport_width
+            draw_height = float(SCREEN_HEIGHT)
+        return arcade.XYWH(
+            max(world_left + (draw_width / 2), float(SCREEN_WIDTH) / 2),
+            world_bottom + (draw_height / 2),
+            draw_width,
+            draw_height,
         )
 
-    def _effective_hazard_speed_multiplier(self) -> float:
+    def _draw_background(self) -> None:
+        arcade.draw_texture_rect(self.background_texture, rect=self._background_rect())
+
+    def _static_bake_bounds(self) -> tuple[float, float, float, float]:
+        background = self._background_rect()
+        world_left, world_right, world_bottom, world_top = self.world_bounds
         return (
-            self._effective_run_speed_multiplier()
-            * self.level_runtime_settings.hazard_speed_multiplier
+            min(world_left, background.left),
+            max(world_right, background.right),
+            min(world_bottom, background.bottom),
+            max(world_top, background.top),
         )
 
+    def _bind_level_phases(self) -> None:
+        """Bind the phase methods the current hook declares in `LevelHook.PHASES`."""
+        phases = self.level.PHASES
+        self._hook_pre_physics = self.level.update_pre_physics if PHASE_PRE_PHYSICS in phases else None
+        self._hook_post_physics = self.level.update if PHASE_POST_PHYSICS in phases else None
+        self._hook_draw = self.level.draw if PHASE_DRAW in phases else None
+        self._hook_draw_hit_boxes = self.level.draw_hit_boxes if PHASE_DRAW in phases else None
+        self._hook_camera_target_y = self.level.camera_follow_target_y if PHASE_CAMERA in phases else None
+        self._hook_lacks_support = self.level.player_lacks_support if PHASE_SUPPORT_CHECK in phases else None
+
+    def _new_level_runtime_settings(self) -> LevelRuntimeSettings:
+        settings = LevelRuntimeSettings()
+        self.level.configure_level_runtime_settings(settings)
+        if self.game_state.fixed_point:
+            settings.quantize()
+        return settings
+
+    def _refresh_settings(self) -> ResolvedSettings:
+        """Resolve the settings layers again if one changed and push the result to the hook and physics engine.
+
+        Round settings change between levels (`GameState.advance_round`,
+        `GameState.reset_for_new_run`) and level runtime settings when the hook
+        configures them in `setup`; both can also change when a state record is
+        restored. Every other step reads the cached `settings`.
+        """
+        sources = (self.game_state.round_settings.run_speed_multiplier, *astuple(self.level_runtime_settings))
+        if sources != self._settings_sources:
+            self._settings_sources = sources
+            self.settings = resolve_settings(
+                self.game_state.reality_settings,
+                self.game_state.round_settings,
+                self.level_runtime_settings,
+                fixed_point=self.game_state.fixed_point,
+            )
+            self.level.set_speed_multiplier(self.settings.run_speed_multiplier)
+            if self.physics_engine is not None:
+                self.physics_engine.gravity_constant = self.settings.gravity
+        return self.settings
+
+    def _start_hazard_motion(self, hazard: TriangleHazard | SkullHazard, base_change_x: float, base_change_y: float):
+        multiplier = self.settings.hazard_speed_multiplier
+        if self.game_state.fixed_point:
+            # Grid-aligned origin, lane bounds and per-step velocity keep the timeline exact.
+            hazard.position = (quantize(hazard.center_x), quantize(hazard.center_y))
+            hazard.bounds = tuple(quantize(bound) for bound in hazard.bounds)
+            base_change_x = quantize(base_change_x * multiplier)
+            base_change_y = quantize(base_change_y * multiplier)
+            multiplier = 1.0
+        hazard.set_motion(base_change_x, base_change_y, multiplier)
+
+    def _quantize_player_motion(self) -> None:
+        if self.game_state.fixed_point:
+            quantize_motion(self.player_sprite)
+
     def _jump_takeoff_speed(self) -> float:
         return self.level.jump_takeoff_speed(
-            self._current_jump_speed(),
+            self.settings.jump_speed,
             self.player_sprite,
         )
 
@@ -286,40 +790,50 @@ class GameView(arcade.View):
             self.player_sprite,
         )
 
-    def _current_gravity(self):
-        return (
-            self.game_state.reality_settings.gravity
-            * (self._effective_run_speed_multiplier() ** 2)
-            * self.level_runtime_settings.gravity_multiplier
-        )
-
-    def _apply_music_speed(self):
-        self.game_state.restart_music(speed=self.game_state.music_speed_multiplier)
-
-    def _stop_step_sound(self):
-        if self.step_sound_player and self.step_sound.is_playing(player=self.step_sound_player):
-            self.step_sound.stop(player=self.step_sound_player)
+    def _subscribe_event_handlers(self) -> None:
+        self.events.subscribe(GameplaySounds.EVENTS, self.sounds.handle)
+        self.events.subscribe(EVENT_LOG_EVENTS, print_event_log)
+        recorder = self.game_state.replay_recorder
+        if recorder is not None:
+            self.events.subscribe(REPLAY_MARKER_EVENTS, recorder.record_markers)
+        heatmap = self.game_state.death_heatmap
+        if heatmap is not None:
+            self.events.subscribe(DeathHeatmap.EVENTS, heatmap.handle)
+
+    def _emit(self, kind: str, detail: str = "") -> None:
+        self.events.emit(self.simulation_step_index, kind, detail)
+
+    def _emit_level_start(self) -> None:
+        """The level (re)starts: level sounds stop and the walk state is reset."""
+        self._walking = False
+        self._emit(EVENT_LEVEL_START, self.level_spec.name)
+
+    def _set_walking(self, walking: bool) -> None:
+        """Emit a walk start/stop event when the walking state changes (the footstep loop follows it)."""
+        if walking != self._walking:
+            self._walking = walking
+            self._emit(EVENT_WALK_START if walking else EVENT_WALK_STOP)
 
     def _refresh_horizontal_movement(self):
         if self.physics_engine is None:
             return
         if self.player_sprite.dying:
             self.player_sprite.change_x = 0
-            self._stop_step_sound()
+            self._set_walking(False)
             return
 
         if self.player_sprite.jumping:
             self.player_sprite.change_x = self.jump_committed_change_x
-            self._stop_step_sound()
+            self._set_walking(False)
             return
 
         base_change_x = 0.0
         if self.left_pressed == self.right_pressed:
             base_change_x = 0.0
         elif self.left_pressed:
-            base_change_x = -self._current_move_speed()
+            base_change_x = -self.settings.move_speed
         else:
-            base_change_x = self._current_move_speed()
+            base_change_x = self.settings.move_speed
 
         is_grounded = self.physics_engine.can_jump()
         self.player_sprite.change_x = self.level.resolve_horizontal_change_x(
@@ -328,12 +842,7 @@ class GameView(arcade.View):
             is_grounded,
         )
 
-        if self.player_sprite.change_x == 0 or self.player_sprite.jumping:
-            self._stop_step_sound()
-        elif not self.step_sound_player or not self.step_sound.is_playing(
-            player=self.step_sound_player
-        ):
-            self.step_sound_player = self.step_sound.play(loop=True)
+        self._set_walking(self.player_sprite.change_x != 0 and not self.player_sprite.jumping)
 
     def _snap_player_to_ground(self, player_sprite: PlayerCharacter):
         assert self.scene is not None
@@ -380,22 +889,21 @@ class GameView(arcade.View):
     def _laser_schedule_config_for_index(
         self,
         index: int,
-        laser_schedule_configs,
-    ) -> tuple[float, float, float, tuple[int, int, int, int]]:
+        laser_schedule_configs: list[LaserSchedule],
+    ) -> LaserSchedule:
         fallback_colors = (
             (255, 72, 72, 220),
             (70, 215, 255, 220),
             (255, 92, 242, 220),
         )
         if laser_schedule_configs:
-            schedule = laser_schedule_configs[index % len(laser_schedule_configs)]
-            return (
-                schedule.active_duration,
-                schedule.inactive_duration,
-                schedule.phase_offset,
-                schedule.color,
-            )
-        return (1.0, 1.0, index * 0.35, fallback_colors[index % len(fallback_colors)])
+            return laser_schedule_configs[index % len(laser_schedule_configs)]
+        return LaserSchedule(
+            active_duration=1.0,
+            inactive_duration=1.0,
+            phase_offset=index * 0.35,
+            color=fallback_colors[index % len(fallback_colors)],
+        )
 
     def _laser_emitter_size(self, beam_width: float) -> float:
         return max(18.0, beam_width * 8.0)
@@ -405,26 +913,18 @@ class GameView(arcade.View):
     ) -> tuple[
         tuple[float, float] | None,
         bool,
-        tuple[float, float, float, float] | None,
-        list[tuple[float, float, float, float, float, float]],
-        list[
-            tuple[
-                float,
-                float,
-                float,
-                float,
-                float,
-                float,
-                list[tuple[float, float]] | None,
-            ]
-        ],
-        list[tuple[float, float, float, float]],
+        list[TriggerVolume],
+        list[MovingHazardSpec],
+        list[SkullHazardSpec],
+        list[LaserHazardSpec],
+        list[ScrollingPlatformSpec],
+        list[PathPlatformSpec],
     ]:
         try:
             with open(self.level_spec.map_path, "r", encoding="utf-8") as file_handle:
                 raw_map = json.load(file_handle)
         except (FileNotFoundError, json.JSONDecodeError):
-            return None, False, None, [], [], []
+            return None, False, [], [], [], [], [], []
 
         map_height = (
             float(raw_map.get("height", 0))
@@ -436,20 +936,12 @@ class GameView(arcade.View):
 
         spawn_point: tuple[float, float] | None = None
         spawn_should_snap_to_ground = False
-        exit_zone: tuple[float, float, float, float] | None = None
-        moving_hazard_specs: list[tuple[float, float, float, float, float, float]] = []
-        skull_hazard_specs: list[
-            tuple[
-                float,
-                float,
-                float,
-                float,
-                float,
-                float,
-                list[tuple[float, float]] | None,
-            ]
-        ] = []
-        laser_hazard_specs: list[tuple[float, float, float, float]] = []
+        trigger_volumes: list[TriggerVolume] = []
+        moving_hazard_specs: list[MovingHazardSpec] = []
+        skull_hazard_specs: list[SkullHazardSpec] = []
+        laser_hazard_specs: list[LaserHazardSpec] = []
+        scrolling_platform_specs: list[ScrollingPlatformSpec] = []
+        path_platform_specs: list[PathPlatformSpec] = []
 
         for layer in layers:
             if not isinstance(layer, dict) or layer.get("type") != "objectgroup":
@@ -467,17 +959,8 @@ class GameView(arcade.View):
                     spawn_should_snap_to_ground = bool(obj.get("point", False))
                     continue
 
-                if object_name == self.level_spec.exit_object_name:
-                    width = float(obj.get("width", 0.0)) * TILE_SCALING
-                    height = float(obj.get("height", 0.0)) * TILE_SCALING
-                    if width <= 0 or height <= 0:
-                        continue
-                    exit_zone = (
-                        x + width / 2,
-                        map_height - y - height / 2,
-                        width,
-                        height,
-                    )
+                if object_name == self.level_spec.trigger_object_name:
+                    trigger_volumes.append(trigger_volume(obj, map_height))
 
                 if object_name == self.level_spec.moving_hazard_object_name:
                     if "polygon" in obj:
@@ -504,13 +987,13 @@ class GameView(arcade.View):
                     speed_x = self._read_object_property(obj, "speed_x", -2.0)
                     speed_y = self._read_object_property(obj, "speed_y", 0.0)
                     moving_hazard_specs.append(
-                        (
-                            x,
-                            map_height - y - 5.0,  # Lower the hazard slightly to remove gap
-                            width,
-                            height,
-                            speed_x,
-                            speed_y,
+                        MovingHazardSpec(
+                            center_x=x,
+                            center_y=map_height - y - 5.0,  # Lower the hazard slightly to remove gap
+                            width=width,
+                            height=height,
+                            speed_x=speed_x,
+                            speed_y=speed_y,
                         )
                     )
 
@@ -519,7 +1002,7 @@ class GameView(arcade.View):
                     height = max(1.0, float(obj.get("height", 18.0)) * TILE_SCALING)
                     center_x = x + width / 2
                     center_y_tiled = y + height / 2
-                    hit_box_points: list[tuple[float, float]] | None = None
+                    hit_box_points: tuple[tuple[float, float], ...] | None = None
 
                     polygon = obj.get("polygon")
                     if isinstance(polygon, list) and polygon:
@@ -543,55 +1026,63 @@ class GameView(arcade.View):
                             height = max(1.0, max_y - min_y)
                             center_x = x + (min_x + max_x) / 2
                             center_y_tiled = y + (min_y + max_y) / 2
-                            hit_box_points = []
-                            for point_x, point_y in polygon_pairs:
-                                hit_box_points.append(
-                                    (
-                                        point_x - (center_x - x),
-                                        -1.0 * (point_y - (center_y_tiled - y)),
-                                    )
+                            hit_box_points = tuple(
+                                (
+                                    point_x - (center_x - x),
+                                    -1.0 * (point_y - (center_y_tiled - y)),
                                 )
+                                for point_x, point_y in polygon_pairs
+                            )
 
                     speed_x = self._read_object_property(obj, "speed_x", 0.0)
                     speed_y = self._read_object_property(obj, "speed_y", 0.0)
                     skull_hazard_specs.append(
-                        (
-                            center_x,
-                            map_height - center_y_tiled,
-                            width,
-                            height,
-                            speed_x,
-                            speed_y,
-                            hit_box_points,
+                        SkullHazardSpec(
+                            center_x=center_x,
+                            center_y=map_height - center_y_tiled,
+                            width=width,
+                            height=height,
+                            speed_x=speed_x,
+                            speed_y=speed_y,
+                            hit_box_points=hit_box_points,
                         )
                     )
 
+                if object_name == self.level_spec.scrolling_platform_object_name:
+                    # Validated at load time, so a malformed object has already failed the level.
+                    scrolling_platform_specs.append(scrolling_platform_spec(obj, map_height))
+
+                if object_name == self.level_spec.path_platform_object_name:
+                    path_platform_specs.append(path_platform_spec(obj, map_height))
+
                 if object_name == self.level_spec.laser_hazard_object_name:
                     width = max(1.0, float(obj.get("width", 8.0)) * TILE_SCALING)
                     height = max(1.0, float(obj.get("height", 180.0)) * TILE_SCALING)
                     laser_hazard_specs.append(
-                        (
-                            x + (width / 2),
-                            map_height - y - (height / 2),
-                            width,
-                            height,
+                        LaserHazardSpec(
+                            center_x=x + (width / 2),
+                            center_y=map_height - y - (height / 2),
+                            width=width,
+                            height=height,
                         )
                     )
 
         return (
             spawn_point,
             spawn_should_snap_to_ground,
-            exit_zone,
+            trigger_volumes,
             moving_hazard_specs,
             skull_hazard_specs,
             laser_hazard_specs,
+            scrolling_platform_specs,
+            path_platform_specs,
         )
 
     def _draw_scene_hit_boxes(self):
         assert self.scene is not None
         draw_scene_hit_boxes = getattr(self.scene, "draw_hit_boxes", None)
         if callable(draw_scene_hit_boxes):
-            draw_scene_hit_boxes()
+            draw_scene_hit_boxes(names=self.scene_layer_order)
             return
         for sprite_list in getattr(self.scene, "sprite_lists", []):
             draw_hit_boxes = getattr(sprite_list, "draw_hit_boxes", None)
@@ -653,7 +1144,7 @@ class GameView(arcade.View):
         return False
 
     def _moving_platform_support_width(self, vertical_tolerance: float = 8.0) -> float:
-        platforms = self.level.moving_platforms
+        platforms = self.moving_platforms
         if platforms is None:
             return 0.0
 
@@ -716,28 +1207,32 @@ class GameView(arcade.View):
             return False
         return self.jump_start_grace_remaining > 0.0 and self.player_sprite.change_y <= 1.0
 
-    def _enforce_landing_support_margin(self) -> None:
-        if self.physics_engine is None:
-            return
-        if self.player_sprite.dying:
-            return
-
-        minimum_overlap_tiles = self.level.min_ground_overlap_tiles()
-        if minimum_overlap_tiles is None or minimum_overlap_tiles <= 0.0:
+    def _enforce_player_support(self) -> None:
+        if (self._hook_lacks_support is None and self.scrolling_platforms is None) or self.player_sprite.dying:
             return
+        assert self.physics_engine is not None
         if not self.physics_engine.can_jump():
             return
-        assert self.tile_map is not None
+        if self._hook_lacks_support is not None and self._hook_lacks_support(
+            self.player_sprite,
+            self._ground_support_width,
+        ):
+            self._enter_death_state(self.level.SUPPORT_DEATH_CAUSE)
+        elif self.scrolling_platforms is not None and self.scrolling_platforms.player_lacks_support(
+            self.player_sprite,
+        ):
+            self._enter_death_state(DEATH_PLATFORM_SUPPORT)
 
+    def _ground_support_width(self) -> float:
         overlap_width, _ = self._ground_support_metrics()
-        required_overlap_width = minimum_overlap_tiles * TILE_SCALING * self.tile_map.tile_width
-        if overlap_width < required_overlap_width:
-            self._enter_death_state()
+        return overlap_width
 
     def _is_exit_reached(self) -> bool:
         if self.player_sprite.dying:
             return False
-
+        if self.triggers is not None and self.triggers.occupied(TRIGGER_EXIT):
+            return True
+        # Right-edge completion stays the progression rule of every level.
         return self.player_sprite.left >= SCREEN_WIDTH
 
     def _clamp_player_to_world(self):
@@ -760,53 +1255,6 @@ class GameView(arcade.View):
             if not self.player_sprite.jumping:
                 self._snap_player_to_ground(self.player_sprite)
 
-    def _enforce_full_level3_platform_support(self):
-        if self.player_sprite.dying:
-            return
-        if not isinstance(self.level, Level3Hook):
-            return
-        assert self.physics_engine is not None
-        platforms = self.level.moving_platforms
-        if platforms is None:
-            return
-        if not self.physics_engine.can_jump():
-            return
-
-        hit_box_points = self.player_sprite.hit_box.points
-        player_hitbox_left = self.player_sprite.center_x + min(point[0] for point in hit_box_points)
-        player_hitbox_right = self.player_sprite.center_x + max(point[0] for point in hit_box_points)
-        player_hitbox_width = max(1.0, player_hitbox_right - player_hitbox_left)
-
-        vertical_tolerance = 8.0
-        support_candidates: list[arcade.Sprite] = []
-        for platform in platforms:
-            overlap_left = max(player_hitbox_left, platform.left)
-            overlap_right = min(player_hitbox_right, platform.right)
-            if overlap_right <= overlap_left:
-                continue
-            is_on_top = (
-                self.player_sprite.bottom >= platform.top - vertical_tolerance
-                and self.player_sprite.bottom <= platform.top + vertical_tolerance
-            )
-            if is_on_top:
-                support_candidates.append(platform)
-
-        if not support_candidates:
-            return
-
-        max_support_ratio = 0.0
-        for platform in support_candidates:
-            overlap_left = max(player_hitbox_left, platform.left)
-            overlap_right = min(player_hitbox_right, platform.right)
-            overlap_width = max(0.0, overlap_right - overlap_left)
-            support_ratio = overlap_width / player_hitbox_width
-            max_support_ratio = max(max_support_ratio, support_ratio)
-
-        if max_support_ratio >= 0.1:
-            return
-
-        self._enter_death_state()
-
     def _advance_level(self):
         if self.level_index >= len(self.level_specs) - 1:
             self.level_index = 0
@@ -814,115 +1262,125 @@ class GameView(arcade.View):
                 run_speed_step=RUN_SPEED_MULTIPLIER_STEP,
                 music_speed_step=MUSIC_SPEED_MULTIPLIER_STEP,
             )
-            self.game_state.restart_music(speed=self.game_state.music_speed_multiplier)
+            self._emit(EVENT_ROUND_WRAP, str(self.game_state.run_speed_multiplier))
+            self._emit(EVENT_MUSIC_RESTART, str(self.game_state.music_speed_multiplier))
         else:
             self.level_index += 1
         self.setup()
 
-    def _enter_death_state(self):
+    def _emit_death(self, cause: str) -> None:
+        self.events.emit(
+            self.simulation_step_index,
+            EVENT_DEATH,
+            cause,
+            self.player_sprite.center_x,
+            self.player_sprite.center_y,
+        )
+
+    @staticmethod
+    def _hazard_death_cause(hazard: arcade.Sprite) -> str:
+        if isinstance(hazard, SkullHazard):
+            return DEATH_SKULL_HAZARD
+        if isinstance(hazard, TriangleHazard):
+            return DEATH_MOVING_HAZARD
+        return DEATH_LASER_HAZARD  # laser beams and their emitters
+
+    def _enter_death_state(self, cause: str):
+        self._emit_death(cause)
         self.player_sprite.die()
         self.left_pressed = False
         self.right_pressed = False
         self.up_pressed = False
         self.jump_committed_change_x = 0
-        self._stop_step_sound()
-        self.fall_sound_player = arcade.play_sound(self.fall_sound, loop=False)
+        self._set_walking(False)
+
+    def _start_jump(self) -> None:
+        assert self.physics_engine is not None
+        self._set_walking(False)
+        self.physics_engine.jump(self._jump_takeoff_speed())
+        self.player_sprite.jumping = True
+        self.jump_start_grace_remaining = 0.0
+        self.jump_committed_change_x = self._resolve_jump_committed_change_x()
+        self.player_sprite.change_x = self.jump_committed_change_x
+        self._emit(EVENT_JUMP)
 
     def on_draw(self):
         assert self.camera is not None
         assert self.scene is not None
         self.clear()
-        if self.level_spec.name == "Level 7":
-            self.camera.use()
-            texture_width = float(self.background_texture.width)
-            texture_height = float(self.background_texture.height)
-            world_left, _, world_bottom, _ = self.world_bounds
-            viewport_width = float(self.window.width) if self.window is not None else float(SCREEN_WIDTH)
-            camera_center_x = float(self.camera.position[0])
-            if texture_width > 0 and texture_height > 0:
-                scale = viewport_width / texture_width
-                draw_width = viewport_width
-                draw_height = texture_height * scale
-            else:
-                draw_width = viewport_width
-                draw_height = float(SCREEN_HEIGHT)
-            arcade.draw_texture_rect(
-                self.background_texture,
-                rect=arcade.XYWH(
-                    max(world_left + (draw_width / 2), camera_center_x),
-                    world_bottom + (draw_height / 2),
-                    draw_width,
-                    draw_height,
-                ),
-            )
-        else:
-            arcade.draw_texture_rect(
-                self.background_texture,
-                rect=arcade.XYWH(
-                    SCREEN_WIDTH / 2,
-                    SCREEN_HEIGHT / 2,
-                    SCREEN_WIDTH,
-                    SCREEN_HEIGHT,
-                ),
-            )
-            self.camera.use()
-        self.scene.draw()
-        self.level.draw()
+        # Draw between the last two simulation steps; positions are put back afterwards.
+        alpha = min(1.0, self.simulation_time_accumulator / SIMULATION_STEP_SECONDS)
+        self.camera.position = (
+            float(SCREEN_WIDTH) / 2,
+            lerp(self.previous_camera_center_y, self.camera_center_y, alpha),
+        )
+        self.camera.use()
+        self.sprite_interpolator.apply(alpha)
+        for layer_name in self.scene_draw_order:
+            self.scene[layer_name].draw(pixelated=is_baked_layer(layer_name))
+        self.sprite_interpolator.restore()
+        if self._hook_draw is not None:
+            self._hook_draw()
         if self.show_hitboxes:
             self._draw_scene_hit_boxes()
-            self.level.draw_hit_boxes()
+            if self._hook_draw_hit_boxes is not None:
+                self._hook_draw_hit_boxes()
             self.debug_text.text = (
-                f"{self.level_spec.name}  OFFSET: {self.player_ground_offset}  HITBOXES: {'ON' if self.show_hitboxes else 'OFF'}  SPEED: x{self._effective_run_speed_multiplier():.2f}"
+                f"{self.level_spec.name}  OFFSET: {self.player_ground_offset}  HITBOXES: {'ON' if self.show_hitboxes else 'OFF'}  SPEED: x{self.settings.run_speed_multiplier:.2f}"
             )
             self.debug_text.draw()
+            self.resources_text.draw()
 
     def on_update(self, delta_time):
+        """Run as many fixed simulation steps as the elapsed time covers."""
+        self.simulation_time_accumulator += delta_time
+        steps = 0
+        while self.simulation_time_accumulator >= SIMULATION_STEP_SECONDS:
+            if steps == MAX_SIMULATION_STEPS_PER_UPDATE:
+                # Drop the backlog after a long stall instead of spiralling.
+                self.simulation_time_accumulator = 0.0
+                break
+            self.previous_camera_center_y = self.camera_center_y
+            self.sprite_interpolator.begin_step()
+            self.simulation_step(SIMULATION_STEP_SECONDS)
+            self.simulation_time_accumulator -= SIMULATION_STEP_SECONDS
+            steps += 1
+
+    def simulation_step(self, delta_time: float):
         assert self.physics_engine is not None
         assert self.tile_map is not None
+        assert self.rewind_history is not None
+
+        self._apply_pending_inputs()
+        if self.rewinding:
+            self._step_rewind()
+            self._finish_simulation_step()
+            return
 
         if not self.player_sprite.dying and not self.player_sprite.jumping:
             self._refresh_horizontal_movement()
 
-        level_updated_pre_physics = False
-        if isinstance(self.level, Level7Hook) and not self.player_sprite.dying:
-            self.level.update()
-            level_updated_pre_physics = True
-
-        if self.player_sprite.dying:
-            self.player_sprite.center_y += self.player_sprite.change_y
-            self.player_sprite.change_y -= (
-                self._current_gravity() * DEATH_FALL_GRAVITY_MULTIPLIER
-            )
-            self.jump_start_grace_remaining = 0.0
-        else:
-            self.physics_engine.update()
-            if self.physics_engine.can_jump():
-                self.jump_start_grace_remaining = self.level.jump_start_grace_seconds()
-            elif self.jump_start_grace_remaining > 0.0:
-                self.jump_start_grace_remaining = max(
-                    0.0,
-                    self.jump_start_grace_remaining - delta_time,
-                )
+        hook_updated_pre_physics = False
+        if self._hook_pre_physics is not None and not self.player_sprite.dying:
+            self._hook_pre_physics()
+            hook_updated_pre_physics = True
+        if self.path_platforms is not None:
+            self.path_platforms.advance(None if self.player_sprite.dying else self.player_sprite)
 
+        self._step_player_physics(delta_time)
         self._clamp_player_to_world()
-        self._enforce_full_level3_platform_support()
-        self._enforce_landing_support_margin()
+        self._enforce_player_support()
 
         if self.player_sprite.jumping and not self.player_sprite.dying:
             if self.player_sprite.change_y <= 0 and self.physics_engine.can_jump():
                 self.player_sprite.jumping = False
                 self.jump_committed_change_x = 0
+                self._emit(EVENT_LAND)
                 self._refresh_horizontal_movement()
 
                 # Allow immediate jump if UP is still held
                 if self.up_pressed and self._can_start_jump():
-                    self._stop_step_sound()
-                    self.physics_engine.jump(self._jump_takeoff_speed())
-                    self.player_sprite.jumping = True
-                    self.jump_start_grace_remaining = 0.0
-                    self.jump_committed_change_x = self._resolve_jump_committed_change_x()
-                    self.player_sprite.change_x = self.jump_committed_change_x
-                    arcade.play_sound(self.jump_sound)
+                    self._start_jump()
 
         self.player_sprite.update_animation(delta_time)
         for hazard in self.moving_hazards:
@@ -930,49 +1388,167 @@ class GameView(arcade.View):
                 hazard.advance(delta_time)
                 continue
             hazard.update()
-        if not level_updated_pre_physics:
-            self.level.update()
+        if self.scrolling_platforms is not None:
+            self.scrolling_platforms.update()
+        if self._hook_post_physics is not None:
+            self._hook_post_physics()
+        if self._hook_pre_physics is not None and not hook_updated_pre_physics:
+            # No physics step ran while dying; pre-physics hooks still advance once.
+            self._hook_pre_physics()
         self._update_camera_position()
+        if not self.player_sprite.dying:
+            self._check_player_collisions()
+        self._end_play_step()
+        self._finish_simulation_step()
 
+    def _step_player_physics(self, delta_time: float) -> None:
+        """Move the player one step: the death fall, or the (sub-stepped) physics engine and the jump grace."""
+        assert self.physics_engine is not None
         if self.player_sprite.dying:
-            if self.step_sound_player and self.step_sound.is_playing(
-                player=self.step_sound_player
-            ):
-                self.step_sound.stop(player=self.step_sound_player)
+            self.player_sprite.center_y += self.player_sprite.change_y
+            self.player_sprite.change_y -= (
+                self.settings.gravity * DEATH_FALL_GRAVITY_MULTIPLIER
+            )
+            self.jump_start_grace_remaining = 0.0
+        elif self._update_physics():
+            self._enter_death_state(DEATH_OBSTACLE)
+        elif self.physics_engine.can_jump():
+            self.jump_start_grace_remaining = self.level.jump_start_grace_seconds()
+        elif self.jump_start_grace_remaining > 0.0:
+            self.jump_start_grace_remaining = max(
+                0.0,
+                self.jump_start_grace_remaining - delta_time,
+            )
 
+    def _check_player_collisions(self) -> None:
+        """Kill the live player on an obstacle touch or a hazard hit, also between physics sub-steps."""
+        assert self.tile_map is not None
         obstacle_list = self.tile_map.sprite_lists.get("obstacles")
-        if (
-            not self.player_sprite.dying
-            and obstacle_list is not None
-            and self._collides_or_touches_obstacles(obstacle_list)
-        ):
-            self._enter_death_state()
-        elif not self.player_sprite.dying:
-            for hazard in self.moving_hazards:
-                if self.player_sprite.collides_with_sprite(hazard):
-                    self._enter_death_state()
-                    break
+        if obstacle_list is not None and self._collides_or_touches_obstacles(obstacle_list):
+            self._enter_death_state(DEATH_OBSTACLE)
+            return
+        for hazard in self.moving_hazards:
+            if self.player_sprite.collides_with_sprite(hazard) or collides_between_substeps(
+                self.player_sprite,
+                self._player_substep_path,
+                hazard,
+            ):
+                self._enter_death_state(self._hazard_death_cause(hazard))
+                return
+
+    def _end_play_step(self) -> None:
+        """Post-physics bookkeeping: restarts, the attempt and its ghost, triggers, the exit and rewind history."""
+        history = self.rewind_history
+        assert history is not None
+        if not self._restart_if_fallen():
+            # A restart already put the attempt and its ghost back on their first frame.
+            self._advance_attempt()
+        self._quantize_player_motion()
+        self._update_triggers()
+        if self._is_exit_reached():
+            self._save_ghost_if_best()
+            self._emit(EVENT_LEVEL_CLEAR, self.level_spec.name)
+            self._advance_level()
+        # A new level's setup starts a fresh history with its start record already pushed.
+        if self.rewind_history is history:
+            history.push(self.capture_simulation_state)
 
+    def _restart_if_fallen(self) -> bool:
+        """Restart the level once the dying player has fallen off screen or a live one out of the world."""
         death_sprite_top = self.player_sprite.center_y + (self.player_sprite.height / 2)
         if self.player_sprite.dying and death_sprite_top < 0:
-            self.setup()
-        elif not self.player_sprite.dying and self.player_sprite.center_y < 200:
-            self.setup()
+            self._restart_level()
+            return True
+        if not self.player_sprite.dying and self.player_sprite.center_y < 200:
+            self._emit_death(DEATH_OUT_OF_WORLD)
+            self._restart_level()
+            return True
+        return False
 
-        if self._is_exit_reached():
-            self._advance_level()
+    def _finish_simulation_step(self) -> None:
+        """Dispatch the step's events, hash the newest history record for the replay and count the step."""
+        assert self.rewind_history is not None
+        self.events.flush()
+        recorder = self.game_state.replay_recorder
+        if recorder is not None:
+            history = self.rewind_history
+            start = history.latest()
+            recorder.record_state(history.values, start, start + history.record_length)
+        self.simulation_step_index += 1
+
+    def _apply_pending_inputs(self) -> None:
+        if not self.pending_inputs:
+            return
+        pending_inputs = self.pending_inputs
+        self.pending_inputs = []
+        recorder = self.game_state.replay_recorder
+        for action, pressed in pending_inputs:
+            if recorder is not None:
+                recorder.record_input(self.simulation_step_index, action, pressed)
+            self.apply_input(action, pressed)
+
+    def apply_input(self, action: str, pressed: bool) -> None:
+        """Apply one gameplay input event; called between simulation steps only."""
+        assert self.physics_engine is not None
+        if action == ACTION_REWIND:
+            if pressed:
+                self._start_rewind()
+            else:
+                self.rewinding = False
+            return
+        if action == ACTION_SAVE_STATE:
+            self._save_state()
+            return
+        if action == ACTION_LOAD_STATE:
+            self._load_state()
+            return
+        if self.player_sprite.dying:
+            return
+        if action == ACTION_JUMP:
+            self.up_pressed = pressed
+            if pressed and self._can_start_jump():
+                self._start_jump()
+        elif action == ACTION_LEFT:
+            self.left_pressed = pressed
+            self._refresh_horizontal_movement()
+        elif action == ACTION_RIGHT:
+            self.right_pressed = pressed
+            self._refresh_horizontal_movement()
+
+    def _update_physics(self) -> bool:
+        """Advance the physics engine one frame; return True on an obstacle hit between sub-steps.
+
+        Sub-steps are only used above the base run speed. Their player path is kept
+        for the hazard checks later in the frame.
+        """
+        assert self.physics_engine is not None
+        self._player_substep_path.clear()
+        substeps = physics_substeps(self.settings.run_speed_multiplier)
+        if substeps == 1:
+            self.physics_engine.update()
+            return False
+        assert self.tile_map is not None
+        obstacle_list = self.tile_map.sprite_lists.get("obstacles")
+        if obstacle_list is None:
+            return update_physics_substeps(self.physics_engine, substeps, self._player_substep_path)
+        return update_physics_substeps(
+            self.physics_engine,
+            substeps,
+            self._player_substep_path,
+            stop_after=lambda: self._collides_or_touches_obstacles(obstacle_list),
+        )
 
     def _update_camera_position(self):
         assert self.camera is not None
 
-        camera_target_y = self.level.camera_follow_target_y()
+        camera_target_y = self._hook_camera_target_y() if self._hook_camera_target_y is not None else None
         if camera_target_y is not None:
             self.camera_center_y = max(self.camera_center_y, camera_target_y)
 
         self.camera.position = (float(SCREEN_WIDTH) / 2, self.camera_center_y)
 
-    def on_key_press(self, symbol, modifiers):
-        assert self.physics_engine is not None
+    def _handle_tool_key_press(self, symbol) -> bool:
+        """Debug keys (ground offset, hit boxes); they act immediately and are not recorded."""
         minus_keys = {arcade.key.MINUS, getattr(arcade.key, "NUM_SUBTRACT", None)}
         plus_keys = {
             arcade.key.EQUAL,
@@ -981,46 +1557,28 @@ class GameView(arcade.View):
         }
         if symbol in minus_keys:
             self._adjust_ground_offset(-PLAYER_GROUND_OFFSET_STEP)
-            return
-        if symbol in plus_keys:
+        elif symbol in plus_keys:
             self._adjust_ground_offset(PLAYER_GROUND_OFFSET_STEP)
-            return
-        if symbol == arcade.key.H:
+        elif symbol == arcade.key.H:
             self.show_hitboxes = not self.show_hitboxes
             print(f"DEBUG_OVERLAY={self.show_hitboxes}")
-            return
+            if self.show_hitboxes:
+                self._sample_resources()
+        else:
+            return False
+        return True
 
-        if self.player_sprite.dying:
+    def on_key_press(self, symbol, modifiers):
+        if self._handle_tool_key_press(symbol):
             return
-        if symbol == arcade.key.UP or symbol == arcade.key.W:
-            self.up_pressed = True
-            if self._can_start_jump():
-                self._stop_step_sound()
-                self.physics_engine.jump(self._jump_takeoff_speed())
-                self.player_sprite.jumping = True
-                self.jump_start_grace_remaining = 0.0
-                self.jump_committed_change_x = self._resolve_jump_committed_change_x()
-                self.player_sprite.change_x = self.jump_committed_change_x
-                arcade.play_sound(self.jump_sound)
-        elif symbol == arcade.key.LEFT or symbol == arcade.key.A:
-            self.left_pressed = True
-            self._refresh_horizontal_movement()
-
-        elif symbol == arcade.key.RIGHT or symbol == arcade.key.D:
-            self.right_pressed = True
-            self._refresh_horizontal_movement()
+        action = GAMEPLAY_KEY_ACTIONS.get(symbol)
+        if action is not None:
+            self.pending_inputs.append((action, True))
 
     def on_key_release(self, symbol, modifiers):
-        if self.player_sprite.dying:
-            return
-        if symbol == arcade.key.UP or symbol == arcade.key.W:
-            self.up_pressed = False
-        elif symbol == arcade.key.LEFT or symbol == arcade.key.A:
-            self.left_pressed = False
-            self._refresh_horizontal_movement()
-        elif symbol == arcade.key.RIGHT or symbol == arcade.key.D:
-            self.right_pressed = False
-            self._refresh_horizontal_movement()
+        action = GAMEPLAY_KEY_ACTIONS.get(symbol)
+        if action in HELD_ACTIONS:
+            self.pending_inputs.append((action, False))
 
     def on_mouse_motion(self, x, y, dx, dy):
         pass
@@ -1043,6 +1601,7 @@ class TitleView(arcade.View):
         self.snoopy_sprites: arcade.SpriteList | None = None
 
     def setup(self):
+        rng = self.game_state.rng.stream("title")
         self.snoopy_sprite = PlayerCharacter(scale=CHARACTER_SCALING)
         self.snoopy_sprite.center_x = SCREEN_WIDTH * 0.25
         self.snoopy_sprite.center_y = SCREEN_HEIGHT * 0.5
@@ -1062,7 +1621,7 @@ class TitleView(arcade.View):
                 bold=True,
                 align="center",
             )
-            letter_sprite.center_y = SCREEN_HEIGHT - random.randrange(0, 16)
+            letter_sprite.center_y = SCREEN_HEIGHT - rng.randrange(0, 16)
             width = letter_sprite.width
             if not height:
                 height = letter_sprite.height
@@ -1075,12 +1634,12 @@ class TitleView(arcade.View):
 
             def update(self, delta_time=0):
                 if int(self.center_y) > SCREEN_HEIGHT * 0.85:
-                    self.change_y = random.randrange(5, 10) / -10
+                    self.change_y = rng.randrange(5, 10) / -10
                 if int(self.center_y) <= SCREEN_HEIGHT * 0.7:
-                    self.change_y = random.randrange(5, 10) / 10
+                    self.change_y = rng.randrange(5, 10) / 10
                 self.center_y += self.change_y
-                if random.randint(1, 100) == 5:
-                    self.color = random.choice(
+                if rng.randint(1, 100) == 5:
+                    self.color = rng.choice(
                         (
                             arcade.color.COAL,
                             arcade.color.CONGO_PINK,
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from pysnoopy.balance import HumanTiming, perturb_events, wilson_interval
+
+
+def test_wilson_interval_contains_the_rate_and_stays_in_bounds():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    low, high = wilson_interval(50, 100)
+    assert low < 0.5 < high
+    assert (low, high) == pytest.approx((0.4038, 0.5962), abs=1e-4)
+    low, high = wilson_interval(0, 20)
+    assert low == 0.0 and 0.0 < high < 0.2
+    low, high = wilson_interval(20, 20)
+    assert 0.8 < low < 1.0 and high == 1.0
+
+
+def test_wilson_interval_narrows_with_more_trials():
+    few = wilson_interval(7, 10)
+    many = wilson_interval(700, 1000)
+    assert many[1] - many[0] < few[1] - few[0]
+
+
+def test_perturb_events_keeps_the_order_of_each_key():
+    events = []
+    for step in range(0, 600, 4):
+        events.append((step, "right", step % 8 == 0))
+        events.append((step + 1, "jump", step % 8 != 0))
+    rng = random.Random(1)
+    perturbed = perturb_events(events, HumanTiming(), rng)
+
+    assert len(perturbed) == len(events)
+    assert [step for step, _, _ in perturbed] == sorted(step for step, _, _ in perturbed)
+    assert all(step >= 0 for step, _, _ in perturbed)
+    for action in ("right", "jump"):
+        original = [pressed for _, name, pressed in events if name == action]
+        shifted = [(step, pressed) for step, name, pressed in perturbed if name == action]
+        assert [pressed for _, pressed in shifted] == original
+        assert all(first[0] < second[0] for first, second in zip(shifted, shifted[1:]))
+
+
+def test_perfect_timing_does_not_move_events():
+    events = [(3, "right", True), (10, "jump", True), (11, "jump", False)]
+    assert perturb_events(events, HumanTiming(0.0, 0.0), random.Random(0)) == events
+
+
+def test_negative_timing_errors_are_rejected():
+    with pytest.raises(ValueError):
+        HumanTiming(timing_sd_seconds=-0.01)
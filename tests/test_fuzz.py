@@ -0,0 +1,33 @@
+from pysnoopy.fuzz import shrink_events
+
+
+def _events(count: int) -> list[tuple[int, str, bool]]:
+    return [(step, "right" if step % 2 else "jump", step % 3 == 0) for step in range(count)]
+
+
+def test_shrinks_to_the_events_that_cause_the_failure():
+    needed = {(7, "right", False), (30, "jump", True)}
+    calls = []
+
+    def reproduces(events):
+        calls.append(len(events))
+        return needed.issubset(events)
+
+    assert sorted(shrink_events(_events(64), reproduces)) == sorted(needed)
+    assert len(calls) < 200
+
+
+def test_keeps_event_order():
+    def reproduces(events):
+        steps = [step for step, _, _ in events]
+        return 5 in steps and 40 in steps and 41 in steps
+
+    assert [step for step, _, _ in shrink_events(_events(50), reproduces)] == [5, 40, 41]
+
+
+def test_a_failure_without_inputs_shrinks_to_nothing():
+    assert shrink_events(_events(10), lambda events: True) == []
+
+
+def test_a_single_needed_event_is_kept():
+    assert shrink_events([(4, "jump", True)], lambda events: bool(events)) == [(4, "jump", True)]
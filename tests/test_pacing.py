@@ -0,0 +1,55 @@
+from pysnoopy.pacing import MAX_CONSECUTIVE_SKIPPED_DRAWS, DrawSkipPolicy, check_skip_policy, skipped_draws_on_fake_clock
+
+FRAME = 1 / 60
+
+
+def test_lightly_loaded_frames_never_skip():
+    assert skipped_draws_on_fake_clock(update_seconds=0.002, draw_seconds=0.001) == 0
+    assert skipped_draws_on_fake_clock(update_seconds=0.008, draw_seconds=0.008) == 0
+
+
+def test_overloaded_frames_skip_at_most_the_limit_in_a_row():
+    frames = 400
+    skipped = skipped_draws_on_fake_clock(update_seconds=0.012, draw_seconds=0.008, frames=frames)
+    assert skipped == frames * MAX_CONSECUTIVE_SKIPPED_DRAWS // (MAX_CONSECUTIVE_SKIPPED_DRAWS + 1)
+
+
+def test_idle_time_between_frames_does_not_count():
+    now = 0.0
+    policy = DrawSkipPolicy(FRAME, clock=lambda: now)
+    policy.last_draw_seconds = 0.004
+    now = 10.0  # a long wait in the event loop before this frame
+    policy.time_update(lambda: None)
+    assert not policy.should_skip_draw()
+
+
+def test_update_work_accumulates_until_the_next_draw():
+    now = 0.0
+
+    def work():
+        nonlocal now
+        now += 0.006
+
+    policy = DrawSkipPolicy(FRAME, clock=lambda: now)
+    for _ in range(3):
+        policy.time_update(work)
+    assert policy.should_skip_draw()
+    assert not policy.time_draw(work)
+    assert policy.update_seconds == 0.0
+    assert not policy.should_skip_draw()
+
+
+def test_disabled_policy_always_draws():
+    now = 0.0
+
+    def work():
+        nonlocal now
+        now += 1.0
+
+    policy = DrawSkipPolicy(FRAME, enabled=False, clock=lambda: now)
+    policy.time_update(work)
+    assert policy.time_draw(work)
+
+
+def test_self_check_passes():
+    assert check_skip_policy() == []
@@ -0,0 +1,44 @@
+import random
+from array import array
+
+from pysnoopy.replay import first_divergence
+from pysnoopy.snapshots import rolling_state_hash
+
+
+def _hash_chain(records: list[list[float]]) -> list[int]:
+    chain = []
+    previous = 0
+    for record in records:
+        previous = rolling_state_hash(array("d", record), previous)
+        chain.append(previous)
+    return chain
+
+
+def _records(count: int, seed: int = 5) -> list[list[float]]:
+    rng = random.Random(seed)
+    return [[rng.uniform(-100.0, 100.0) for _ in range(8)] for _ in range(count)]
+
+
+def test_finds_the_first_changed_record_at_every_position():
+    records = _records(200)
+    expected = _hash_chain(records)
+    for changed in range(len(records)):
+        diverged = [list(record) for record in records]
+        diverged[changed][3] += 1e-9
+        assert first_divergence(expected, _hash_chain(diverged)) == changed
+
+
+def test_equal_chains_and_prefixes_do_not_diverge():
+    chain = _hash_chain(_records(50))
+    assert first_divergence(chain, list(chain)) is None
+    assert first_divergence(chain, chain[:20]) is None
+    assert first_divergence(chain[:20], chain) is None
+    assert first_divergence([], chain) is None
+
+
+def test_a_longer_run_that_diverged_inside_the_shorter_one_is_found():
+    records = _records(100)
+    expected = _hash_chain(records)
+    records[40][0] = -records[40][0]
+    actual = _hash_chain(records + _records(30, seed=9))
+    assert first_divergence(expected, actual) == 40
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from pysnoopy.timeline import periodic_phase, scheduled_position, wrap_schedule, wrapped_position
+
+
+def _stepped_position(start: float, velocity: float, low: float, high: float, steps: int, wrap_on_equal: bool) -> float:
+    """Move one step at a time, wrapping on the step the lane end is passed.
+
+    The position is the lane origin plus ``velocity`` times the steps since
+    that origin, as the hazards compute it, so no rounding accumulates.
+    """
+    origin = start
+    moved = 0
+    for _ in range(steps):
+        moved += 1
+        position = origin + (velocity * moved)
+        if velocity > 0 and (position >= high if wrap_on_equal else position > high):
+            origin, moved = low, 0
+        elif velocity < 0 and (position <= low if wrap_on_equal else position < low):
+            origin, moved = high, 0
+    return origin + (velocity * moved)
+
+
+LANES = [
+    (100.0, 3.0, 0.0, 640.0),
+    (640.0, -3.0, 0.0, 640.0),
+    (0.0, 0.1, 0.0, 1.0),
+    (-49.99999999999997, 2.5, -50.0, 50.0),
+    (300.0, -1.7, -50.0, 300.0),
+    (10.0, 7.0, 10.0, 24.0),  # the lane is a whole number of steps long
+    (999.0, 4.0, 0.0, 1000.0),  # starts just before the end
+]
+
+
+@pytest.mark.parametrize("wrap_on_equal", [False, True])
+@pytest.mark.parametrize("start, velocity, low, high", LANES)
+def test_wrapped_position_matches_stepping(start, velocity, low, high, wrap_on_equal):
+    for steps in range(600):
+        expected = _stepped_position(start, velocity, low, high, steps, wrap_on_equal)
+        assert wrapped_position(start, velocity, low, high, steps, wrap_on_equal=wrap_on_equal) == expected, steps
+
+
+def test_wrapped_position_matches_stepping_for_random_lanes():
+    rng = random.Random(11)
+    for _ in range(200):
+        low = rng.uniform(-500.0, 500.0)
+        high = low + rng.uniform(1.0, 900.0)
+        velocity = rng.choice([-1, 1]) * rng.uniform(0.05, 20.0)
+        start = rng.uniform(low, high)
+        steps = rng.randint(0, 3000)
+        expected = _stepped_position(start, velocity, low, high, steps, False)
+        assert wrapped_position(start, velocity, low, high, steps) == expected
+
+
+def test_scheduled_position_reuses_the_schedule():
+    start, velocity, low, high = 33.0, -2.25, -100.0, 120.0
+    first_wrap, period = wrap_schedule(start, velocity, low, high)
+    for steps in (0, 1, first_wrap - 1, first_wrap, first_wrap + period, 5000):
+        assert scheduled_position(start, velocity, low, high, steps, first_wrap, period) == wrapped_position(
+            start, velocity, low, high, steps
+        )
+
+
+def test_standing_still_or_no_steps_keeps_the_start():
+    assert wrapped_position(5.0, 0.0, 0.0, 10.0, 100) == 5.0
+    assert wrapped_position(5.0, 3.0, 0.0, 10.0, 0) == 5.0
+
+
+def test_periodic_phase_wraps_into_the_period():
+    assert periodic_phase(0.5, 2.0, 1.0) == pytest.approx(0.5)
+    assert 0.0 <= periodic_phase(-0.25, 0.0, 1.0) < 1.0
@@ -0,0 +1,156 @@
+import math
+import random
+import struct
+from array import array
+
+import pytest
+
+from pysnoopy.trace import FOOTER_MAGIC, TraceReader, TraceWriter, is_trace_file
+
+ACTIONS = ("left", "right", "jump")
+MARKER_KINDS = ("death", "level_clear")
+
+
+def _same_double(first: float, second: float) -> bool:
+    return struct.pack("<d", first) == struct.pack("<d", second)
+
+
+def _steps(count: int, seed: int = 7) -> list[tuple[list, int | None, list[float] | None, list]]:
+    """Step entries with special floats, record lengths that change and more events than the flags byte holds."""
+    rng = random.Random(seed)
+    special = [math.nan, -0.0, 0.0, math.inf, -math.inf, 5e-324, 1.0 / 3.0]
+    steps = []
+    for step in range(count):
+        length = 4 if step < count // 2 else 6
+        state = [rng.choice(special) if rng.random() < 0.3 else float(rng.randint(-3, 3)) for _ in range(length)]
+        if step % 5 == 3:
+            state = None
+        # 15 and more events do not fit the flags byte and take the escape.
+        event_count = {11: 20, 12: 15, 13: 14}.get(step, rng.randint(0, 3))
+        events = [(rng.choice(ACTIONS), rng.random() < 0.5) for _ in range(event_count)]
+        markers = [("death", "obstacle"), ("level_clear", "Level 1 ☃")] if step % 9 == 4 else []
+        state_hash = None if step % 7 == 6 else rng.getrandbits(32)
+        steps.append((events, state_hash, state, markers))
+    return steps
+
+
+def _write(path, steps, keyframe_interval: int = 8, sample_interval: int = 1, close: bool = True) -> None:
+    writer = TraceWriter(
+        path,
+        {"kind": "test"},
+        ACTIONS,
+        keyframe_interval=keyframe_interval,
+        sample_interval=sample_interval,
+        marker_kinds=MARKER_KINDS,
+    )
+    for events, state_hash, state, markers in steps:
+        writer.write_step(events, state_hash, state, markers)
+    writer.close()
+
+
+def _assert_entry(entry, step: int, expected) -> None:
+    events, state_hash, state, markers = expected
+    assert entry.step == step
+    assert entry.events == events
+    assert entry.state_hash == state_hash
+    assert entry.markers == markers
+    if state is None:
+        assert entry.state is None
+    else:
+        assert entry.state is not None
+        assert len(entry.state) == len(state)
+        assert all(_same_double(value, wanted) for value, wanted in zip(entry.state, state))
+
+
+def test_round_trip_keeps_every_field(tmp_path):
+    steps = _steps(60)
+    path = tmp_path / "run.sntrace"
+    _write(path, steps)
+
+    assert is_trace_file(path)
+    with TraceReader(path) as reader:
+        assert len(reader) == len(steps)
+        assert reader.metadata["kind"] == "test"
+        # Steps without a state cannot be keyframes.
+        assert list(reader.keyframe_steps) == [
+            step for step in range(0, len(steps), 8) if steps[step][2] is not None
+        ]
+        for step, entry in enumerate(reader.iter_steps()):
+            _assert_entry(entry, step, steps[step])
+
+
+def test_read_step_seeks_from_the_nearest_keyframe(tmp_path):
+    steps = _steps(60)
+    path = tmp_path / "run.sntrace"
+    _write(path, steps, keyframe_interval=8)
+
+    with TraceReader(path) as reader:
+        for step in random.Random(3).sample(range(len(steps)), 25) + [0, len(steps) - 1]:
+            _assert_entry(reader.read_step(step), step, steps[step])
+        with pytest.raises(IndexError):
+            reader.read_step(len(steps))
+
+
+def test_sample_interval_only_stores_due_states(tmp_path):
+    steps = [([], None, [float(step), -0.0], []) for step in range(20)]
+    path = tmp_path / "sparse.sntrace"
+    _write(path, steps, keyframe_interval=10, sample_interval=3)
+
+    with TraceReader(path) as reader:
+        stored = [entry.step for entry in reader.iter_steps() if entry.state is not None]
+        assert stored == [step for step in range(20) if step % 3 == 0 or step % 10 == 0]
+        assert list(reader.read_step(18).state) == [18.0, -0.0]
+
+
+def test_unclosed_trace_is_read_up_to_its_last_complete_entry(tmp_path):
+    steps = _steps(40)
+    closed_path = tmp_path / "closed.sntrace"
+    _write(closed_path, steps)
+    data = closed_path.read_bytes()
+    assert data.endswith(FOOTER_MAGIC)
+
+    with TraceReader(closed_path) as reader:
+        keyframe_steps = list(reader.keyframe_steps)
+    # A crashed writer leaves no index or footer and possibly half an entry.
+    index_offset, keyframe_count, _, _ = struct.unpack_from("<QQQ8s", data, len(data) - 32)
+    assert len(data) == index_offset + 16 * keyframe_count + 32
+    crashed_path = tmp_path / "crashed.sntrace"
+    crashed_path.write_bytes(data[:index_offset - 3])
+
+    with TraceReader(crashed_path) as reader:
+        assert len(reader) == len(steps) - 1
+        assert list(reader.keyframe_steps) == [step for step in keyframe_steps if step < len(steps) - 1]
+        for step, entry in enumerate(reader.iter_steps()):
+            _assert_entry(entry, step, steps[step])
+        _assert_entry(reader.read_step(len(steps) - 2), len(steps) - 2, steps[len(steps) - 2])
+
+
+def test_record_length_change_without_keyframe_decodes_against_zero(tmp_path):
+    steps = [([], 1, [1.5, 2.5], []), ([], 2, [1.5, 2.5, math.nan], []), ([], 3, [-0.0], [])]
+    path = tmp_path / "lengths.sntrace"
+    _write(path, steps, keyframe_interval=100)
+
+    with TraceReader(path) as reader:
+        for step, entry in enumerate(reader.iter_steps()):
+            _assert_entry(entry, step, steps[step])
+
+
+def test_rejects_files_that_are_not_traces(tmp_path):
+    empty = tmp_path / "empty.sntrace"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        TraceReader(empty)
+    other = tmp_path / "other.sntrace"
+    other.write_bytes(b"NOTATRACE" + bytes(32))
+    assert not is_trace_file(other)
+    with pytest.raises(ValueError):
+        TraceReader(other)
+
+
+def test_states_are_doubles(tmp_path):
+    path = tmp_path / "array.sntrace"
+    _write(path, [([], None, array("d", [0.1, 0.2]), [])])
+    with TraceReader(path) as reader:
+        state = reader.read_step(0).state
+    assert state.typecode == "d"
+    assert list(state) == [0.1, 0.2]